@@ -9,7 +9,9 @@ from gammapy.data import DataStore
 from gammapy.datasets import Datasets, FluxPointsDataset, MapDataset, SpectrumDataset
 from gammapy.estimators import FluxPointsEstimator
 from gammapy.makers import (
+    DatasetsMaker,
     FoVBackgroundMaker,
+    Maker,
     MapDatasetMaker,
     ReflectedRegionsBackgroundMaker,
     RingBackgroundMaker,
@@ -26,6 +28,31 @@ __all__ = ["Analysis"]
 log = logging.getLogger(__name__)
 
 
+class _SafeMaskOnOffMaker(Maker):
+    """Apply a safe mask maker only to datasets with OFF counts.
+
+    Datasets without OFF regions are discarded by the analysis, so the IRFs
+    are not read for them.
+
+    Parameters
+    ----------
+    safe_mask_maker : `~gammapy.makers.SafeMaskMaker`
+        Safe mask maker.
+    """
+
+    tag = "SafeMaskOnOffMaker"
+
+    def __init__(self, safe_mask_maker):
+        self.safe_mask_maker = safe_mask_maker
+
+    def run(self, dataset, observation):
+        """Apply the safe mask maker, if the dataset has OFF counts."""
+        if dataset.counts_off is None:
+            return dataset
+
+        return self.safe_mask_maker.run(dataset, observation)
+
+
 class Analysis:
     """Config-driven high-level analysis interface.
 
@@ -283,33 +310,24 @@ class Analysis:
 
         stacked = MapDataset.create(geom=geom, name="stacked", **geom_irf)
 
-        if datasets_settings.stack:
-            for obs in self.observations:
-                log.info(f"Processing observation {obs.obs_id}")
-                cutout = stacked.cutout(obs.pointing_radec, width=2 * offset_max)
-                dataset = maker.run(cutout, obs)
-                dataset = maker_safe_mask.run(dataset, obs)
-                if bkg_maker is not None:
-                    dataset = bkg_maker.run(dataset)
+        makers = [maker, maker_safe_mask]
+        if bkg_maker is not None:
+            makers.append(bkg_maker)
 
+        datasets_maker = DatasetsMaker(
+            makers, n_jobs=self.config.general.n_jobs, cutout_width=2 * offset_max
+        )
+        datasets = datasets_maker.iter_datasets(stacked, self.observations)
+
+        if datasets_settings.stack:
+            for dataset in datasets:
                 if bkg_method == "ring":
                     dataset = dataset.to_map_dataset()
 
-                log.debug(dataset)
                 stacked.stack(dataset)
             datasets = [stacked]
         else:
-            datasets = []
-
-            for obs in self.observations:
-                log.info(f"Processing observation {obs.obs_id}")
-                cutout = stacked.cutout(obs.pointing_radec, width=2 * offset_max)
-                dataset = maker.run(cutout, obs)
-                dataset = maker_safe_mask.run(dataset, obs)
-                if bkg_maker is not None:
-                    dataset = bkg_maker.run(dataset)
-                log.debug(dataset)
-                datasets.append(dataset)
+            datasets = list(datasets)
 
         self.datasets = Datasets(datasets)
 
@@ -362,27 +380,35 @@ class Analysis:
         geom = RegionGeom.create(region=on_region, axes=[e_reco])
         reference = SpectrumDataset.create(geom=geom, energy_axis_true=e_true)
 
+        # the safe mask is computed in the workers, but only for datasets
+        # that are not discarded for missing OFF regions
+        makers = [dataset_maker]
+        if bkg_maker is not None:
+            makers += [bkg_maker, _SafeMaskOnOffMaker(safe_mask_maker)]
+        else:
+            makers.append(safe_mask_maker)
+
+        datasets_maker = DatasetsMaker(makers, n_jobs=self.config.general.n_jobs)
+        reduced = datasets_maker.iter_datasets(reference, self.observations)
+
         datasets = []
-        for obs in self.observations:
-            log.info(f"Processing observation {obs.obs_id}")
-            dataset = dataset_maker.run(reference.copy(), obs)
-            if bkg_maker is not None:
-                dataset = bkg_maker.run(dataset, obs)
-                if dataset.counts_off is None:
-                    log.info(
-                        f"No OFF region found for observation {obs.obs_id}. Discarding."
-                    )
-                    continue
-            dataset = safe_mask_maker.run(dataset, obs)
-            log.debug(dataset)
-            datasets.append(dataset)
+        for obs, dataset in zip(self.observations, reduced):
+            if bkg_maker is not None and dataset.counts_off is None:
+                log.info(
+                    f"No OFF region found for observation {obs.obs_id}. Discarding."
+                )
+                continue
+
+            # stack on the fly, to not keep all datasets in memory
+            if datasets_settings.stack and datasets:
+                datasets[0].stack(dataset)
+            elif datasets_settings.stack:
+                datasets.append(dataset.copy(name="stacked"))
+            else:
+                datasets.append(dataset)
 
         self.datasets = Datasets(datasets)
 
-        if datasets_settings.stack:
-            stacked = self.datasets.stack_reduce(name="stacked")
-            self.datasets = Datasets([stacked])
-
     @staticmethod
     def _make_energy_axis(axis, name="energy"):
         return MapAxis.from_bounds(
@@ -353,6 +353,29 @@ def test_analysis_3d_joint_datasets():
     )
 
 
+@requires_data()
+def test_analysis_3d_parallel():
+    config = get_example_config("3d")
+    config.general.n_jobs = 2
+    analysis = Analysis(config)
+    analysis.get_observations()
+    analysis.get_datasets()
+
+    config.general.n_jobs = 1
+    analysis_serial = Analysis(config)
+    analysis_serial.get_observations()
+    analysis_serial.get_datasets()
+
+    assert len(analysis.datasets) == 1
+    assert_allclose(
+        analysis.datasets[0].counts.data, analysis_serial.datasets[0].counts.data
+    )
+    assert_allclose(
+        analysis.datasets[0].npred_background().data,
+        analysis_serial.datasets[0].npred_background().data,
+    )
+
+
 @requires_dependency("iminuit")
 @requires_data()
 def test_usage_errors():
@@ -58,6 +58,15 @@ def test_config_basics():
     assert config.general.outdir == "."
 
 
+def test_config_n_jobs():
+    config = AnalysisConfig()
+    assert config.general.n_jobs == 1
+
+    config = AnalysisConfig(**{"general": {"n_jobs": 4}})
+    assert config.general.n_jobs == 4
+    assert "n_jobs: 4" in config.to_yaml()
+
+
 def test_config_create_from_dict():
     data = {"general": {"log": {"level": "warning"}}}
     config = AnalysisConfig(**data)
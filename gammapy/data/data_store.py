@@ -2,6 +2,7 @@
 import logging
 import subprocess
 from pathlib import Path
+import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from gammapy.utils.scripts import make_path
@@ -197,36 +198,33 @@ class DataStore:
         observation : `~gammapy.data.Observation`
             Observation container
         """
-        if obs_id not in self.obs_table["OBS_ID"]:
+        self._validate_obs_id(obs_id)
+        idx = self.obs_table.get_obs_idx(obs_id)[0]
+        return self._make_observation(obs_id, self.obs_table[idx])
+
+    def _validate_obs_id(self, obs_id):
+        try:
+            self.obs_table.get_obs_idx(obs_id)
+        except KeyError:
             raise ValueError(f"OBS_ID = {obs_id} not in obs index table.")
 
-        if obs_id not in self.hdu_table["OBS_ID"]:
+        if not self.hdu_table.row_idx(obs_id=obs_id):
             raise ValueError(f"OBS_ID = {obs_id} not in HDU index table.")
 
-        row = self.obs_table.select_obs_id(obs_id=obs_id)[0]
-        obs_info = table_row_to_dict(row)
-
-        aeff_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="aeff")
-        edisp_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="edisp")
-        bkg_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="bkg")
-        psf_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="psf")
-        events_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="events")
-        gti_hdu = self.hdu_table.hdu_location(obs_id=obs_id, hdu_type="gti")
-
+    def _make_observation(self, obs_id, row):
         return Observation(
             obs_id=int(obs_id),
-            obs_info=obs_info,
-            bkg=bkg_hdu,
-            aeff=aeff_hdu,
-            edisp=edisp_hdu,
-            events=events_hdu,
-            gti=gti_hdu,
-            psf=psf_hdu,
+            obs_info=table_row_to_dict(row),
+            **self.hdu_table.hdu_locations(obs_id),
         )
 
     def get_observations(self, obs_id=None, skip_missing=False):
         """Generate a `~gammapy.data.Observations`.
 
+        The observation index rows are selected at once and the HDU index
+        rows of every observation are resolved with a single lookup for all
+        HDU types.
+
         Parameters
         ----------
         obs_id : list
@@ -242,10 +240,10 @@ class DataStore:
         if obs_id is None:
             obs_id = self.obs_table["OBS_ID"].data
 
-        obs_list = []
+        obs_id_valid = []
         for _ in obs_id:
             try:
-                obs = self.obs(_)
+                self._validate_obs_id(_)
             except ValueError as err:
                 if skip_missing:
                     log.warning(f"Skipping missing obs_id: {_!r}")
@@ -253,7 +251,14 @@ class DataStore:
                 else:
                     raise err
             else:
-                obs_list.append(obs)
+                obs_id_valid.append(_)
+
+        idx = np.array(self.obs_table.get_obs_idx(obs_id_valid), dtype=int)
+        rows = self.obs_table[idx]
+
+        obs_list = [
+            self._make_observation(_, row) for _, row in zip(obs_id_valid, rows)
+        ]
         return Observations(obs_list)
 
     def copy_obs(self, obs_id, outdir, hdu_class=None, verbose=False, overwrite=False):
@@ -73,7 +73,36 @@ class HDUIndexTable(Table):
         self._validate_selection(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
 
         idx = self.row_idx(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
+        return self._location_from_row_idx(idx, obs_id, hdu_type, hdu_class)
 
+    def hdu_locations(self, obs_id):
+        """Create `HDULocation` for all HDU types of a given observation.
+
+        The rows of the observation are looked up once and grouped by HDU
+        type, instead of one selection per HDU type.
+
+        Parameters
+        ----------
+        obs_id : int
+            Observation ID
+
+        Returns
+        -------
+        locations : dict of `~gammapy.data.HDULocation`
+            HDU locations by HDU type, ``None`` for missing HDU types.
+        """
+        rows = {}
+        for idx in self._row_idx_index.get((obs_id, None, None), []):
+            rows.setdefault(self._hdu_type_stripped[idx], []).append(idx)
+
+        return {
+            hdu_type: self._location_from_row_idx(
+                rows.get(hdu_type, []), obs_id, hdu_type=hdu_type
+            )
+            for hdu_type in self.VALID_HDU_TYPE
+        }
+
+    def _location_from_row_idx(self, idx, obs_id, hdu_type=None, hdu_class=None):
         if len(idx) == 1:
             idx = idx[0]
         elif len(idx) == 0:
@@ -109,7 +138,7 @@ class HDUIndexTable(Table):
                 f"Invalid hdu_class: {hdu_class}. Valid values are: {valid}"
             )
 
-        if obs_id not in self["OBS_ID"]:
+        if (obs_id, None, None) not in self._row_idx_index:
             raise IndexError(f"No entry available with OBS_ID = {obs_id}")
 
     def row_idx(self, obs_id, hdu_type=None, hdu_class=None):
@@ -129,37 +158,57 @@ class HDUIndexTable(Table):
         idx : list of int
             List of row indices matching the selection.
         """
-        selection = self["OBS_ID"] == obs_id
-
-        if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
-            selection &= is_hdu_class
-
-        if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
-            selection &= is_hdu_type
-
-        idx = np.where(selection)[0]
-        return list(idx)
+        key = (obs_id, hdu_type or None, hdu_class or None)
+        return list(self._row_idx_index.get(key, []))
 
     def location_info(self, idx):
         """Create `HDULocation` for a given row index."""
-        row = self[idx]
+        columns = self._location_columns
         return HDULocation(
-            hdu_class=row["HDU_CLASS"].strip(),
+            hdu_class=self._hdu_class_stripped[idx],
             base_dir=self.base_dir.as_posix(),
-            file_dir=row["FILE_DIR"].strip(),
-            file_name=row["FILE_NAME"].strip(),
-            hdu_name=row["HDU_NAME"].strip(),
+            file_dir=columns["FILE_DIR"][idx],
+            file_name=columns["FILE_NAME"][idx],
+            hdu_name=columns["HDU_NAME"][idx],
+        )
+
+    @lazyproperty
+    def _row_idx_index(self):
+        """Row indices by ``(obs_id, hdu_type, hdu_class)``.
+
+        Built in one pass over the table. Every row is registered with
+        ``None`` in place of the HDU type and / or class as well, so that
+        all selections supported by `row_idx` are a single dict lookup.
+        """
+        index = {}
+        rows = zip(
+            self["OBS_ID"].tolist(), self._hdu_type_stripped, self._hdu_class_stripped
         )
 
+        for idx, (obs_id, hdu_type, hdu_class) in enumerate(rows):
+            keys = [
+                (obs_id, None, None),
+                (obs_id, hdu_type, None),
+                (obs_id, None, hdu_class),
+                (obs_id, hdu_type, hdu_class),
+            ]
+            for key in keys:
+                index.setdefault(key, []).append(idx)
+
+        return index
+
+    @lazyproperty
+    def _location_columns(self):
+        names = ["FILE_DIR", "FILE_NAME", "HDU_NAME"]
+        return {name: [_.strip() for _ in self[name]] for name in names}
+
     @lazyproperty
     def _hdu_class_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_CLASS"]])
+        return [_.strip() for _ in self["HDU_CLASS"]]
 
     @lazyproperty
     def _hdu_type_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_TYPE"]])
+        return [_.strip() for _ in self["HDU_TYPE"]]
 
     @lazyproperty
     def obs_id_unique(self):
@@ -61,7 +61,7 @@ class ObservationTable(Table):
     def _index_dict(self):
         """Dict containing row index for all obs ids."""
         # TODO: Switch to http://docs.astropy.org/en/latest/table/indexing.html once it is more stable
-        temp = zip(self["OBS_ID"], np.arange(len(self)))
+        temp = zip(self["OBS_ID"].tolist(), range(len(self)))
         return dict(temp)
 
     def get_obs_idx(self, obs_id):
@@ -48,6 +48,43 @@ def test_hdu_index_table(hdu_index_table):
     assert hdu_index_table.summary().startswith("HDU index table")
 
 
+def test_hdu_index_table_row_idx():
+    rows = []
+    for obs_id in [1, 2]:
+        for hdu_type, hdu_class in [("events", "events"), ("psf", "psf_table ")]:
+            rows.append(
+                {
+                    "OBS_ID": obs_id,
+                    "HDU_TYPE": hdu_type,
+                    "HDU_CLASS": hdu_class,
+                    "FILE_DIR": "a",
+                    "FILE_NAME": f"run_{obs_id}.fits",
+                    "HDU_NAME": hdu_type.upper(),
+                }
+            )
+    table = HDUIndexTable(rows=rows)
+
+    assert table.row_idx(obs_id=2) == [2, 3]
+    assert table.row_idx(obs_id=2, hdu_type="psf") == [3]
+    assert table.row_idx(obs_id=1, hdu_class="psf_table") == [1]
+    assert table.row_idx(obs_id=1, hdu_type="psf", hdu_class="events") == []
+    assert table.row_idx(obs_id=3) == []
+
+    location = table.hdu_location(obs_id=2, hdu_class="psf_table")
+    assert location.file_name == "run_2.fits"
+    assert location.hdu_name == "PSF"
+    assert location.hdu_class == "psf_table"
+
+    with pytest.raises(IndexError):
+        table.hdu_location(obs_id=3, hdu_type="events")
+
+    locations = table.hdu_locations(obs_id=1)
+    assert list(locations) == HDUIndexTable.VALID_HDU_TYPE
+    assert locations["events"].hdu_name == "EVENTS"
+    assert locations["psf"].hdu_class == "psf_table"
+    assert locations["aeff"] is None
+
+
 @requires_data()
 def test_hdu_index_table_hd_hap(capfd):
     """Test HESS HAP-HD data access."""
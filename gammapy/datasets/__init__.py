@@ -2,6 +2,7 @@ from gammapy.utils.registry import Registry
 from .core import *
 from .flux_points import *
 from .map import *
+from .parallel import *
 from .simulate import *
 from .spectrum import *
 
@@ -15,5 +16,10 @@ __all__ = [
     "MapDatasetOnOff",
     "SpectrumDataset",
     "MapDatasetEventSampler",
+    "ObservationsEventSampler",
+    "STAT_SUM_BACKENDS",
+    "SerialStatSum",
+    "ThreadPoolStatSum",
+    "ProcessPoolStatSum",
 ]
 __all__.extend(cls.__name__ for cls in DATASET_REGISTRY)
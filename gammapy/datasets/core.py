@@ -7,9 +7,10 @@ import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
 from gammapy.data import GTI
-from gammapy.modeling.models import DatasetModels, Models
+from gammapy.modeling.models import DatasetModels, Model, Models
 from gammapy.utils.scripts import make_name, make_path, read_yaml, write_yaml
 from gammapy.utils.table import table_from_row_data
+from .parallel import STAT_SUM_BACKENDS
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +60,36 @@ class Dataset(abc.ABC):
 
         return np.sum(stat, dtype=np.float64)
 
+    def stat_sum_gradient(self, parameters):
+        """Gradient of the total statistic with respect to the parameter values.
+
+        Computed with central finite differences of `Dataset.stat_sum`. Sub-classes
+        can implement analytical derivatives.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the total statistic, one per parameter.
+        """
+        gradient = np.zeros(len(parameters))
+
+        if self.models is None:
+            return gradient
+
+        model_parameters = self.models.parameters
+
+        for idx, par in enumerate(parameters):
+            if par in model_parameters:
+                derivative = Model._derivative(self.stat_sum, par)
+                gradient[idx] = u.Quantity(derivative).to_value(1 / par.unit)
+
+        return gradient
+
     @abc.abstractmethod
     def stat_array(self):
         """Statistic array, one value per data point."""
@@ -102,13 +133,18 @@ class Datasets(collections.abc.MutableSequence):
     ----------
     datasets : `Dataset` or list of `Dataset`
         Datasets
+    stat_backend : {"serial", "threads", "processes"} or backend instance
+        Backend used to evaluate the joint likelihood, see `Datasets.stat_backend`.
+        By default the backend of the input `Datasets` is kept or "serial" is used.
     """
 
-    def __init__(self, datasets=None):
+    def __init__(self, datasets=None, stat_backend=None):
         if datasets is None:
             datasets = []
 
         if isinstance(datasets, Datasets):
+            if stat_backend is None:
+                stat_backend = datasets.stat_backend
             datasets = datasets._datasets
         elif isinstance(datasets, Dataset):
             datasets = [datasets]
@@ -122,6 +158,39 @@ class Datasets(collections.abc.MutableSequence):
             unique_names.append(dataset.name)
 
         self._datasets = datasets
+        self.stat_backend = stat_backend
+
+    @property
+    def stat_backend(self):
+        """Likelihood evaluation backend.
+
+        Available backends are listed in `~gammapy.datasets.STAT_SUM_BACKENDS`:
+
+        * "serial": evaluate the datasets one after the other (default)
+        * "threads": evaluate the datasets with a pool of threads
+        * "processes": evaluate the datasets with a persistent pool of processes,
+          each dataset being pinned to one worker process
+
+        Can be set with the backend name or a backend instance, e.g.
+        ``ProcessPoolStatSum(n_jobs=8)``. The thread and process pools are only
+        used within ``stat_backend.session(datasets)``, which is opened by the
+        `~gammapy.modeling.Fit` methods.
+        """
+        return self._stat_backend
+
+    @stat_backend.setter
+    def stat_backend(self, value):
+        if value is None:
+            value = "serial"
+
+        if isinstance(value, str):
+            if value not in STAT_SUM_BACKENDS:
+                raise ValueError(
+                    f"Invalid stat backend: {value!r}. Choose from {list(STAT_SUM_BACKENDS)}"
+                )
+            value = STAT_SUM_BACKENDS[value]()
+
+        self._stat_backend = value
 
     @property
     def parameters(self):
@@ -184,12 +253,26 @@ class Datasets(collections.abc.MutableSequence):
         return np.all([axes[0].is_aligned(ax) for ax in axes])
 
     def stat_sum(self):
-        """Compute joint likelihood"""
-        stat_sum = 0
-        # TODO: add parallel evaluation of likelihoods
-        for dataset in self:
-            stat_sum += dataset.stat_sum()
-        return stat_sum
+        """Compute joint likelihood, using the `Datasets.stat_backend`"""
+        return self.stat_backend.stat_sum(self)
+
+    def stat_sum_gradient(self, parameters=None):
+        """Gradient of the joint likelihood, using the `Datasets.stat_backend`
+
+        Parameters
+        ----------
+        parameters : `~gammapy.modeling.Parameters`
+            Parameters to compute the derivatives for. By default the free parameters.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the joint likelihood with respect to the parameter values.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        return self.stat_backend.stat_sum_gradient(self, parameters)
 
     def select_time(self, t_min, t_max, atol="1e-6 s"):
         """Select datasets in a given time interval.
@@ -345,7 +428,12 @@ class Datasets(collections.abc.MutableSequence):
         return datasets
 
     def write(
-        self, filename, filename_models=None, overwrite=False, write_covariance=True
+        self,
+        filename,
+        filename_models=None,
+        overwrite=False,
+        write_covariance=True,
+        format="fits",
     ):
         """Serialize datasets to YAML and FITS files.
 
@@ -359,6 +447,9 @@ class Datasets(collections.abc.MutableSequence):
             overwrite datasets FITS files
         write_covariance : bool
             save covariance or not
+        format : {"fits", "chunked"}
+            Dataset file format. With "chunked" every dataset is written to a
+            directory of chunked map stores, see `MapDataset.write`.
         """
         path = make_path(filename).resolve()
 
@@ -366,8 +457,16 @@ class Datasets(collections.abc.MutableSequence):
 
         for dataset in self._datasets:
             name = dataset.name.replace(" ", "_")
-            filename = f"{name}.fits"
-            dataset.write(path.parent / filename, overwrite=overwrite)
+
+            if format == "fits":
+                filename = f"{name}.fits"
+                dataset.write(path.parent / filename, overwrite=overwrite)
+            else:
+                filename = name
+                dataset.write(
+                    path.parent / filename, overwrite=overwrite, format=format
+                )
+
             data["datasets"].append(dataset.to_dict(filename=filename))
 
         write_yaml(data, path, sort_keys=False)
@@ -1,20 +1,26 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import contextlib
 import logging
 from functools import lru_cache
 import numpy as np
+import scipy.ndimage
 import astropy.units as u
 from astropy.io import fits
 from astropy.nddata.utils import NoOverlapError
 from astropy.table import Table
-from astropy.utils import lazyproperty
 from regions import CircleSkyRegion
 from gammapy.data import GTI
 from gammapy.irf import EDispKernel
 from gammapy.irf.edisp_map import EDispKernelMap, EDispMap
 from gammapy.irf.psf_kernel import PSFKernel
 from gammapy.irf.psf_map import PSFMap
-from gammapy.maps import Map, MapAxis, RegionGeom
-from gammapy.modeling.models import BackgroundModel, DatasetModels
+from gammapy.maps import Map, MapAxis, MapCoord, RegionGeom
+from gammapy.maps.chunked import read_hdulist_chunked, write_hdulist_chunked
+from gammapy.modeling.models import (
+    BackgroundModel,
+    DatasetModels,
+    PointSpatialModel,
+)
 from gammapy.stats import (
     CashCountsStatistic,
     WStatCountsStatistic,
@@ -24,6 +30,7 @@ from gammapy.stats import (
     wstat,
 )
 from gammapy.utils.fits import HDULocation, LazyFitsData
+from gammapy.utils.integrate import IntegrationPlan
 from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_name, make_path
 from gammapy.utils.table import hstack_columns
@@ -35,6 +42,7 @@ __all__ = ["MapDataset", "MapDatasetOnOff", "create_map_dataset_geoms"]
 log = logging.getLogger(__name__)
 
 CUTOUT_MARGIN = 0.1 * u.deg
+SUPPORT_MARGIN = 0.05 * u.deg
 RAD_MAX = 0.66
 RAD_AXIS_DEFAULT = MapAxis.from_bounds(
     0, RAD_MAX, nbin=66, node_type="edges", name="rad", unit="deg"
@@ -47,6 +55,9 @@ BINSZ_IRF_DEFAULT = 0.2
 
 EVALUATION_MODE = "local"
 USE_NPRED_CACHE = True
+NPRED_CACHE_RTOL = 0
+INTEGRATION_ORDER = 5
+SUPPORT_RTOL = 0
 
 
 def create_map_dataset_geoms(
@@ -291,6 +302,9 @@ class MapDataset(Dataset):
                     evaluation_mode=EVALUATION_MODE,
                     gti=self.gti,
                     use_cache=USE_NPRED_CACHE,
+                    cache_rtol=NPRED_CACHE_RTOL,
+                    integration_order=INTEGRATION_ORDER,
+                    support_rtol=SUPPORT_RTOL,
                 )
                 # TODO: do we need the update here?
                 evaluator.update(self.exposure, self.psf, self.edisp, self._geom)
@@ -368,10 +382,21 @@ class MapDataset(Dataset):
         npred_background : `Map`
             Predicted counts from the background.
         """
-        background = self.background
+        return self._apply_background_model(self.background)
+
+    def _apply_background_model(self, background, slices=None):
+        """Multiply a cutout or slice of the background map with the background model.
 
+        The background model only depends on energy, so it is evaluated on the
+        energy axis of the full background map and sliced along with it. This
+        avoids computing the full background cube for cutouts and slices.
+        """
         if self.background_model and background:
             values = self.background_model.evaluate_geom(geom=self.background.geom)
+
+            if slices is not None:
+                values = values[slices.get("energy", slice(None))]
+
             background = background * values
 
         return background
@@ -862,9 +887,17 @@ class MapDataset(Dataset):
 
         return ax_spatial, ax_spectral
 
-    @lazyproperty
+    @property
     def _counts_data(self):
-        return self.counts.data.astype(float)
+        # cached as long as the counts data array is not replaced
+        data = self.counts.data
+        cache = getattr(self, "_counts_data_cache", None)
+
+        if cache is None or cache[0] is not data:
+            cache = (data, data.astype(float))
+            self._counts_data_cache = cache
+
+        return cache[1]
 
     def stat_sum(self):
         """Total likelihood given the current model parameters."""
@@ -875,6 +908,54 @@ class MapDataset(Dataset):
         else:
             return cash_sum_cython(counts.ravel(), npred.ravel())
 
+    def stat_sum_gradient(self, parameters):
+        """Gradient of the total likelihood with respect to the parameter values.
+
+        The derivatives of the predicted counts are propagated analytically
+        through the exposure, PSF and energy dispersion, see
+        `MapEvaluator.compute_npred_gradient`.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the total likelihood, one per parameter.
+        """
+        counts, npred = self._counts_data, self.npred().data
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = np.where(npred > 0, 2 * (1 - counts / npred), 0)
+
+        if self.mask is not None:
+            weights *= self.mask.data
+
+        weights = Map.from_geom(self._geom, data=weights)
+        gradient = np.zeros(len(parameters))
+
+        for evaluator in self.evaluators.values():
+            if evaluator.contributes:
+                gradient += evaluator.compute_npred_gradient(weights, parameters)
+
+        background_model = self.background_model
+
+        if background_model and self.background:
+            geom = self.background.geom
+
+            def values():
+                return background_model.evaluate_geom(geom=geom)
+
+            for idx, par in enumerate(parameters):
+                if par in background_model.parameters:
+                    derivative = background_model._derivative(values, par)
+                    value = weights.data * self.background.data * derivative
+                    gradient[idx] += np.sum(value).to_value(1 / par.unit)
+
+        return gradient
+
     def fake(self, random_state="random-seed"):
         """Simulate fake counts for the current model and reduced IRFs.
 
@@ -891,6 +972,36 @@ class MapDataset(Dataset):
         npred.data = random_state.poisson(npred.data)
         self.counts = npred
 
+    def to_asimov(self, name=None):
+        """Create an Asimov dataset, with counts equal to the predicted counts.
+
+        The background is set to the predicted background of the current
+        models, so it is computed only once. The exposure, IRFs, masks and
+        GTI are shared with this dataset and not copied.
+
+        Parameters
+        ----------
+        name : str
+            Name of the Asimov dataset.
+
+        Returns
+        -------
+        dataset : `MapDataset`
+            Asimov dataset, without models.
+        """
+        return self.__class__(
+            counts=self.npred(),
+            exposure=self.exposure,
+            background=self.npred_background(),
+            psf=self.psf,
+            edisp=self.edisp,
+            mask_safe=self.mask_safe,
+            mask_fit=self.mask_fit,
+            gti=self.gti,
+            meta_table=self.meta_table,
+            name=name,
+        )
+
     def to_hdulist(self):
         """Convert map dataset to list of HDUs.
 
@@ -1029,7 +1140,7 @@ class MapDataset(Dataset):
 
         return cls(**kwargs)
 
-    def write(self, filename, overwrite=False):
+    def write(self, filename, overwrite=False, format="fits", chunks=None):
         """Write map dataset to file.
 
         Parameters
@@ -1038,11 +1149,25 @@ class MapDataset(Dataset):
             Filename to write to.
         overwrite : bool
             Overwrite file if it exists.
+        format : {"fits", "chunked"}
+            Output format. The "chunked" format writes a directory with one
+            `~gammapy.maps.ChunkedMapStore` per map, which supports reading
+            parts of the maps, see `~gammapy.maps.ChunkedMapStore`.
+        chunks : dict
+            Chunk shapes by lower case HDU name, e.g. "counts", for the
+            "chunked" format.
         """
-        self.to_hdulist().writeto(str(make_path(filename)), overwrite=overwrite)
+        if format == "fits":
+            self.to_hdulist().writeto(str(make_path(filename)), overwrite=overwrite)
+        elif format == "chunked":
+            write_hdulist_chunked(
+                self.to_hdulist(), filename, chunks=chunks, overwrite=overwrite
+            )
+        else:
+            raise ValueError(f"Invalid format: {format!r}")
 
     @classmethod
-    def _read_lazy(cls, name, filename, cache):
+    def _read_lazy(cls, name, filename, cache, memmap=False):
         kwargs = {"name": name}
         try:
             kwargs["gti"] = GTI.read(filename)
@@ -1057,6 +1182,7 @@ class MapDataset(Dataset):
                 file_name=path.name,
                 hdu_name=hdu_name.upper(),
                 cache=cache,
+                memmap=memmap,
             )
 
         kwargs["edisp"] = HDULocation(
@@ -1078,7 +1204,16 @@ class MapDataset(Dataset):
         return cls(**kwargs)
 
     @classmethod
-    def read(cls, filename, name=None, lazy=False, cache=True):
+    def read(
+        cls,
+        filename,
+        name=None,
+        lazy=False,
+        cache=True,
+        memmap=False,
+        slices=None,
+        cutout=None,
+    ):
         """Read map dataset from file.
 
         Parameters
@@ -1091,18 +1226,47 @@ class MapDataset(Dataset):
             Whether to lazy load data into memory
         cache : bool
             Whether to cache the data after loading.
+        memmap : bool
+            Whether to memory map the map data. Cutouts and slices of the
+            dataset then only read the parts of the file they need.
+        slices : dict
+            Dict of axes names and integers or `slice` object pairs, to read
+            only a slice of the dataset, see `MapDataset.slice_by_idx`. Only
+            supported for chunked directories.
+        cutout : dict
+            Cutout parameters ``position``, ``width`` and optionally
+            ``mode``, to read only a cutout of the dataset, see
+            `MapDataset.cutout`. Only supported for chunked directories.
 
         Returns
         -------
         dataset : `MapDataset`
             Map dataset.
+
+        Notes
+        -----
+        If ``filename`` is a directory written with ``format="chunked"``,
+        all maps are read from their chunked stores, ``lazy`` and ``memmap``
+        are ignored in this case. With ``slices`` or ``cutout`` only the
+        chunks overlapping with the requested part of every map are read.
         """
         name = make_name(name)
 
+        if make_path(filename).is_dir():
+            hdulist = read_hdulist_chunked(filename, slices=slices, cutout=cutout)
+            return cls.from_hdulist(hdulist, name=name)
+
+        if slices is not None or cutout is not None:
+            raise ValueError(
+                "Reading slices or cutouts is only supported for chunked directories."
+            )
+
         if lazy:
-            return cls._read_lazy(name=name, filename=filename, cache=cache)
+            return cls._read_lazy(
+                name=name, filename=filename, cache=cache, memmap=memmap
+            )
         else:
-            with fits.open(str(make_path(filename)), memmap=False) as hdulist:
+            with fits.open(str(make_path(filename)), memmap=memmap) as hdulist:
                 return cls.from_hdulist(hdulist, name=name)
 
     @classmethod
@@ -1332,7 +1496,8 @@ class MapDataset(Dataset):
             kwargs["exposure"] = self.exposure.cutout(**cutout_kwargs)
 
         if self.background is not None and self.stat_type == "cash":
-            kwargs["background"] = self.npred_background().cutout(**cutout_kwargs)
+            background = self.background.cutout(**cutout_kwargs)
+            kwargs["background"] = self._apply_background_model(background)
 
         if self.edisp is not None:
             kwargs["edisp"] = self.edisp.cutout(**cutout_kwargs)
@@ -1493,7 +1658,10 @@ class MapDataset(Dataset):
             kwargs["exposure"] = self.exposure.slice_by_idx(slices=slices)
 
         if self.background is not None and self.stat_type == "cash":
-            kwargs["background"] = self.npred_background().slice_by_idx(slices=slices)
+            background = self.background.slice_by_idx(slices=slices)
+            kwargs["background"] = self._apply_background_model(
+                background, slices=slices
+            )
 
         if self.edisp is not None:
             kwargs["edisp"] = self.edisp.slice_by_idx(slices=slices)
@@ -2011,6 +2179,21 @@ class MapDatasetOnOff(MapDataset):
         """Total likelihood given the current model parameters."""
         return Dataset.stat_sum(self)
 
+    def stat_sum_gradient(self, parameters):
+        """Gradient of the total likelihood with respect to the parameter values.
+
+        Computed with finite differences of `MapDatasetOnOff.stat_sum`, with the
+        npred caches disabled.
+        """
+        # make sure all evaluators exist before disabling their caches
+        self.npred_signal()
+
+        with contextlib.ExitStack() as stack:
+            for evaluator in self.evaluators.values():
+                stack.enter_context(evaluator._cache_disabled())
+
+            return Dataset.stat_sum_gradient(self, parameters)
+
     def fake(self, npred_background, random_state="random-seed"):
         """Simulate fake counts (on and off) for the current model and reduced IRFs.
 
@@ -2034,6 +2217,38 @@ class MapDatasetOnOff(MapDataset):
         npred_off.data = random_state.poisson(npred_off.data)
         self.counts_off = npred_off
 
+    def to_asimov(self, name=None):
+        """Create an Asimov dataset, with counts equal to the predicted counts.
+
+        The predicted background is given by the off counts, which are kept.
+        The exposure, IRFs, masks and GTI are shared with this dataset and
+        not copied.
+
+        Parameters
+        ----------
+        name : str
+            Name of the Asimov dataset.
+
+        Returns
+        -------
+        dataset : `MapDatasetOnOff`
+            Asimov dataset, without models.
+        """
+        return self.__class__(
+            counts=self.npred_signal() + self.background,
+            counts_off=self.counts_off,
+            acceptance=self.acceptance,
+            acceptance_off=self.acceptance_off,
+            exposure=self.exposure,
+            psf=self.psf,
+            edisp=self.edisp,
+            mask_safe=self.mask_safe,
+            mask_fit=self.mask_fit,
+            gti=self.gti,
+            meta_table=self.meta_table,
+            name=name,
+        )
+
     def to_hdulist(self):
         """Convert map dataset to list of HDUs.
 
@@ -2435,7 +2650,25 @@ class MapEvaluator:
         The "global" evaluation mode evaluates the model components on the full map.
         This mode is recommended for global optimization algorithms.
     use_cache : bool
-        Use npred caching.
+        Use npred caching. The spectral, spatial and temporal model components
+        are cached separately, so that e.g. a change of the spectral parameters
+        re-uses the PSF convolved spatial model.
+    cache_rtol : float
+        Relative tolerance of the parameter values to re-use cached
+        computations. By default any change triggers a re-computation.
+    integration_order : int
+        Number of Gauss-Legendre nodes per sub-interval used to integrate
+        spectral models without analytical integral, see
+        `~gammapy.utils.integrate.IntegrationPlan`.
+    support_rtol : float or None
+        Relative threshold defining the pixel support of the spatial model in
+        the "local" evaluation mode. The spatial model, the PSF convolution and
+        the exposure are only computed on the pixels where the model flux
+        exceeds ``support_rtol`` times its maximum, grown by ``SUPPORT_MARGIN``.
+        The support is re-computed when the model moves or grows by more than
+        the margin, or when the model reaches the border of the support. The
+        default of zero only skips pixels where the model is exactly zero, e.g.
+        outside of disks and shells. Use None to evaluate all pixels.
     """
 
     def __init__(
@@ -2447,6 +2680,9 @@ class MapEvaluator:
         gti=None,
         evaluation_mode="local",
         use_cache=True,
+        cache_rtol=0,
+        integration_order=5,
+        support_rtol=0,
     ):
 
         self.model = model
@@ -2456,6 +2692,11 @@ class MapEvaluator:
         self.gti = gti
         self.contributes = True
         self.use_cache = use_cache
+        self.cache_rtol = cache_rtol
+        self.integration_order = integration_order
+        self._integration_plan = None
+        self.support_rtol = support_rtol
+        self._support = None
 
         if evaluation_mode not in {"local", "global"}:
             raise ValueError(f"Invalid evaluation_mode: {evaluation_mode!r}")
@@ -2472,8 +2713,9 @@ class MapEvaluator:
             self._compute_npred_psf_after_edisp
         )
         self._compute_flux_spatial = lru_cache()(self._compute_flux_spatial)
-        self._cached_parameter_values = None
-        self._cached_parameter_values_spatial = None
+        self._compute_flux_spectral = lru_cache()(self._compute_flux_spectral)
+        self._compute_temporal_norm = lru_cache()(self._compute_temporal_norm)
+        self._cached_parameter_values = {}
 
     # workaround for the lru_cache pickle issue
     # see e.g. https://github.com/cloudpipe/cloudpickle/issues/178
@@ -2488,11 +2730,40 @@ class MapEvaluator:
 
     def __setstate__(self, state):
         for key, value in state.items():
-            if key in ["_compute_npred", "_compute_flux_spatial"]:
+            if key in self._cached_methods:
                 state[key] = lru_cache()(value)
 
         self.__dict__ = state
 
+    _cached_methods = [
+        "_compute_npred",
+        "_compute_npred_psf_after_edisp",
+        "_compute_flux_spatial",
+        "_compute_flux_spectral",
+        "_compute_temporal_norm",
+    ]
+
+    def _cache_clear(self):
+        for name in self._cached_methods:
+            getattr(self, name).cache_clear()
+
+    @contextlib.contextmanager
+    def _cache_disabled(self):
+        """Context manager disabling the npred caches, e.g. for finite differences.
+
+        With ``cache_rtol`` larger than the finite difference step, the cached
+        components would be re-used for the shifted parameter values. On exit
+        the caches are cleared, so that the next call re-computes npred.
+        """
+        use_cache = self.use_cache
+        self.use_cache = False
+        try:
+            yield
+        finally:
+            self.use_cache = use_cache
+            self._cache_clear()
+            self._cached_parameter_values.clear()
+
     @property
     def geom(self):
         """True energy map geometry (`~gammapy.maps.Geom`)"""
@@ -2569,9 +2840,8 @@ class MapEvaluator:
         else:
             self.exposure = exposure
 
-        self._compute_npred.cache_clear()
-        self._compute_flux_spatial.cache_clear()
-        self._compute_npred_psf_after_edisp.cache_clear()
+        self._support = None
+        self._cache_clear()
 
     def compute_dnde(self):
         """Compute model differential flux at map pixel centers.
@@ -2596,36 +2866,220 @@ class MapEvaluator:
             value = value * self.compute_flux_spatial().quantity
 
         if self.model.temporal_model:
-            value *= self.compute_temporal_norm()
+            value = value * self.compute_temporal_norm()
 
         return Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
 
     def _compute_flux_spatial(self):
         """Compute spatial flux"""
-        value = self.model.spatial_model.integrate_geom(self.geom)
+        support = self._get_support()
+
+        if support is None:
+            value = self.model.spatial_model.integrate_geom(self.geom)
+            if self.psf and self.model.apply_irf["psf"]:
+                value = self.apply_psf(value)
+            return value
+
+        value, at_border = self._integrate_support(support)
+
+        if at_border:
+            log.debug("Model reached the border of its support, re-computing it.")
+            self._support = support = self._compute_support()
+            value, _ = self._integrate_support(support)
+
         if self.psf and self.model.apply_irf["psf"]:
-            value = self.apply_psf(value)
+            value = self._apply_psf_support(value, support)
+
         return value
 
+    @property
+    def _use_support(self):
+        """Whether the model is evaluated on its pixel support only"""
+        model = self.model
+        return (
+            self.support_rtol is not None
+            and self.evaluation_mode == "local"
+            and model.spatial_model is not None
+            and model.evaluation_radius is not None
+            and not self.apply_psf_after_edisp
+            and not isinstance(self.geom, RegionGeom)
+        )
+
+    def _get_support(self):
+        """Get the pixel support, re-computed if the model moved or grew beyond the margin"""
+        if not self._use_support:
+            return None
+
+        support = self._support
+
+        if support is not None:
+            separation = support["position"].separation(self.model.position)
+            growth = np.abs(self.model.evaluation_radius - support["radius"])
+            if separation + growth > SUPPORT_MARGIN:
+                support = None
+
+        if support is None:
+            support = self._compute_support()
+            self._support = support
+
+        return support
+
+    def _compute_support(self):
+        """Compute the pixel support of the spatial model.
+
+        The support is given by the pixels with significant flux, grown by
+        ``SUPPORT_MARGIN``. The coordinates and solid angles of the support
+        pixels, as well as the image slices containing the PSF convolved
+        support are cached with it.
+        """
+        model = self.model.spatial_model
+        geom_image = self.geom.to_image()
+
+        flux = model.integrate_geom(self.geom).data
+        flux = flux.reshape((-1,) + geom_image.data_shape).max(axis=0)
+        mask = flux > self.support_rtol * np.max(flux)
+
+        if not mask.any():
+            mask[...] = True
+
+        # grow the support, to keep it valid while the model moves within the margin
+        radius = (SUPPORT_MARGIN / np.min(geom_image.pixel_scales)).to_value("")
+        n_pix = int(np.ceil(radius))
+        y, x = np.mgrid[-n_pix : n_pix + 1, -n_pix : n_pix + 1]
+        mask = scipy.ndimage.binary_dilation(mask, structure=x ** 2 + y ** 2 <= radius ** 2)
+
+        # pixels on the border of the support, the image border is excluded
+        interior = scipy.ndimage.binary_erosion(mask, border_value=1)
+        idx_y, idx_x = np.nonzero(mask)
+
+        lon, lat = geom_image.pix_to_coord((idx_x, idx_y))
+        coords = MapCoord.create({"lon": lon, "lat": lat}, frame=geom_image.frame)
+        coords = coords.to_frame(model.frame)
+
+        # the PSF convolved flux is contained in the support grown by the kernel size
+        if self.psf is not None and self.model.apply_irf["psf"]:
+            ny, nx = self.psf.psf_kernel_map.data.shape[-2:]
+            ny, nx = ny // 2 + 1, nx // 2 + 1
+        else:
+            ny, nx = 0, 0
+
+        slices = (
+            Ellipsis,
+            slice(max(idx_y.min() - ny, 0), idx_y.max() + ny + 1),
+            slice(max(idx_x.min() - nx, 0), idx_x.max() + nx + 1),
+        )
+
+        return {
+            "position": self.model.position,
+            "radius": self.model.evaluation_radius,
+            "idx": (idx_y, idx_x),
+            "border": ~interior[idx_y, idx_x],
+            "lon": coords.lon,
+            "lat": coords.lat,
+            "solid_angle": geom_image.solid_angle()[idx_y, idx_x],
+            "slices": slices,
+        }
+
+    def _integrate_support(self, support):
+        """Integrate the spatial model on the support pixels.
+
+        Returns the flux map and whether the model exceeds the threshold on
+        the border of the support.
+        """
+        model = self.model.spatial_model
+
+        if isinstance(model, PointSpatialModel):
+            # the pixel weights of point sources are cheap to compute
+            return model.integrate_geom(self.geom), False
+
+        if model.is_energy_dependent:
+            energy = self.geom.axes["energy_true"].center
+            values = model(support["lon"], support["lat"], energy[:, np.newaxis])
+        else:
+            values = model(support["lon"], support["lat"])
+
+        values = (values * support["solid_angle"]).to_value("")
+
+        data = np.zeros(self.geom.data_shape)
+        idx_y, idx_x = support["idx"]
+        data[..., idx_y, idx_x] = values
+
+        border = values[..., support["border"]]
+        at_border = border.size > 0 and np.max(border) > self.support_rtol * np.max(
+            values
+        )
+        return Map.from_geom(self.geom, data=data, unit=""), at_border
+
+    def _apply_psf_support(self, flux, support):
+        """Convolve flux with the PSF within the image slices of the support"""
+        slices = support["slices"]
+        data = np.zeros(self.geom.data_shape, dtype=np.float32)
+        data[slices] = self.psf.fftconvolve(flux.data[slices])
+        data[data < 0.0] = 0
+        return Map.from_geom(self.geom, data=data, unit=flux.unit)
+
+    def _apply_exposure_support(self, flux, support):
+        """Compute npred within the image slices of the support"""
+        slices = support["slices"]
+        npred = np.zeros(self.geom.data_shape)
+        npred[slices] = (flux.quantity[slices] * self.exposure.quantity[slices]).to_value(
+            ""
+        )
+        return Map.from_geom(self.geom, data=npred, unit="")
+
     def compute_flux_spatial(self):
         """Compute spatial flux using caching"""
         if self.parameters_spatial_changed or not self.use_cache:
             self._compute_flux_spatial.cache_clear()
         return self._compute_flux_spatial()
 
-    def compute_flux_spectral(self):
-        """Compute spectral flux"""
+    @property
+    def integration_plan(self):
+        """Integration plan of the true energy axis (`~gammapy.utils.integrate.IntegrationPlan`)"""
         energy = self.geom.axes["energy_true"].edges
-        value = self.model.spectral_model.integral(energy[:-1], energy[1:],)
+        plan = self._integration_plan
+
+        if (
+            plan is None
+            or plan.order != self.integration_order
+            or not plan.matches(energy)
+        ):
+            plan = IntegrationPlan(energy, order=self.integration_order)
+            self._integration_plan = plan
+
+        return plan
+
+    def _compute_flux_spectral(self):
+        """Compute spectral flux"""
+        spectral_model = self.model.spectral_model
+
+        if spectral_model.has_fast_integral:
+            energy = self.geom.axes["energy_true"].edges
+            value = spectral_model.integral(energy[:-1], energy[1:])
+        else:
+            value = self.integration_plan.integrate(spectral_model)
+
         return value.reshape((-1, 1, 1))
 
-    def compute_temporal_norm(self):
-        """Compute temporal norm """
+    def compute_flux_spectral(self):
+        """Compute spectral flux using caching"""
+        if self.parameters_spectral_changed or not self.use_cache:
+            self._compute_flux_spectral.cache_clear()
+        return self._compute_flux_spectral()
+
+    def _compute_temporal_norm(self):
+        """Compute temporal norm"""
         integral = self.model.temporal_model.integral(
             self.gti.time_start, self.gti.time_stop
         )
         return np.sum(integral)
 
+    def compute_temporal_norm(self):
+        """Compute temporal norm using caching"""
+        if self.parameters_temporal_changed or not self.use_cache:
+            self._compute_temporal_norm.cache_clear()
+        return self._compute_temporal_norm()
+
     def apply_exposure(self, flux):
         """Compute npred cube
 
@@ -2663,7 +3117,10 @@ class MapEvaluator:
             npred = self.compute_flux_psf_convolved()
 
             if self.model.apply_irf["exposure"]:
-                npred = self.apply_exposure(npred)
+                if self._use_support:
+                    npred = self._apply_exposure_support(npred, self._support)
+                else:
+                    npred = self.apply_exposure(npred)
 
             if self.model.apply_irf["edisp"]:
                 npred = self.apply_edisp(npred)
@@ -2713,28 +3170,193 @@ class MapEvaluator:
 
         return self._compute_npred()
 
-    @property
-    def parameters_changed(self):
-        """Parameters changed"""
-        values = self.model.parameters.values
+    def _cutout_weights(self, weights):
+        """Cut out weights defined on the dataset geometry to the evaluator geometry"""
+        if weights.geom.to_image() == self.geom.to_image():
+            return weights.data
+
+        slices = self.geom.cutout_info["parent-slices"]
+        parent_slices = Ellipsis, slices[0], slices[1]
+
+        slices = self.geom.cutout_info["cutout-slices"]
+        cutout_slices = Ellipsis, slices[0], slices[1]
+
+        shape = weights.data.shape[:1] + self.geom.data_shape[1:]
+        data = np.zeros(shape, dtype=weights.data.dtype)
+        data[cutout_slices] = weights.data[parent_slices]
+        return data
+
+    def _apply_psf_adjoint(self, value):
+        """Correlate cube with the PSF kernel, the adjoint of `MapEvaluator.apply_psf`"""
+        kernel_map = self.psf.psf_kernel_map
+        kernel = PSFKernel(kernel_map.copy(data=kernel_map.data[..., ::-1, ::-1]))
+        value = Map.from_geom(self.geom, data=value.value, unit=value.unit)
+        return value.convolve(kernel).quantity
+
+    def compute_npred_gradient(self, weights, parameters):
+        """Weighted sum of the derivatives of the predicted counts.
+
+        Computes ``sum(weights * d npred / d value)`` for every parameter. Instead of
+        evaluating npred for every parameter, the weights are back-projected once
+        through the energy dispersion, exposure and PSF, using their adjoint (transposed)
+        operations. The derivatives of the spectral, spatial and temporal model components
+        are then contracted with the back-projected weights.
+
+        The spectral and spatial derivatives are analytical if the models define
+        them, see `SpectralModel.integral_gradient` and
+        `SpatialModel.integrate_geom_gradient`, and finite differences of the model
+        integrals otherwise. The temporal derivatives, and the npred derivatives of
+        background models and models with the PSF applied after the energy
+        dispersion, are computed with finite differences, bypassing the npred caches.
 
-        # TODO: possibly allow for a tolerance here?
-        changed = ~np.all(self._cached_parameter_values == values)
+        Parameters
+        ----------
+        weights : `~gammapy.maps.Map`
+            Weights in reco energy, defined on the dataset geometry, e.g.
+            the derivative of the fit statistic with respect to npred.
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Weighted sum of derivatives, one per parameter.
+        """
+        gradient = np.zeros(len(parameters))
+        model = self.model
+
+        if not self.contributes or not any(par in model.parameters for par in parameters):
+            return gradient
+
+        if isinstance(model, BackgroundModel) or self.apply_psf_after_edisp:
+            data = self._cutout_weights(weights)
+
+            def npred():
+                return self.compute_npred().quantity
+
+            with self._cache_disabled():
+                for idx, par in enumerate(parameters):
+                    if par in model.parameters:
+                        derivative = model._derivative(npred, par)
+                        value = np.sum(data * derivative).to_value(1 / par.unit)
+                        gradient[idx] = value
+
+            return gradient
+
+        # back-projection of the weights to true energy and flux
+        data = self._cutout_weights(weights)
+
+        if model.apply_irf["edisp"] and self.edisp is not None:
+            data = np.tensordot(self.edisp.pdf_matrix, data, axes=(1, 0))
+
+        flux_spectral = self.compute_flux_spectral()
+        flux_spatial = u.Quantity(1)
+
+        if model.spatial_model and not isinstance(self.geom, RegionGeom):
+            flux_spatial = self.compute_flux_spatial().quantity
+
+        if model.apply_irf["exposure"]:
+            data = data * self.exposure.quantity
+            unit = u.Unit("")
+        else:
+            data = u.Quantity(data)
+            unit = flux_spectral.unit * flux_spatial.unit
+
+        norm_temporal = 1
+
+        if model.temporal_model:
+            norm_temporal = self.compute_temporal_norm()
+
+        spectral_parameters = model.spectral_model.parameters
+        pars = [par for par in parameters if par in spectral_parameters]
+
+        if pars:
+            energy = self.geom.axes["energy_true"].edges
+            values = np.sum(norm_temporal * flux_spatial * data, axis=(-2, -1))
+            derivatives = model.spectral_model.integral_gradient(
+                energy[:-1], energy[1:], parameters=pars
+            )
+
+            for par, derivative in zip(pars, derivatives):
+                value = np.sum(derivative * values).to_value(unit / par.unit)
+                gradient[parameters.index(par)] += value
+
+        if model.spatial_model and not isinstance(self.geom, RegionGeom):
+            spatial_parameters = model.spatial_model.parameters
+            pars = [par for par in parameters if par in spatial_parameters]
+
+            if pars:
+                values = norm_temporal * flux_spectral * data
+
+                if self.psf and model.apply_irf["psf"]:
+                    values = self._apply_psf_adjoint(values)
+
+                derivatives = model.spatial_model.integrate_geom_gradient(
+                    self.geom, parameters=pars
+                )
+
+                for par, derivative in zip(pars, derivatives):
+                    value = np.sum(derivative * values).to_value(unit / par.unit)
+                    gradient[parameters.index(par)] += value
+
+        if model.temporal_model:
+            temporal_parameters = model.temporal_model.parameters
+            pars = [par for par in parameters if par in temporal_parameters]
+
+            if pars:
+                value = np.sum(flux_spectral * flux_spatial * data).to_value(unit)
+
+                # bypass the cache, which could ignore steps below ``cache_rtol``
+                temporal_norm = self._compute_temporal_norm.__wrapped__
+
+                for par in pars:
+                    derivative = model._derivative(temporal_norm, par)
+                    value_par = u.Quantity(derivative * value).to_value(1 / par.unit)
+                    gradient[parameters.index(par)] += value_par
+
+        return gradient
+
+    def _parameters_changed(self, key, parameters):
+        """Check whether parameter values changed since the last call with the same key.
+
+        Every cached computation keeps its own copy of the parameter values it
+        depends on. Values within the relative tolerance ``cache_rtol`` are
+        considered unchanged.
+        """
+        values = parameters.values
+        cached = self._cached_parameter_values.get(key)
+
+        changed = (
+            cached is None
+            or cached.shape != values.shape
+            or not np.allclose(values, cached, rtol=self.cache_rtol, atol=0)
+        )
 
         if changed:
-            self._cached_parameter_values = values
+            self._cached_parameter_values[key] = values
 
         return changed
 
     @property
-    def parameters_spatial_changed(self):
+    def parameters_changed(self):
         """Parameters changed"""
-        values = self.model.spatial_model.parameters.values
+        return self._parameters_changed("model", self.model.parameters)
 
-        # TODO: possibly allow for a tolerance here?
-        changed = ~np.all(self._cached_parameter_values_spatial == values)
+    @property
+    def parameters_spectral_changed(self):
+        """Spectral parameters changed"""
+        return self._parameters_changed(
+            "spectral", self.model.spectral_model.parameters
+        )
 
-        if changed:
-            self._cached_parameter_values_spatial = values
+    @property
+    def parameters_spatial_changed(self):
+        """Spatial parameters changed"""
+        return self._parameters_changed("spatial", self.model.spatial_model.parameters)
 
-        return changed
+    @property
+    def parameters_temporal_changed(self):
+        """Temporal parameters changed"""
+        return self._parameters_changed(
+            "temporal", self.model.temporal_model.parameters
+        )
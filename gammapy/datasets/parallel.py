@@ -0,0 +1,303 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Execution backends for the joint likelihood of a `Datasets` collection."""
+import contextlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from gammapy.modeling import Parameters
+
+__all__ = [
+    "STAT_SUM_BACKENDS",
+    "ProcessPoolStatSum",
+    "SerialStatSum",
+    "ThreadPoolStatSum",
+]
+
+log = logging.getLogger(__name__)
+
+
+class SerialStatSum:
+    """Evaluate the joint likelihood dataset by dataset in the current process.
+
+    This is the default backend. It also defines the interface of all backends:
+    `session` is a context manager within which the backend is allowed to keep
+    state (threads, processes, copies of the datasets) and `stat_sum` computes
+    the total statistic given the current model parameters.
+    """
+
+    tag = "serial"
+
+    def __init__(self, n_jobs=None):
+        self.n_jobs = n_jobs
+        self._n_sessions = 0
+
+    @property
+    def is_open(self):
+        """Whether a session is currently open (bool)"""
+        return self._n_sessions > 0
+
+    def _open(self, datasets):
+        pass
+
+    def _close(self):
+        pass
+
+    @contextlib.contextmanager
+    def session(self, datasets):
+        """Context manager keeping the backend state alive.
+
+        Sessions can be nested, only the outermost one starts and stops
+        the backend.
+
+        Parameters
+        ----------
+        datasets : `Datasets`
+            Datasets to evaluate within the session.
+        """
+        if self._n_sessions == 0:
+            self._open(datasets)
+
+        self._n_sessions += 1
+
+        try:
+            yield self
+        finally:
+            self._n_sessions -= 1
+            if self._n_sessions == 0:
+                self._close()
+
+    def stat_sum(self, datasets):
+        """Compute joint likelihood
+
+        Parameters
+        ----------
+        datasets : `Datasets`
+            Datasets
+
+        Returns
+        -------
+        stat_sum : float
+            Total statistic
+        """
+        stat_sum = 0
+        for dataset in datasets:
+            stat_sum += dataset.stat_sum()
+        return stat_sum
+
+    def stat_sum_gradient(self, datasets, parameters):
+        """Compute gradient of the joint likelihood
+
+        Parameters
+        ----------
+        datasets : `Datasets`
+            Datasets
+        parameters : `~gammapy.modeling.Parameters`
+            Parameters to compute the derivatives for.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the joint likelihood with respect to the parameter values.
+        """
+        gradient = np.zeros(len(parameters))
+        for dataset in datasets:
+            gradient += dataset.stat_sum_gradient(parameters)
+        return gradient
+
+    def __getstate__(self):
+        # the backend state is never copied, copies start without session
+        return self.__class__(n_jobs=self.n_jobs).__dict__
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n_jobs={self.n_jobs!r})"
+
+
+class ThreadPoolStatSum(SerialStatSum):
+    """Evaluate the joint likelihood with a pool of threads.
+
+    The datasets are shared with the threads, so there is no copy and
+    no serialisation overhead. This is efficient when the evaluation
+    time is dominated by Numpy operations releasing the GIL.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of threads, by default the number of CPUs.
+    """
+
+    tag = "threads"
+
+    def __init__(self, n_jobs=None):
+        super().__init__(n_jobs=n_jobs)
+        self._executor = None
+
+    def _open(self, datasets):
+        self._executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+
+    def _close(self):
+        self._executor.shutdown()
+        self._executor = None
+
+    def stat_sum(self, datasets):
+        if self._executor is None:
+            return super().stat_sum(datasets)
+
+        stats = self._executor.map(lambda dataset: dataset.stat_sum(), datasets)
+        return sum(stats)
+
+    def stat_sum_gradient(self, datasets, parameters):
+        if self._executor is None:
+            return super().stat_sum_gradient(datasets, parameters)
+
+        gradients = self._executor.map(
+            lambda dataset: dataset.stat_sum_gradient(parameters), datasets
+        )
+        return np.sum(list(gradients), axis=0)
+
+
+def _stat_sum_worker(connection, datasets, indices):
+    """Worker loop of the `ProcessPoolStatSum` backend.
+
+    Receives parameter value vectors and sends back the scalar statistic
+    of the pinned datasets. If the message also contains the indices of
+    parameters, the gradient with respect to those is sent back instead.
+    A ``None`` message ends the loop.
+    """
+    parameters = datasets.parameters
+    positions = {idx: jdx for jdx, idx in enumerate(indices)}
+
+    while True:
+        message = connection.recv()
+
+        if message is None:
+            break
+
+        values, indices_gradient = message
+
+        try:
+            parameters.values = values[indices]
+
+            if indices_gradient is None:
+                result = datasets.stat_sum()
+            else:
+                local = [positions.get(idx) for idx in indices_gradient]
+                mask = np.array([_ is not None for _ in local], dtype=bool)
+                pars = Parameters([parameters[_] for _ in local if _ is not None])
+                result = np.zeros(len(indices_gradient))
+                result[mask] = datasets.stat_sum_gradient(pars)
+
+            connection.send(result)
+        except Exception as error:
+            connection.send(error)
+
+    connection.close()
+
+
+class ProcessPoolStatSum(SerialStatSum):
+    """Evaluate the joint likelihood with a persistent pool of processes.
+
+    When the session is opened, the datasets are distributed over ``n_jobs``
+    worker processes and sent there once. Each dataset stays pinned to
+    its worker for the lifetime of the session. For every evaluation only
+    the vector of parameter values is sent to the workers and only the
+    scalar statistic of each worker is sent back.
+
+    Changes to the datasets other than the parameter values (e.g. masks,
+    models or frozen datasets) are only visible to the workers after
+    re-opening the session.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of worker processes, by default the number of CPUs.
+    """
+
+    tag = "processes"
+
+    def __init__(self, n_jobs=None):
+        super().__init__(n_jobs=n_jobs)
+        self._workers = []
+        self._connections = []
+
+    @staticmethod
+    def _split_datasets(datasets, n_jobs):
+        """Split datasets into groups of balanced data size"""
+        sizes = [np.prod(getattr(_, "data_shape", 1)) for _ in datasets]
+        loads = np.zeros(n_jobs)
+        groups = [[] for _ in range(n_jobs)]
+
+        for idx in np.argsort(sizes)[::-1]:
+            jdx = np.argmin(loads)
+            groups[jdx].append(datasets[int(idx)])
+            loads[jdx] += sizes[idx]
+
+        return [group for group in groups if group]
+
+    def _open(self, datasets):
+        from .core import Datasets
+
+        n_jobs = min(self.n_jobs or os.cpu_count(), len(datasets))
+        parameters = datasets.parameters
+        context = multiprocessing.get_context()
+
+        for group in self._split_datasets(datasets, n_jobs):
+            group = Datasets(group)
+            indices = [parameters.index(par) for par in group.parameters]
+            connection, connection_worker = context.Pipe()
+            worker = context.Process(
+                target=_stat_sum_worker,
+                args=(connection_worker, group, indices),
+                daemon=True,
+            )
+            worker.start()
+            connection_worker.close()
+            self._workers.append(worker)
+            self._connections.append(connection)
+
+        log.info(f"Evaluating likelihood with {len(self._workers)} processes.")
+
+    def _close(self):
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+
+        for worker in self._workers:
+            worker.join()
+
+        self._workers, self._connections = [], []
+
+    def _evaluate(self, datasets, indices_gradient=None):
+        values = datasets.parameters.values
+
+        for connection in self._connections:
+            connection.send((values, indices_gradient))
+
+        results = [connection.recv() for connection in self._connections]
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        return results
+
+    def stat_sum(self, datasets):
+        if not self._workers:
+            return super().stat_sum(datasets)
+
+        return sum(self._evaluate(datasets))
+
+    def stat_sum_gradient(self, datasets, parameters):
+        if not self._workers:
+            return super().stat_sum_gradient(datasets, parameters)
+
+        pars = datasets.parameters
+        indices = [pars.index(par) for par in parameters]
+        return np.sum(self._evaluate(datasets, indices), axis=0)
+
+
+STAT_SUM_BACKENDS = {
+    cls.tag: cls for cls in [SerialStatSum, ThreadPoolStatSum, ProcessPoolStatSum]
+}
+"""Available likelihood evaluation backends of `Datasets`"""
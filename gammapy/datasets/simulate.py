@@ -1,16 +1,109 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Simulate observations"""
+import logging
+import os
+from functools import partial
 import numpy as np
 import astropy.units as u
 from astropy.coordinates import SkyCoord, SkyOffsetFrame
-from astropy.table import Table
+from astropy.io import fits
+from astropy.table import Table, vstack
 import gammapy
-from gammapy.data import EventList
+from gammapy.data import DataStore, EventList
 from gammapy.maps import MapCoord
 from gammapy.modeling.models import ConstantTemporalModel
-from gammapy.utils.random import get_random_state
+from gammapy.utils.parallel import imap_ordered
+from gammapy.utils.random import InverseCDFSampler, get_random_state
+from gammapy.utils.scripts import make_path
 
-__all__ = ["MapDatasetEventSampler"]
+__all__ = ["MapDatasetEventSampler", "ObservationsEventSampler"]
+
+log = logging.getLogger(__name__)
+
+
+class _EventsHDUWriter:
+    """Append event tables to the EVENTS HDU of a FITS file.
+
+    The HDU header is written with ``NAXIS2 = 0`` first and updated in place
+    once all rows are written, so only one chunk has to be held in memory.
+
+    Parameters
+    ----------
+    filename : `pathlib.Path`, str
+        Output filename.
+    meta : dict
+        Header keywords of the EVENTS HDU.
+    overwrite : bool
+        Overwrite existing file.
+    """
+
+    columns = [
+        ("EVENT_ID", ">i8", None),
+        ("TIME", ">f8", "s"),
+        ("RA", ">f8", "deg"),
+        ("DEC", ">f8", "deg"),
+        ("ENERGY", ">f8", "TeV"),
+        ("RA_TRUE", ">f8", "deg"),
+        ("DEC_TRUE", ">f8", "deg"),
+        ("ENERGY_TRUE", ">f8", "TeV"),
+        ("DETX", ">f8", "deg"),
+        ("DETY", ">f8", "deg"),
+        ("MC_ID", ">i4", None),
+    ]
+
+    def __init__(self, filename, meta, overwrite=False):
+        self.filename = make_path(filename)
+        self.dtype = np.dtype([(name, dtype) for name, dtype, _ in self.columns])
+
+        formats = {">i8": "K", ">i4": "J", ">f8": "D"}
+        columns = [
+            fits.Column(name=name, format=formats[dtype], unit=unit)
+            for name, dtype, unit in self.columns
+        ]
+        hdu = fits.BinTableHDU.from_columns(columns, nrows=0)
+        hdu.header.update(meta)
+        self.header = hdu.header
+        self.nrows = 0
+
+        fits.PrimaryHDU().writeto(self.filename, overwrite=overwrite)
+        self._file = open(self.filename, "r+b")
+        self._file.seek(0, os.SEEK_END)
+        self._header_offset = self._file.tell()
+        self._file.write(self.header.tostring().encode("ascii"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, table):
+        """Append rows of an event table."""
+        data = np.empty(len(table), dtype=self.dtype)
+
+        for name, _, unit in self.columns:
+            column = table[name]
+            if unit is not None and column.unit is not None:
+                data[name] = column.quantity.to_value(unit)
+            else:
+                data[name] = column
+
+        self._file.write(data.tobytes())
+        self.nrows += len(data)
+
+    def close(self):
+        """Pad the data and write the final number of rows to the header."""
+        if self._file.closed:
+            return
+
+        nbytes = self.nrows * self.dtype.itemsize
+        # FITS data units are padded to multiples of 2880 bytes
+        self._file.write(b"\0" * (-nbytes % 2880))
+
+        self.header["NAXIS2"] = self.nrows
+        self._file.seek(self._header_offset)
+        self._file.write(self.header.tostring().encode("ascii"))
+        self._file.close()
 
 
 class MapDatasetEventSampler:
@@ -23,6 +116,9 @@ class MapDatasetEventSampler:
         Passed to `~gammapy.utils.random.get_random_state`.
     """
 
+    # number of events sampled with one random state in `run_stream`
+    block_size = 10000
+
     def __init__(self, random_state="random-seed"):
         self.random_state = get_random_state(random_state)
 
@@ -30,6 +126,10 @@ class MapDatasetEventSampler:
         n_events = self.random_state.poisson(np.sum(npred.data))
 
         coords = npred.sample_coord(n_events=n_events, random_state=self.random_state)
+        return self._coord_time_table(coords, temporal_model, gti)
+
+    def _coord_time_table(self, coords, temporal_model, gti):
+        n_events = len(coords.lon)
 
         table = Table()
         try:
@@ -362,3 +462,308 @@ class MapDatasetEventSampler:
         geom = dataset._geom
         selection = geom.contains(events.map_coord(geom))
         return events.select_row_subset(selection)
+
+    def _sample_blocks(self, dataset, seed):
+        """Sample events in blocks of at most ``block_size`` events.
+
+        Each block is sampled with its own random state seeded from
+        ``(seed, mc_id, block_idx)``, so the events do not depend on how
+        the blocks are grouped when written.
+        """
+        components = []
+
+        if dataset.background:
+            components.append((0, dataset.npred_background(), None))
+
+        for idx, evaluator in enumerate(dataset.evaluators.values()):
+            npred = evaluator.apply_exposure(evaluator.compute_flux())
+            components.append((idx + 1, npred, evaluator.model.temporal_model))
+
+        for mc_id, npred, temporal_model in components:
+            random_state = np.random.RandomState([seed, mc_id])
+            n_events = random_state.poisson(np.sum(npred.data))
+
+            if temporal_model is None:
+                temporal_model = ConstantTemporalModel()
+
+            sampler = InverseCDFSampler(pdf=npred.data, random_state=random_state)
+            axes_names = ["lon", "lat"] + npred.geom.axes.names
+
+            for block_idx, start in enumerate(range(0, n_events, self.block_size)):
+                block_sampler = MapDatasetEventSampler(
+                    random_state=np.random.RandomState([seed, mc_id, block_idx])
+                )
+                sampler.random_state = block_sampler.random_state
+
+                n_block = min(self.block_size, n_events - start)
+                coords_pix = sampler.sample(n_block)
+                coords = npred.geom.pix_to_coord(coords_pix[::-1])
+                coords = MapCoord.create(
+                    dict(zip(axes_names, coords)), frame=npred.geom.frame
+                )
+
+                table = block_sampler._coord_time_table(
+                    coords, temporal_model, dataset.gti
+                )
+                table["MC_ID"] = mc_id
+                events = EventList(table)
+
+                if mc_id > 0 and dataset.psf:
+                    events = block_sampler.sample_psf(dataset.psf, events)
+                else:
+                    events.table["RA"] = events.table["RA_TRUE"]
+                    events.table["DEC"] = events.table["DEC_TRUE"]
+
+                if mc_id > 0 and dataset.edisp:
+                    events = block_sampler.sample_edisp(dataset.edisp, events)
+                else:
+                    events.table["ENERGY"] = events.table["ENERGY_TRUE"]
+
+                yield events
+
+    def run_stream(
+        self, dataset, observation, filename, chunk_size=100000, overwrite=False
+    ):
+        """Run the event sampler and write the events to a FITS file in chunks.
+
+        In contrast to `run` the event list is never held in memory as a
+        whole. Events are sampled in blocks of `block_size` events, each
+        with its own random state derived from ``random_state``, and
+        appended to the EVENTS HDU once ``chunk_size`` events are collected.
+        The result does not depend on ``chunk_size``.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset`
+            Map dataset
+        observation : `~gammapy.data.Observation`
+            In memory observation.
+        filename : `pathlib.Path`, str
+            Output filename.
+        chunk_size : int
+            Number of events written at once.
+        overwrite : bool
+            Overwrite existing file.
+
+        Returns
+        -------
+        n_events : int
+            Number of events written.
+        """
+        seed = self.random_state.randint(np.iinfo(np.int32).max)
+        meta = self.event_list_meta(dataset, observation)
+        geom = dataset._geom
+
+        with _EventsHDUWriter(filename, meta, overwrite=overwrite) as writer:
+            tables, n_buffered, event_id = [], 0, 0
+
+            for events in self._sample_blocks(dataset, seed):
+                events = self.event_det_coords(observation, events)
+                n_block = len(events.table)
+                events.table["EVENT_ID"] = event_id + np.arange(n_block)
+                event_id += n_block
+
+                selection = geom.contains(events.map_coord(geom))
+                tables.append(events.table[selection])
+                n_buffered += np.sum(selection)
+
+                if n_buffered >= chunk_size:
+                    writer.append(vstack(tables))
+                    tables, n_buffered = [], 0
+
+            if tables:
+                writer.append(vstack(tables))
+
+            n_events = writer.nrows
+
+        with fits.open(writer.filename, mode="append") as hdulist:
+            hdulist.append(fits.BinTableHDU(dataset.gti.table, name="GTI"))
+
+        return n_events
+
+
+class ObservationsEventSampler:
+    """Simulate event lists for many observations.
+
+    For every observation the reference dataset is reduced with
+    `~gammapy.makers.DatasetsMaker.make_dataset`, the models are set and the
+    events are sampled with `MapDatasetEventSampler.run_stream`. Every
+    observation gets its own random state, spawned from a
+    `~numpy.random.SeedSequence` with the root ``random_state`` by position
+    in the list of observations, so the simulated events are identical for
+    any number of processes.
+
+    Parameters
+    ----------
+    dataset : `~gammapy.datasets.MapDataset`
+        Reference dataset, defining the geometry.
+    makers : list of `~gammapy.makers.Maker`
+        Makers to reduce the observations, see `~gammapy.makers.DatasetsMaker`.
+    models : `~gammapy.modeling.models.Models`
+        Models to simulate. Background models have to be defined for the
+        name of the reference dataset.
+    random_state : int
+        Root seed of the random states. By default a random root seed is
+        used, which is available as ``seed_sequence.entropy``.
+    n_jobs : int
+        Number of processes. By default the observations are simulated in
+        the current process.
+    chunk_size : int
+        Number of events written at once, see
+        `MapDatasetEventSampler.run_stream`.
+    cutout_width : `~astropy.coordinates.Angle`
+        Width of the cutout around the pointing position. By default the
+        full reference dataset is used.
+    cutout_mode : {'trim', 'partial', 'strict'}
+        Cutout mode, see `~gammapy.datasets.MapDataset.cutout`.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        makers,
+        models,
+        random_state=None,
+        n_jobs=None,
+        chunk_size=100000,
+        cutout_width=None,
+        cutout_mode="trim",
+    ):
+        from gammapy.makers import DatasetsMaker
+
+        self.dataset = dataset
+        self.datasets_maker = DatasetsMaker(
+            makers, cutout_width=cutout_width, cutout_mode=cutout_mode
+        )
+        self.models = models
+        self.seed_sequence = np.random.SeedSequence(random_state)
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+
+    @property
+    def makers(self):
+        """Makers to reduce the observations (list)"""
+        return self.datasets_maker.makers
+
+    def make_dataset(self, observation):
+        """Reduce a single observation and set the models.
+
+        Parameters
+        ----------
+        observation : `~gammapy.data.Observation`
+            Observation
+
+        Returns
+        -------
+        dataset : `~gammapy.datasets.MapDataset`
+            Reduced dataset, with the name of the reference dataset.
+        """
+        dataset = self.datasets_maker.make_dataset(self.dataset, observation)
+        dataset = dataset.copy(name=self.dataset.name)
+        dataset.models = self.models
+        return dataset
+
+    def simulate_observation(self, observation, seed_sequence, path, overwrite=False):
+        """Simulate and write the events of a single observation.
+
+        Parameters
+        ----------
+        observation : `~gammapy.data.Observation`
+            Observation
+        seed_sequence : `~numpy.random.SeedSequence`
+            Seed sequence of the observation.
+        path : `pathlib.Path`
+            Output directory.
+        overwrite : bool
+            Overwrite existing files.
+
+        Returns
+        -------
+        filename : `pathlib.Path`
+            Filename of the event list.
+        """
+        log.info(f"Simulating observation {observation.obs_id}")
+        dataset = self.make_dataset(observation)
+
+        random_state = np.random.RandomState(np.random.MT19937(seed_sequence))
+        sampler = MapDatasetEventSampler(random_state=random_state)
+
+        filename = path / f"events_{observation.obs_id:06d}.fits"
+        sampler.run_stream(
+            dataset=dataset,
+            observation=observation,
+            filename=filename,
+            chunk_size=self.chunk_size,
+            overwrite=overwrite,
+        )
+        return filename
+
+    def iter_simulate(self, observations, path, overwrite=False):
+        """Simulate observations and yield the filenames in order.
+
+        Parameters
+        ----------
+        observations : `~gammapy.data.Observations`
+            Observations
+        path : `pathlib.Path`
+            Output directory.
+        overwrite : bool
+            Overwrite existing files.
+
+        Yields
+        ------
+        filename : `pathlib.Path`
+            Filename of the event list.
+        """
+        seed_sequences = self.seed_sequence.spawn(len(observations))
+
+        if self.n_jobs and self.n_jobs > 1:
+            log.info(f"Simulating observations with {self.n_jobs} processes.")
+
+        yield from imap_ordered(
+            partial(self.simulate_observation, path=path, overwrite=overwrite),
+            zip(observations, seed_sequences),
+            n_jobs=self.n_jobs,
+        )
+
+    def run(self, observations, path, overwrite=False):
+        """Simulate observations and write the event lists and index tables.
+
+        The HDU and observation index tables are written to ``path``, so that
+        the simulated data can be read with `~gammapy.data.DataStore.from_dir`.
+        As for `~gammapy.data.DataStore.from_events_files`, the IRFs are
+        referenced in the ``CALDB`` directory given by the event list header.
+
+        Parameters
+        ----------
+        observations : `~gammapy.data.Observations`
+            Observations
+        path : str or `pathlib.Path`
+            Output directory.
+        overwrite : bool
+            Overwrite existing files.
+
+        Returns
+        -------
+        data_store : `~gammapy.data.DataStore`
+            Data store of the simulated observations.
+        """
+        path = make_path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        filenames = list(self.iter_simulate(observations, path, overwrite))
+        data_store = DataStore.from_events_files(filenames)
+
+        # reference the event lists relative to the index files
+        hdu_table = data_store.hdu_table
+        is_local = np.isin(hdu_table["HDU_TYPE"], ["events", "gti"])
+        hdu_table["FILE_DIR"] = np.where(is_local, ".", hdu_table["FILE_DIR"])
+
+        obs_table = data_store.obs_table
+        obs_table["EVENTS_FILENAME"] = [
+            os.path.basename(name) for name in obs_table["EVENTS_FILENAME"]
+        ]
+
+        hdu_table.write(path / DataStore.DEFAULT_HDU_TABLE, overwrite=overwrite)
+        obs_table.write(path / DataStore.DEFAULT_OBS_TABLE, overwrite=overwrite)
+        return DataStore.from_dir(path)
@@ -65,3 +65,31 @@ def test_Datasets_mutation():
         dats.insert(0, dat)
     with pytest.raises(ValueError, match="Dataset names must be unique"):
         dats.extend(dats2)
+
+
+@pytest.mark.parametrize("stat_backend", ["serial", "threads", "processes"])
+def test_datasets_stat_backend(stat_backend):
+    dataset_1, dataset_2 = MyDataset(name="test-1"), MyDataset(name="test-2")
+    dataset_2._models = dataset_1.models
+    datasets = Datasets([dataset_1, dataset_2], stat_backend=stat_backend)
+    assert datasets.stat_backend.tag == stat_backend
+
+    backend = datasets.stat_backend
+    with backend.session(datasets):
+        assert backend.is_open
+        assert_allclose(datasets.stat_sum(), 14472200.0002)
+
+        datasets.parameters["x"].value = 3
+        assert_allclose(datasets.stat_sum(), 14472202.0)
+
+    assert not backend.is_open
+    assert_allclose(datasets.stat_sum(), 14472202.0)
+
+    # the backend is kept, but copies start without session
+    assert Datasets(datasets).stat_backend is backend
+    assert datasets.copy().stat_backend.tag == stat_backend
+
+
+def test_datasets_stat_backend_invalid():
+    with pytest.raises(ValueError):
+        Datasets([MyDataset()], stat_backend="gpu")
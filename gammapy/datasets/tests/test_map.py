@@ -22,11 +22,13 @@ from gammapy.modeling import Fit
 from gammapy.modeling.models import (
     FoVBackgroundModel,
     GaussianSpatialModel,
+    Model,
     Models,
     PointSpatialModel,
     PowerLawSpectralModel,
     SkyModel,
 )
+from gammapy.stats import AsimovCountsStatistic
 from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 
@@ -183,6 +185,29 @@ def test_fake(sky_model, geom, geom_etrue):
     assert_allclose(dataset.counts.data.sum(), 9723)
 
 
+@requires_data()
+def test_to_asimov(sky_model, geom, geom_etrue):
+    dataset = get_map_dataset(geom, geom_etrue)
+
+    bkg_model = FoVBackgroundModel(dataset_name=dataset.name)
+    bkg_model.spectral_model.norm.value = 1.5
+    dataset.models = [sky_model, bkg_model]
+
+    asimov = dataset.to_asimov(name="asimov")
+
+    assert asimov.name == "asimov"
+    assert asimov.models is None
+    assert asimov.exposure is dataset.exposure
+    assert asimov.psf is dataset.psf
+    assert_allclose(asimov.counts.data, dataset.npred().data)
+    assert_allclose(asimov.background.data, dataset.npred_background().data)
+
+    stat = AsimovCountsStatistic.from_dataset(asimov, [sky_model])
+    stat_null = asimov.stat_sum()
+    asimov.models = [sky_model]
+    assert_allclose(stat.ts(1), stat_null - asimov.stat_sum(), rtol=1e-5)
+
+
 @requires_data()
 def test_different_exposure_unit(sky_model, geom):
     energy_range_true = np.logspace(2, 4, 3)
@@ -441,6 +466,48 @@ def test_map_dataset_fits_io(tmp_path, sky_model, geom, geom_etrue):
         dataset.gti.time_sum.to_value("s"), dataset_new.gti.time_sum.to_value("s")
     )
 
+    dataset_mmap = MapDataset.read(tmp_path / "test.fits", memmap=True)
+    assert not dataset_mmap.counts.data.flags.owndata
+    assert_allclose(dataset.counts.data, dataset_mmap.counts.data)
+
+    position = dataset.counts.geom.center_skydir
+    cutout = dataset_new.cutout(position=position, width=1 * u.deg)
+    cutout_mmap = dataset_mmap.cutout(position=position, width=1 * u.deg)
+    assert_allclose(cutout.counts.data, cutout_mmap.counts.data)
+    assert_allclose(cutout.background.data, cutout_mmap.background.data)
+
+    dataset.write(tmp_path / "test-chunked", format="chunked")
+    dataset_chunked = MapDataset.read(tmp_path / "test-chunked")
+
+    assert dataset_chunked.mask.data.dtype == bool
+    assert dataset.counts.geom == dataset_chunked.counts.geom
+    assert_allclose(dataset.counts.data, dataset_chunked.counts.data)
+    assert_allclose(dataset.exposure.data, dataset_chunked.exposure.data)
+    assert_allclose(
+        dataset.npred_background().data, dataset_chunked.npred_background().data
+    )
+    assert_allclose(
+        dataset.edisp.edisp_map.data, dataset_chunked.edisp.edisp_map.data
+    )
+    assert_allclose(dataset.psf.psf_map.data, dataset_chunked.psf.psf_map.data)
+    assert_allclose(
+        dataset.gti.time_sum.to_value("s"), dataset_chunked.gti.time_sum.to_value("s")
+    )
+
+    cutout = {"position": position, "width": 1 * u.deg}
+    dataset_chunked = MapDataset.read(tmp_path / "test-chunked", cutout=cutout)
+    assert dataset_chunked.counts.geom == cutout_mmap.counts.geom
+    assert_allclose(dataset_chunked.counts.data, cutout_mmap.counts.data)
+    assert_allclose(dataset_chunked.psf.psf_map.data, cutout_mmap.psf.psf_map.data)
+
+    dataset_chunked = MapDataset.read(
+        tmp_path / "test-chunked", slices={"energy": slice(0, 1)}
+    )
+    assert dataset_chunked.counts.geom.axes["energy"].nbin == 1
+
+    with pytest.raises(ValueError):
+        MapDataset.read(tmp_path / "test.fits", cutout=cutout)
+
     # To test io of psf and edisp map
     stacked = MapDataset.create(geom)
     stacked.write(tmp_path / "test-2.fits", overwrite=True)
@@ -1296,6 +1363,92 @@ def test_slice_by_idx():
     assert_allclose(axis.edges[0].value, 0.210175, rtol=1e-5)
 
 
+def get_map_dataset_gauss_irfs(name="test"):
+    """MapDataset with Gaussian PSF and energy dispersion and a constant exposure"""
+    axis = MapAxis.from_energy_bounds("0.3 TeV", "10 TeV", nbin=4)
+    axis_true = MapAxis.from_energy_bounds(
+        "0.2 TeV", "20 TeV", nbin=8, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=0.05, width=(4, 4), frame="galactic", axes=[axis]
+    )
+
+    dataset = MapDataset.create(geom, energy_axis_true=axis_true, name=name)
+    dataset.exposure.data += 1e11
+    dataset.background.data += 0.2
+    dataset.mask_safe.data[...] = True
+    dataset.psf = PSFMap.from_gauss(axis_true, sigma=0.1 * u.deg)
+    dataset.edisp = EDispKernelMap.from_gauss(
+        energy_axis=axis, energy_axis_true=axis_true, sigma=0.2, bias=0
+    )
+
+    spatial_model = GaussianSpatialModel(
+        lon_0="0.2 deg", lat_0="0.1 deg", sigma="0.1 deg", frame="galactic"
+    )
+    spectral_model = PowerLawSpectralModel(
+        index=2.5, amplitude="1e-11 cm-2 s-1 TeV-1"
+    )
+    model = SkyModel(
+        spatial_model=spatial_model, spectral_model=spectral_model, name="source"
+    )
+    bkg_model = FoVBackgroundModel(dataset_name=name)
+    bkg_model.spectral_model.tilt.frozen = False
+    dataset.models = [model, bkg_model]
+    dataset.fake(random_state=0)
+    return dataset
+
+
+def test_map_dataset_stat_sum_gradient():
+    dataset = get_map_dataset_gauss_irfs()
+    dataset.models.parameters["index"].value = 2.2
+    dataset.models.parameters["lon_0"].value = 0.25
+
+    parameters = dataset.models.parameters.free_parameters
+    gradient = dataset.stat_sum_gradient(parameters)
+
+    for par, value in zip(parameters, gradient):
+        expected = Model._derivative(dataset.stat_sum, par, epsilon=1e-3)
+        assert_allclose(value, expected.to_value(1 / par.unit), rtol=1e-2)
+
+    assert_allclose(gradient[0], -16406.294, rtol=1e-4)
+    assert_allclose(gradient[2], 203514.02, rtol=1e-4)
+
+
+def test_map_dataset_on_off_stat_sum_gradient_cache_rtol():
+    dataset = get_map_dataset_gauss_irfs()
+    dataset = MapDatasetOnOff.from_map_dataset(
+        dataset, acceptance=1, acceptance_off=10.0
+    )
+    dataset.models = dataset.models["source"]
+
+    parameters = dataset.models.parameters.free_parameters
+    expected = dataset.stat_sum_gradient(parameters)
+
+    # the finite differences must not re-use the cached npred
+    for evaluator in dataset.evaluators.values():
+        evaluator.cache_rtol = 1e-2
+
+    gradient = dataset.stat_sum_gradient(parameters)
+    assert np.all(gradient != 0)
+    assert_allclose(gradient, expected, rtol=1e-6)
+
+
+def test_map_dataset_fit_gradient():
+    dataset = get_map_dataset_gauss_irfs()
+    dataset.models.parameters["index"].value = 2.2
+    dataset.models.parameters["lon_0"].value = 0.25
+
+    fit = Fit([dataset], use_gradient=True)
+    result = fit.optimize()
+
+    assert result.success
+    assert_allclose(result.total_stat, -306621.41, rtol=1e-6)
+
+    pars = result.parameters
+    assert_allclose(pars["index"].value, 2.505, rtol=1e-3)
+    assert_allclose(pars["lon_0"].value, 0.199785, rtol=1e-3)
+
+
 @requires_dependency("matplotlib")
 def test_plot_residual_onoff():
     axis = MapAxis.from_energy_bounds(1, 10, 2, unit="TeV")
@@ -7,15 +7,21 @@ from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.table import Table
 from astropy.time import Time
-from gammapy.data import GTI, DataStore, Observation
-from gammapy.datasets import MapDatasetEventSampler
+from gammapy.data import GTI, DataStore, EventList, Observation
+from gammapy.datasets import (
+    MapDataset,
+    MapDatasetEventSampler,
+    ObservationsEventSampler,
+)
 from gammapy.datasets.tests.test_map import get_map_dataset
 from gammapy.irf import load_cta_irfs
+from gammapy.makers import MapDatasetMaker
 from gammapy.maps import MapAxis, WcsGeom
 from gammapy.modeling.models import (
     FoVBackgroundModel,
     GaussianSpatialModel,
     LightCurveTemplateTemporalModel,
+    Models,
     PowerLawSpectralModel,
     SkyModel,
 )
@@ -346,3 +352,93 @@ def test_events_datastore(tmp_path, dataset):
     hdu_all.writeto(str(tmp_path / "events.fits"))
 
     DataStore.from_events_files([str(tmp_path / "events.fits")])
+
+
+@requires_data()
+def test_mde_run_stream(tmp_path, dataset):
+    irfs = load_cta_irfs(
+        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+    )
+    livetime = 1.0 * u.hr
+    pointing = SkyCoord(0, 0, unit="deg", frame="galactic")
+    obs = Observation.create(
+        obs_id=1001, pointing=pointing, livetime=livetime, irfs=irfs
+    )
+
+    sampler = MapDatasetEventSampler(random_state=0)
+    sampler.block_size = 100
+    n_events = sampler.run_stream(
+        dataset=dataset, observation=obs, filename=tmp_path / "events.fits"
+    )
+
+    sampler = MapDatasetEventSampler(random_state=0)
+    sampler.block_size = 100
+    sampler.run_stream(
+        dataset=dataset,
+        observation=obs,
+        filename=tmp_path / "events-chunked.fits",
+        chunk_size=150,
+    )
+
+    events = EventList.read(tmp_path / "events.fits")
+    events_chunked = EventList.read(tmp_path / "events-chunked.fits")
+
+    assert len(events.table) == n_events
+    assert events.table.meta["OBS_ID"] == 1001
+    assert events.table["ENERGY"].unit == "TeV"
+    assert set(events.table["MC_ID"]) <= {0, 1, 2}
+    assert_allclose(events.table["RA"], events_chunked.table["RA"])
+    assert_allclose(events.table["ENERGY"], events_chunked.table["ENERGY"])
+
+    gti = GTI.read(tmp_path / "events.fits")
+    assert_allclose(gti.time_sum.to_value("s"), dataset.gti.time_sum.to_value("s"))
+
+
+@requires_data()
+def test_observations_event_sampler(tmp_path):
+    irfs = load_cta_irfs(
+        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+    )
+    observations = [
+        Observation.create(
+            obs_id=obs_id,
+            pointing=SkyCoord(lon, 0, unit="deg", frame="galactic"),
+            livetime=0.5 * u.hr,
+            irfs=irfs,
+        )
+        for obs_id, lon in zip([1, 2, 3], [-0.5, 0, 0.5])
+    ]
+
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=0.2, width="3 deg", frame="galactic", axes=[energy_axis]
+    )
+    migra_axis = MapAxis.from_bounds(0.5, 2, nbin=30, node_type="edges", name="migra")
+    reference = MapDataset.create(geom, migra_axis=migra_axis, name="reference")
+
+    model = get_model()
+    model.temporal_model = None
+    models = Models([model, FoVBackgroundModel(dataset_name="reference")])
+    makers = [MapDatasetMaker(selection=["exposure", "background", "psf", "edisp"])]
+
+    serial = ObservationsEventSampler(reference, makers, models, random_state=42)
+    data_store = serial.run(observations, tmp_path / "serial")
+
+    parallel = ObservationsEventSampler(
+        reference, makers, models, random_state=42, n_jobs=2
+    )
+    parallel.run(observations, tmp_path / "parallel")
+
+    data_store_from_dir = DataStore.from_dir(tmp_path / "parallel")
+    assert_allclose(data_store.obs_table["OBS_ID"], [1, 2, 3])
+
+    for obs_id in [1, 2, 3]:
+        events = data_store.obs(obs_id).events
+        events_parallel = data_store_from_dir.obs(obs_id).events
+        assert len(events.table) > 0
+        assert_allclose(events.table["RA"], events_parallel.table["RA"])
+        assert_allclose(events.table["ENERGY"], events_parallel.table["ENERGY"])
+
+    time_1 = data_store.obs(1).events.table["TIME"]
+    time_2 = data_store.obs(2).events.table["TIME"]
+    assert time_1[0] != time_2[0]
@@ -1,7 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import copy
 import logging
+from functools import lru_cache
 import numpy as np
+import scipy.fftpack
 import astropy.units as u
 from astropy.convolution import Tophat2DKernel
 from astropy.coordinates import Angle
@@ -11,6 +13,12 @@ from gammapy.stats import CashCountsStatistic, WStatCountsStatistic
 from .core import Estimator
 from .utils import estimate_exposure_reco_energy
 
+try:
+    import scipy.fft as fft
+except ImportError:
+    # scipy < 1.4
+    import numpy.fft as fft
+
 __all__ = [
     "ExcessMapEstimator",
 ]
@@ -18,39 +26,87 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
-def convolved_map_dataset_counts_statistics(dataset, kernel, mask):
-    """Return CountsDataset objects containing smoothed maps from the MapDataset"""
-    # Kernel is modified later make a copy here
-    kernel = copy.deepcopy(kernel)
+def _get_fft_plan(kernel, shape):
+    """FFT of a 2D kernel, zero-padded for the convolution of images of given shape"""
+    starts = [(m - 1) // 2 for m in kernel.shape]
+
+    # cut-out of the full convolution, corresponding to "same" mode, see also
+    # `~gammapy.irf.PSFKernel.fftconvolve`
+    slices = tuple(slice(i, i + n) for i, n in zip(starts, shape))
+    shape_fft = tuple(
+        scipy.fftpack.next_fast_len(n + m - 1 - i)
+        for n, m, i in zip(shape, kernel.shape, starts)
+    )
+
+    kernel_fft = fft.rfftn(kernel, s=shape_fft)
+    kernel_fft.setflags(write=False)
+
+    return {
+        "kernel_fft": kernel_fft,
+        "shape_fft": shape_fft,
+        "slices": (Ellipsis,) + slices,
+    }
+
+
+@lru_cache(maxsize=32)
+def _get_tophat_fft_plan(radius, pixel_size, shape):
+    """FFT of the peak normalised tophat kernel.
+
+    Cached per correlation radius and pixel size, both in deg, and image shape.
+    """
+    kernel = Tophat2DKernel(radius / pixel_size)
     kernel.normalize("peak")
+    return _get_fft_plan(kernel.array, shape)
+
+
+def _fftconvolve_images(arrays, plan):
+    """Convolve arrays with the same kernel, using a single stacked FFT.
+
+    Equivalent to `scipy.signal.fftconvolve` with ``mode="same"`` applied to
+    all image planes of all arrays.
+    """
+    data = np.stack([np.asarray(_, dtype=float) for _ in arrays])
+
+    axes = (-2, -1)
+    data_fft = fft.rfftn(data, s=plan["shape_fft"], axes=axes)
+    data_fft *= plan["kernel_fft"]
+    convolved = fft.irfftn(data_fft, s=plan["shape_fft"], axes=axes)
+    return list(convolved[plan["slices"]])
+
 
-    # fft convolution adds numerical noise, to ensure integer results we call
-    # np.rint
+def _convolved_counts_statistics(dataset, plan, mask):
+    # all maps are convolved at once, fft convolution adds numerical noise,
+    # to ensure integer counts we call np.rint
     n_on = dataset.counts * mask
-    n_on_conv = np.rint(n_on.convolve(kernel.array).data)
 
     if isinstance(dataset, MapDatasetOnOff):
         background = dataset.background * mask
         background.data[dataset.acceptance_off.data == 0] = 0.0
         n_off = dataset.counts_off * mask
-
-        background_conv = background.convolve(kernel.array)
-        n_off_conv = n_off.convolve(kernel.array)
-
         npred_sig = dataset.npred_signal() * mask
-        mu_sig = npred_sig.convolve(kernel.array)
+
+        n_on_conv, background_conv, n_off_conv, mu_sig = _fftconvolve_images(
+            [n_on.data, background.data, n_off.data, npred_sig.data], plan
+        )
 
         with np.errstate(invalid="ignore", divide="ignore"):
             alpha_conv = background_conv / n_off_conv
 
-        return WStatCountsStatistic(
-            n_on_conv.data, n_off_conv.data, alpha_conv.data, mu_sig.data
-        )
+        return WStatCountsStatistic(np.rint(n_on_conv), n_off_conv, alpha_conv, mu_sig)
     else:
-
         npred = dataset.npred() * mask
-        background_conv = npred.convolve(kernel.array)
-        return CashCountsStatistic(n_on_conv.data, background_conv.data)
+        n_on_conv, background_conv = _fftconvolve_images([n_on.data, npred.data], plan)
+        return CashCountsStatistic(np.rint(n_on_conv), background_conv)
+
+
+def convolved_map_dataset_counts_statistics(dataset, kernel, mask):
+    """Return CountsDataset objects containing smoothed maps from the MapDataset"""
+    # Kernel is modified later make a copy here
+    kernel = copy.deepcopy(kernel)
+    kernel.normalize("peak")
+
+    plan = _get_fft_plan(kernel.array, dataset.counts.geom.data_shape[-2:])
+    return _convolved_counts_statistics(dataset, plan, mask)
 
 
 class ExcessMapEstimator(Estimator):
@@ -171,11 +227,14 @@ class ExcessMapEstimator(Estimator):
             Map dataset
         """
 
-        pixel_size = np.mean(np.abs(dataset.counts.geom.wcs.wcs.cdelt))
-        size = self.correlation_radius.deg / pixel_size
-        kernel = Tophat2DKernel(size)
-
         geom = dataset.counts.geom
+        pixel_size = np.mean(np.abs(geom.wcs.wcs.cdelt))
+
+        # the kernel FFT is re-used for all energy bands and datasets with
+        # the same image shape and pixel size
+        plan = _get_tophat_fft_plan(
+            self.correlation_radius.deg, pixel_size, geom.data_shape[-2:]
+        )
 
         if self.apply_mask_fit:
             mask = dataset.mask
@@ -184,7 +243,7 @@ class ExcessMapEstimator(Estimator):
         else:
             mask = np.ones(dataset.data_shape, dtype=bool)
 
-        counts_stat = convolved_map_dataset_counts_statistics(dataset, kernel, mask)
+        counts_stat = _convolved_counts_statistics(dataset, plan, mask)
 
         n_on = Map.from_geom(geom, data=counts_stat.n_on)
         bkg = Map.from_geom(geom, data=counts_stat.n_on - counts_stat.n_sig)
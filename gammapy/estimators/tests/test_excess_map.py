@@ -219,3 +219,26 @@ def test_incorrect_selection():
 def test_significance_map_estimator_incorrect_dataset():
     with pytest.raises(ValueError):
         ExcessMapEstimator("bad")
+
+
+def test_fftconvolve_images():
+    from scipy.signal import fftconvolve
+    from astropy.convolution import Tophat2DKernel
+    from gammapy.estimators.excess_map import (
+        _fftconvolve_images,
+        _get_tophat_fft_plan,
+    )
+
+    random_state = np.random.RandomState(0)
+    images = [random_state.poisson(2, (2, 20, 31)), random_state.rand(2, 20, 31)]
+
+    plan = _get_tophat_fft_plan(0.1, 0.02, (20, 31))
+    assert _get_tophat_fft_plan(0.1, 0.02, (20, 31)) is plan
+
+    kernel = Tophat2DKernel(5)
+    kernel.normalize("peak")
+
+    for actual, image in zip(_fftconvolve_images(images, plan), images):
+        for idx in range(2):
+            expected = fftconvolve(image[idx], kernel.array, mode="same")
+            assert_allclose(actual[idx], expected, atol=1e-10)
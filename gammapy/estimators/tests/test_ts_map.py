@@ -239,3 +239,32 @@ def test_ts_map_with_model(fake_dataset):
     maps = estimator.run(fake_dataset)
     assert_allclose(maps["sqrt_ts"].data[:, 25, 25], 0.323, atol=0.1)
     assert_allclose(maps["flux"].data[:, 25, 25], 1.015417e-12, atol=1e-12)
+
+
+def test_ts_map_vectorized(fake_dataset):
+    model = fake_dataset.models["source"]
+    dataset = fake_dataset.copy()
+    dataset.models = []
+
+    kwargs = dict(
+        model=model, kernel_width="0.3 deg", energy_edges=[200, 3500] * u.GeV
+    )
+    estimator_ref = TSMapEstimator(method="brentq", **kwargs)
+    estimator = TSMapEstimator(method="vectorized", chunk_size=1e4, **kwargs)
+
+    maps_ref = estimator_ref.run(dataset)
+    maps = estimator.run(dataset)
+
+    assert_allclose(maps["sqrt_ts"].data[:, 25, 25], 18.369942, rtol=1e-3)
+    assert_allclose(maps["flux"].data[:, 25, 25], 3.513e-10, rtol=1e-2)
+    assert_allclose(maps["niter"].data[:, 25, 25], 2)
+
+    assert_allclose(maps["ts"].data, maps_ref["ts"].data, atol=1e-2)
+
+    for name in ["flux", "flux_err", "flux_errp", "flux_errn", "flux_ul"]:
+        assert_allclose(maps[name].data, maps_ref[name].data, atol=2e-12)
+
+
+def test_ts_map_invalid_method():
+    with pytest.raises(ValueError):
+        TSMapEstimator(method="newton")
@@ -97,7 +97,16 @@ class TSMapEstimator(Estimator):
         Whether to sum over the energy groups or fit the norm on the full energy
         cube.
     n_jobs : int
-        Number of processes used in parallel for the computation.
+        Number of processes used in parallel for the computation. Only used
+        by the "brentq" method.
+    method : {"brentq", "vectorized"}
+        Root finding method. With "brentq" a single dataset is created and
+        fitted per pixel, which serves as reference. With "vectorized" the
+        norms of all pixels are fitted at once with Newton iterations,
+        safe-guarded by bisection. This is much faster for large maps.
+    chunk_size : int
+        Maximum number of array elements processed at once by the
+        "vectorized" method. Limits the memory usage.
 
     Notes
     -----
@@ -133,6 +142,8 @@ class TSMapEstimator(Estimator):
         energy_edges=None,
         sum_over_energy_groups=True,
         n_jobs=None,
+        method="brentq",
+        chunk_size=int(1e7),
     ):
         self.kernel_width = Angle(kernel_width)
 
@@ -154,7 +165,13 @@ class TSMapEstimator(Estimator):
 
         self.selection_optional = selection_optional
         self.energy_edges = energy_edges
-        self._flux_estimator = BrentqFluxEstimator(
+
+        if method not in FLUX_ESTIMATORS:
+            raise ValueError(f"Not a valid method: {method!r}")
+
+        self.method = method
+        self.chunk_size = chunk_size
+        self._flux_estimator = FLUX_ESTIMATORS[method](
             rtol=self.rtol,
             n_sigma=self.n_sigma,
             n_sigma_ul=self.n_sigma_ul,
@@ -335,8 +352,7 @@ class TSMapEstimator(Estimator):
         )
         exposure_npred = (exposure * flux_ref).quantity.to_value("")
 
-        wrap = functools.partial(
-            _ts_value,
+        kwargs = dict(
             counts=counts.data.astype(float),
             exposure=exposure_npred.astype(float),
             background=background.data.astype(float),
@@ -345,28 +361,35 @@ class TSMapEstimator(Estimator):
             flux_estimator=self._flux_estimator,
         )
 
-        x, y = np.where(np.squeeze(mask.data))
-        positions = list(zip(x, y))
+        j, i = np.where(np.squeeze(mask.data))
 
-        if self.n_jobs is None:
-            results = list(map(wrap, positions))
+        if self.method == "vectorized":
+            results = _ts_values_vectorized(
+                positions=(j, i), chunk_size=self.chunk_size, **kwargs
+            )
         else:
-            with contextlib.closing(Pool(processes=self.n_jobs)) as pool:
-                log.info("Using {} jobs to compute TS map.".format(self.n_jobs))
-                results = pool.map(wrap, positions)
+            wrap = functools.partial(_ts_value, **kwargs)
+            positions = list(zip(j, i))
 
-            pool.join()
+            if self.n_jobs is None:
+                results = list(map(wrap, positions))
+            else:
+                with contextlib.closing(Pool(processes=self.n_jobs)) as pool:
+                    log.info("Using {} jobs to compute TS map.".format(self.n_jobs))
+                    results = pool.map(wrap, positions)
 
-        result = {}
+                pool.join()
 
-        j, i = zip(*positions)
+            results = {name: [_[name] for _ in results] for name in results[0]}
+
+        result = {}
 
         geom = counts.geom.squash(axis_name="energy")
 
         for name in self.selection_all:
             unit = 1 / exposure.unit if "flux" in name else ""
             m = Map.from_geom(geom=geom, data=np.nan, unit=unit)
-            m.data[0, j, i] = [_[name.replace("flux", "norm")] for _ in results]
+            m.data[0, j, i] = results[name.replace("flux", "norm")]
             if "flux" in name:
                 m.data *= flux_ref.to_value(m.unit)
                 m.quantity = m.quantity.to("1 / (cm2 s)")
@@ -653,6 +676,323 @@ class BrentqFluxEstimator(Estimator):
         return result
 
 
+def _root_newton_bisect(f, fprime, x0, lower, upper, rtol, max_niter, xtol=2e-12):
+    """Find roots of many monotonic functions at once.
+
+    Uses Newton steps, which fall back to bisection if the step leaves
+    the current bracket. The bracket is updated in every iteration and
+    iterations stop for the elements that have converged.
+
+    Parameters
+    ----------
+    f, fprime : callable
+        Function and derivative, called as ``f(x, idx)`` where ``idx``
+        selects the elements to evaluate.
+    x0, lower, upper : `~numpy.ndarray`
+        Start values and bracket of the roots.
+    rtol, xtol : float
+        Relative and absolute tolerance of the roots.
+    max_niter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    x : `~numpy.ndarray`
+        Roots
+    niter : `~numpy.ndarray`
+        Number of iterations
+    success : `~numpy.ndarray`
+        Whether the bracket was valid and the root finding converged.
+    """
+    lower, upper = lower.astype(float), upper.astype(float)
+    f_lower, f_upper = f(lower, slice(None)), f(upper, slice(None))
+
+    valid = np.sign(f_lower) != np.sign(f_upper)
+    valid |= (f_lower == 0) | (f_upper == 0)
+
+    x = np.where(np.isfinite(x0), x0, 0.5 * (lower + upper))
+    x = np.clip(x, lower, upper)
+    niter = np.zeros(len(x0), dtype=int)
+    converged = np.zeros(len(x0), dtype=bool)
+    active = valid.copy()
+
+    for _ in range(max_niter):
+        if not active.any():
+            break
+
+        # avoid copies of the data as long as all elements are active
+        idx = slice(None) if active.all() else np.where(active)[0]
+
+        x_old = x[idx].copy()
+        fx = f(x_old, idx)
+        niter[idx] += 1
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x_new = x_old - fx / fprime(x_old, idx)
+
+        same_sign = np.sign(fx) == np.sign(f_lower[idx])
+        lower[idx] = np.where(same_sign, x_old, lower[idx])
+        f_lower[idx] = np.where(same_sign, fx, f_lower[idx])
+        upper[idx] = np.where(same_sign, upper[idx], x_old)
+
+        outside = ~((x_new > lower[idx]) & (x_new < upper[idx]))
+        x_new = np.where(outside, 0.5 * (lower[idx] + upper[idx]), x_new)
+        x[idx] = np.where(fx == 0, x_old, x_new)
+
+        done = (fx == 0) | (np.abs(x_new - x_old) <= xtol + rtol * np.abs(x_new))
+        converged[idx] |= done
+        active[idx] &= ~done
+
+    return x, niter, valid & converged
+
+
+class BatchMapDataset:
+    """Batch of simple map datasets, one per pixel position
+
+    All the data are stored as 2D arrays of shape ``(n_positions, n_bins)``,
+    where ``n_bins`` is the number of bins of the kernel.
+
+    Parameters
+    ----------
+    counts : `~numpy.ndarray`
+        Counts array
+    background : `~numpy.ndarray`
+        Background array
+    model : `~numpy.ndarray`
+        Kernel array multiplied with exposure.
+    norm_guess : `~numpy.ndarray`
+        Start value of the norm for each position.
+    """
+
+    def __init__(self, model, counts, background, norm_guess):
+        self.model = model
+        self.counts = counts
+        self.background = background
+        self.norm_guess = norm_guess
+
+    def __len__(self):
+        return len(self.norm_guess)
+
+    def __getitem__(self, idx):
+        return self.__class__(
+            model=self.model[idx],
+            counts=self.counts[idx],
+            background=self.background[idx],
+            norm_guess=self.norm_guess[idx],
+        )
+
+    @lazyproperty
+    def norm_bounds(self):
+        """Bounds for the norm, see `~gammapy.stats.norm_bounds_cython`"""
+        is_model, is_counts = self.model > 0, self.counts > 0
+        s_model = np.sum(self.model, axis=1, where=is_model)
+        s_counts = np.sum(self.counts, axis=1, where=is_counts)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sn = np.where(is_model, self.background / self.model, np.inf)
+
+        sn_min_total = np.minimum(sn.min(axis=1), 1e14)
+
+        sn_counts = np.where(is_counts, sn, np.inf)
+        idx_min = np.argmin(sn_counts, axis=1)
+        rows = np.arange(len(self))
+        sn_min = sn_counts[rows, idx_min]
+        c_min = np.where(sn_min < 1e14, self.counts[rows, idx_min], 1)
+        sn_min = np.minimum(sn_min, 1e14)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_min = c_min / s_model - sn_min
+            norm_max = s_counts / s_model - sn_min
+
+        return norm_min, norm_max, -sn_min_total
+
+    def _data(self, idx):
+        return self.counts[idx], self.background[idx], self.model[idx]
+
+    def npred(self, norm, idx=slice(None)):
+        """Predicted number of counts"""
+        _, background, model = self._data(idx)
+        return background + np.atleast_1d(norm)[:, np.newaxis] * model
+
+    def stat_sum(self, norm, idx=slice(None)):
+        """Stat sum for each position"""
+        counts = self.counts[idx]
+        npred = self.npred(norm, idx)
+        is_npred = npred > 0
+        log_npred = np.log(np.where(is_npred, npred, 1))
+        stat = np.where(is_npred, npred - counts * log_npred, 0)
+        return 2 * stat.sum(axis=1)
+
+    def stat_derivative(self, norm, idx=slice(None)):
+        """Stat derivative for each position"""
+        counts, background, model = self._data(idx)
+        npred = self.npred(norm, idx)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = np.where(counts > 0, model * (1 - counts / npred), model)
+
+        return 2 * np.sum(value, axis=1, where=model > 0)
+
+    def stat_2nd_derivative(self, norm, idx=slice(None)):
+        """Stat 2nd derivative for each position"""
+        counts, _, model = self._data(idx)
+        npred = self.npred(norm, idx)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (model ** 2 * counts / npred ** 2).sum(axis=1)
+
+    @classmethod
+    def from_arrays(cls, counts, background, exposure, norm, positions, kernel):
+        """Create batch of datasets from cutouts around the given positions
+
+        Parameters
+        ----------
+        counts, background, exposure : `~numpy.ndarray`
+            Counts, background and exposure cubes.
+        norm : `~numpy.ndarray`
+            Norm image used as start value.
+        positions : tuple of `~numpy.ndarray`
+            Pixel indices (j, i) of the positions.
+        kernel : `~numpy.ndarray`
+            Source model kernel.
+        """
+        j, i = positions
+        _, ny, nx = kernel.shape
+        dj = np.arange(ny) - ny // 2
+        di = np.arange(nx) - nx // 2
+
+        idx_j = j[:, np.newaxis, np.newaxis] + dj[:, np.newaxis]
+        idx_i = i[:, np.newaxis, np.newaxis] + di
+
+        def cutouts(array):
+            data = array[:, idx_j, idx_i]
+            return np.moveaxis(data, 0, 1).reshape((len(j), -1))
+
+        return cls(
+            counts=cutouts(counts),
+            background=cutouts(background),
+            model=kernel.reshape((1, -1)) * cutouts(exposure),
+            norm_guess=norm[0, j, i],
+        )
+
+
+class VectorizedFluxEstimator(BrentqFluxEstimator):
+    """Single parameter flux estimator for batches of datasets
+
+    Solves for the norm of all positions of a `BatchMapDataset` at once,
+    using Newton iterations safe-guarded by bisection. The results agree
+    with `BrentqFluxEstimator` within the given tolerance.
+    """
+
+    tag = "VectorizedFluxEstimator"
+
+    def estimate_best_fit(self, dataset):
+        """Optimize the norm for all positions"""
+        norm_min, norm_max, norm_min_total = dataset.norm_bounds
+        norm, niter, success = _root_newton_bisect(
+            f=dataset.stat_derivative,
+            fprime=lambda x, idx: 2 * dataset.stat_2nd_derivative(x, idx),
+            x0=dataset.norm_guess,
+            lower=norm_min,
+            upper=norm_max,
+            rtol=self.rtol,
+            max_niter=self.max_niter,
+        )
+
+        # Where the root finding fails the lower bound is set as norm
+        norm = np.where(success, np.maximum(norm, norm_min_total), norm_min_total)
+        niter = np.where(success, niter, self.max_niter)
+
+        has_counts = dataset.counts.sum(axis=1) > 0
+        norm = np.where(has_counts, norm, norm_min_total)
+        niter = np.where(has_counts, niter, 0)
+
+        return self._result(dataset, norm, niter)
+
+    def _result(self, dataset, norm, niter):
+        stat = dataset.stat_sum(norm)
+        stat_null = dataset.stat_sum(np.zeros_like(norm))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(1 / dataset.stat_2nd_derivative(norm))
+
+        return {
+            "ts": stat_null - stat,
+            "norm": norm,
+            "niter": niter,
+            "norm_err": norm_err * self.n_sigma,
+            "stat": stat,
+        }
+
+    def _confidence(self, dataset, n_sigma, result, positive):
+        norm, norm_err = result["norm"], result["norm_err"]
+        factor = 1 if positive else -1
+
+        def ts_diff(x, idx):
+            return dataset.stat_sum(x, idx) - (result["stat"][idx] + n_sigma ** 2)
+
+        # starting value from the parabolic approximation
+        x0 = norm + factor * norm_err * n_sigma / self.n_sigma
+        bound = norm + factor * 1e2 * norm_err
+
+        with np.errstate(invalid="ignore"):
+            value, _, success = _root_newton_bisect(
+                f=ts_diff,
+                fprime=dataset.stat_derivative,
+                x0=x0,
+                lower=np.minimum(norm, bound),
+                upper=np.maximum(norm, bound),
+                rtol=self.rtol,
+                max_niter=self.max_niter,
+            )
+
+        # Where the root finding fails NaN is set
+        return np.where(success, (value - norm) * factor, np.nan)
+
+    def estimate_default(self, dataset):
+        norm = dataset.norm_guess
+        niter = np.zeros(len(norm), dtype=int)
+        return self._result(dataset, norm, niter)
+
+    def run(self, dataset):
+        """Estimate the norm for all positions of the batch
+
+        Parameters
+        ----------
+        dataset : `BatchMapDataset`
+            Batch of datasets
+
+        Returns
+        -------
+        result : dict
+            Dict of result arrays
+        """
+        if self.ts_threshold is not None:
+            result = self.estimate_default(dataset)
+            idx = np.where(result["ts"] > self.ts_threshold)[0]
+            result_fit = self.estimate_best_fit(dataset[idx])
+
+            for key, value in result_fit.items():
+                result[key] = result[key].astype(value.dtype)
+                result[key][idx] = value
+        else:
+            result = self.estimate_best_fit(dataset)
+
+        if "ul" in self.selection_optional:
+            result.update(self.estimate_ul(dataset, result))
+
+        if "errn-errp" in self.selection_optional:
+            result.update(self.estimate_errn_errp(dataset, result))
+
+        return result
+
+
+FLUX_ESTIMATORS = {
+    "brentq": BrentqFluxEstimator,
+    "vectorized": VectorizedFluxEstimator,
+}
+
+
 def _ts_value(position, counts, exposure, background, kernel, norm, flux_estimator):
     """Compute TS value at a given pixel position.
 
@@ -688,3 +1028,49 @@ def _ts_value(position, counts, exposure, background, kernel, norm, flux_estimat
         norm=norm,
     )
     return flux_estimator.run(dataset)
+
+
+def _ts_values_vectorized(
+    positions, counts, exposure, background, kernel, norm, flux_estimator, chunk_size
+):
+    """Compute TS values at the given pixel positions, in chunks.
+
+    Parameters
+    ----------
+    positions : tuple of `~numpy.ndarray`
+        Pixel indices (j, i) of the positions.
+    counts, exposure, background : `~numpy.ndarray`
+        Counts, exposure and background cubes.
+    kernel : `~numpy.ndarray`
+        Source model kernel
+    norm : `~numpy.ndarray`
+        Norm image used as starting value for the minimization.
+    flux_estimator : `VectorizedFluxEstimator`
+        Flux estimator
+    chunk_size : int
+        Maximum number of array elements of a chunk. The positions are
+        processed in chunks to limit the memory usage.
+
+    Returns
+    -------
+    result : dict
+        Dict of result arrays.
+    """
+    j, i = positions
+    n_positions = max(int(chunk_size // kernel.size), 1)
+
+    results = []
+
+    for idx in range(0, len(j), n_positions):
+        chunk = slice(idx, idx + n_positions)
+        dataset = BatchMapDataset.from_arrays(
+            counts=counts,
+            background=background,
+            exposure=exposure,
+            kernel=kernel,
+            positions=(j[chunk], i[chunk]),
+            norm=norm,
+        )
+        results.append(flux_estimator.run(dataset))
+
+    return {key: np.concatenate([_[key] for _ in results]) for key in results[0]}
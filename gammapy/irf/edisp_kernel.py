@@ -58,6 +58,7 @@ class EDispKernel:
             axes=[energy_axis_true, energy_axis], data=data, interp_kwargs=interp_kwargs
         )
         self.meta = meta or {}
+        self._pdf_bands_cache = None
 
     def __str__(self):
         ss = self.__class__.__name__
@@ -83,6 +84,31 @@ class EDispKernel:
         """
         return self.data.data.value
 
+    @property
+    def pdf_bands(self):
+        """Banded representation of the PDF matrix (list of tuples).
+
+        For every reco energy bin it contains a tuple ``(slice, values)``
+        with the range of true energy bins with non-zero entries and the
+        corresponding column of the PDF matrix. It is computed once and
+        cached until the data is set again.
+        """
+        data = self.data.data
+
+        if self._pdf_bands_cache is None or self._pdf_bands_cache[0] is not data:
+            pdf_matrix = self.pdf_matrix
+            is_nonzero = pdf_matrix != 0
+
+            bands = []
+            for column, nonzero in zip(pdf_matrix.T, is_nonzero.T):
+                idx = np.where(nonzero)[0]
+                band = slice(idx[0], idx[-1] + 1) if len(idx) else slice(0, 0)
+                bands.append((band, np.ascontiguousarray(column[band])))
+
+            self._pdf_bands_cache = (data, bands)
+
+        return self._pdf_bands_cache[1]
+
     def pdf_in_safe_range(self, lo_threshold, hi_threshold):
         """PDF matrix with bins outside threshold set to 0.
 
@@ -191,7 +191,7 @@ class EDispMap(IRFMap):
         edisp_map.quantity = data
         return cls(edisp_map, exposure_edisp)
 
-    def sample_coord(self, map_coord, random_state=0):
+    def sample_coord(self, map_coord, random_state=0, chunk_size=10000):
         """Apply the energy dispersion corrections on the coordinates of a set of simulated events.
 
         Parameters
@@ -201,6 +201,9 @@ class EDispMap(IRFMap):
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
+        chunk_size : int
+            Number of events for which the energy dispersion is evaluated at
+            once. This bounds the memory use and does not change the result.
 
         Returns
         -------
@@ -210,16 +213,24 @@ class EDispMap(IRFMap):
         random_state = get_random_state(random_state)
         migra_axis = self.edisp_map.geom.axes["migra"]
 
-        coord = {
-            "skycoord": map_coord.skycoord.reshape(-1, 1),
-            "energy_true": map_coord["energy_true"].reshape(-1, 1),
-            "migra": migra_axis.center,
-        }
+        n_events = len(map_coord.lon)
+        pix_edisp = np.empty(n_events)
+
+        for idx in range(0, n_events, chunk_size):
+            chunk = slice(idx, idx + chunk_size)
+            coord = {
+                "skycoord": map_coord.skycoord[chunk].reshape(-1, 1),
+                "energy_true": map_coord["energy_true"][chunk].reshape(-1, 1),
+                "migra": migra_axis.center,
+            }
 
-        pdf_edisp = self.edisp_map.interp_by_coord(coord)
+            pdf_edisp = self.edisp_map.interp_by_coord(coord)
+
+            sample_edisp = InverseCDFSampler(
+                pdf_edisp, axis=1, random_state=random_state
+            )
+            pix_edisp[chunk] = sample_edisp.sample_axis()
 
-        sample_edisp = InverseCDFSampler(pdf_edisp, axis=1, random_state=random_state)
-        pix_edisp = sample_edisp.sample_axis()
         migra = migra_axis.pix_to_coord(pix_edisp)
 
         energy_reco = map_coord["energy_true"] * migra
@@ -122,6 +122,11 @@ class PSF3D:
         table = Table.read(make_path(filename), hdu=hdu)
         return cls.from_table(table)
 
+    @classmethod
+    def from_hdulist(cls, hdulist, hdu="PSF_2D_TABLE"):
+        """Create from `~astropy.io.fits.HDUList`."""
+        return cls.from_table(Table.read(hdulist[hdu]))
+
     @classmethod
     def from_table(cls, table):
         """Create `PSF3D` from `~astropy.table.Table`.
@@ -117,7 +117,12 @@ class EnergyDependentMultiGaussPSF:
             File name
         """
         with fits.open(str(make_path(filename)), memmap=False) as hdulist:
-            return cls.from_table_hdu(hdulist[hdu])
+            return cls.from_hdulist(hdulist, hdu=hdu)
+
+    @classmethod
+    def from_hdulist(cls, hdulist, hdu="PSF_2D_GAUSS"):
+        """Create from `~astropy.io.fits.HDUList`."""
+        return cls.from_table_hdu(hdulist[hdu])
 
     @classmethod
     def from_table_hdu(cls, hdu):
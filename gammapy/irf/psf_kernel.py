@@ -1,5 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import collections
 import numpy as np
+import scipy.fftpack
 import astropy.units as u
 from astropy.coordinates import Angle
 from gammapy.maps import Map, WcsGeom
@@ -7,6 +9,12 @@ from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.utils.gauss import Gauss2DPDF
 from .psf_table import EnergyDependentTablePSF, TablePSF
 
+try:
+    import scipy.fft as fft
+except ImportError:
+    # scipy < 1.4
+    import numpy.fft as fft
+
 __all__ = ["PSFKernel"]
 
 
@@ -70,8 +78,12 @@ class PSFKernel:
         some_map_convolved.get_image_by_coord(dict(energy=0.6*u.TeV)).plot()
     """
 
+    fft_plans_max_size = 4
+    """Maximum number of cached FFT plans, see `PSFKernel.fftconvolve`."""
+
     def __init__(self, psf_kernel_map, normalize=True):
         self._psf_kernel_map = psf_kernel_map
+        self._fft_plans = collections.OrderedDict()
 
         if normalize:
             self.normalize()
@@ -98,6 +110,88 @@ class PSFKernel:
         """The map object holding the kernel (`~gammapy.maps.Map`)"""
         return self._psf_kernel_map
 
+    def _get_fft_plan(self, shape):
+        """Kernel FFT and workspace buffer for data of a given shape.
+
+        The plan is cached per data shape and recomputed if the kernel
+        data is set again. Only the `fft_plans_max_size` most recently used
+        plans are kept.
+        """
+        kernel = self.psf_kernel_map.data
+        plan = self._fft_plans.get(shape)
+
+        if plan is not None and plan["kernel"] is kernel:
+            self._fft_plans.move_to_end(shape)
+            return plan
+
+        shape_image, shape_kernel = shape[-2:], kernel.shape[-2:]
+        starts = [(m - 1) // 2 for m in shape_kernel]
+
+        # cut-out of the full convolution, corresponding to "same" mode. The
+        # wrap-around of the cyclic convolution only has to stay outside
+        # of the cut-out, so the padding can be smaller than the full size
+        slices = tuple(slice(i, i + n) for i, n in zip(starts, shape_image))
+        shape_fft = [
+            scipy.fftpack.next_fast_len(n + m - 1 - i)
+            for n, m, i in zip(shape_image, shape_kernel, starts)
+        ]
+
+        plan = {
+            "kernel": kernel,
+            "kernel_fft": fft.rfftn(
+                kernel.astype(np.float32), s=shape_fft, axes=(-2, -1)
+            ),
+            "buffer": np.zeros(shape[:-2] + tuple(shape_fft), dtype=np.float32),
+            "slices": (Ellipsis,) + slices,
+            "shape_fft": shape_fft,
+        }
+        self._fft_plans[shape] = plan
+        self._fft_plans.move_to_end(shape)
+
+        while len(self._fft_plans) > self.fft_plans_max_size:
+            self._fft_plans.popitem(last=False)
+
+        return plan
+
+    def fftconvolve(self, data):
+        """Convolve data with the kernel using FFTs.
+
+        Equivalent to `scipy.signal.fftconvolve` with ``mode="same"``,
+        applied to all image planes at once. The FFTs of the kernel and
+        the zero-padded workspace are computed once per data shape and
+        re-used in subsequent calls. A 2D image is convolved with all
+        planes of the kernel.
+
+        The workspace is shared between calls, so this method must not be
+        called from several threads at once on the same kernel.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data array, the last two axes are the image axes.
+
+        Returns
+        -------
+        convolved : `~numpy.ndarray`
+            Convolved data in single precision.
+        """
+        plan = self._get_fft_plan(data.shape)
+
+        buffer = plan["buffer"]
+        ny, nx = data.shape[-2:]
+        buffer[..., :ny, :nx] = data
+
+        data_fft = fft.rfftn(buffer, axes=(-2, -1))
+        kernel_fft = plan["kernel_fft"]
+
+        if np.broadcast(data_fft, kernel_fft).shape == data_fft.shape:
+            data_fft *= kernel_fft
+        else:
+            data_fft = data_fft * kernel_fft
+
+        convolved = fft.irfftn(data_fft, s=plan["shape_fft"], axes=(-2, -1))
+        return np.ascontiguousarray(convolved[plan["slices"]], dtype=np.float32)
+
     @classmethod
     def read(cls, *args, **kwargs):
         """Read kernel Map from file."""
@@ -92,6 +92,11 @@ class PSFKing:
         table = Table.read(make_path(filename), hdu=hdu)
         return cls.from_table(table)
 
+    @classmethod
+    def from_hdulist(cls, hdulist, hdu=1):
+        """Create from `~astropy.io.fits.HDUList`."""
+        return cls.from_table(Table.read(hdulist[hdu]))
+
     @classmethod
     def from_table(cls, table):
         """Create `PSFKing` from `~astropy.table.Table`.
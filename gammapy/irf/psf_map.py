@@ -217,7 +217,7 @@ class PSFMap(IRFMap):
         psf_map = Map.from_geom(geom, unit="sr-1")
         return cls(psf_map, exposure_psf)
 
-    def sample_coord(self, map_coord, random_state=0):
+    def sample_coord(self, map_coord, random_state=0, chunk_size=10000):
         """Apply PSF corrections on the coordinates of a set of simulated events.
 
         Parameters
@@ -227,6 +227,9 @@ class PSFMap(IRFMap):
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
+        chunk_size : int
+            Number of events for which the PSF is evaluated at once. This
+            bounds the memory use and does not change the result.
 
         Returns
         -------
@@ -237,20 +240,26 @@ class PSFMap(IRFMap):
         random_state = get_random_state(random_state)
         rad_axis = self.psf_map.geom.axes["rad"]
 
-        coord = {
-            "skycoord": map_coord.skycoord.reshape(-1, 1),
-            "energy_true": map_coord["energy_true"].reshape(-1, 1),
-            "rad": rad_axis.center,
-        }
+        n_events = len(map_coord.lon)
+        pix_coord = np.empty(n_events)
 
-        pdf = (
-            self.psf_map.interp_by_coord(coord)
-            * rad_axis.center.value
-            * rad_axis.bin_width.value
-        )
+        for idx in range(0, n_events, chunk_size):
+            chunk = slice(idx, idx + chunk_size)
+            coord = {
+                "skycoord": map_coord.skycoord[chunk].reshape(-1, 1),
+                "energy_true": map_coord["energy_true"][chunk].reshape(-1, 1),
+                "rad": rad_axis.center,
+            }
+
+            pdf = (
+                self.psf_map.interp_by_coord(coord)
+                * rad_axis.center.value
+                * rad_axis.bin_width.value
+            )
+
+            sample_pdf = InverseCDFSampler(pdf, axis=1, random_state=random_state)
+            pix_coord[chunk] = sample_pdf.sample_axis()
 
-        sample_pdf = InverseCDFSampler(pdf, axis=1, random_state=random_state)
-        pix_coord = sample_pdf.sample_axis()
         separation = rad_axis.pix_to_coord(pix_coord)
 
         position_angle = random_state.uniform(360, size=len(map_coord.lon)) * u.deg
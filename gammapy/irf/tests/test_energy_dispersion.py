@@ -57,6 +57,25 @@ class TestEDispKernel:
         )
         assert_allclose(im.energy_axis.edges, [0.1, 10] * u.TeV)
 
+    def test_pdf_bands(self):
+        bands = self.edisp.pdf_bands
+        assert len(bands) == 100
+
+        band, values = bands[50]
+        assert_equal([band.start, band.stop], [32, 83])
+        assert_equal(values, self.edisp.pdf_matrix[band, 50])
+
+        pdf_matrix = np.zeros_like(self.edisp.pdf_matrix)
+        for idx, (band, values) in enumerate(bands):
+            pdf_matrix[band, idx] = values
+
+        assert_equal(pdf_matrix, self.edisp.pdf_matrix)
+        assert self.edisp.pdf_bands is bands
+
+        self.edisp.data.data = np.eye(100)
+        band, values = self.edisp.pdf_bands[50]
+        assert_equal([band.start, band.stop], [50, 51])
+
     def test_str(self):
         assert "EDispKernel" in str(self.edisp)
 
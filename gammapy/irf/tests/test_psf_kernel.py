@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+import scipy.signal
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import Angle
@@ -77,3 +78,41 @@ def test_psf_kernel_to_image():
     )
     assert_allclose(kernel_image_2.psf_kernel_map.data[0, 22, 22], 0.0079069, atol=1e-5)
     assert_allclose(kernel_image_2.psf_kernel_map.data[0, 20, 20], 0.0, atol=1e-5)
+
+
+def test_psf_kernel_fftconvolve():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3, name="energy_true")
+    geom = WcsGeom.create(binsz=0.02, npix=(40, 30), axes=[axis])
+    kernel = PSFKernel.from_gauss(geom, sigma="0.05 deg")
+
+    data = np.random.RandomState(0).rand(3, 30, 40)
+    result = kernel.fftconvolve(data)
+
+    assert result.shape == (3, 30, 40)
+    assert result.dtype == np.float32
+
+    for idx in range(3):
+        expected = scipy.signal.fftconvolve(data[idx], kernel.data[idx], mode="same")
+        assert_allclose(result[idx], expected, rtol=1e-5, atol=1e-6)
+
+    # cached plan is re-used and updated with the kernel data
+    plan = kernel._fft_plans[(3, 30, 40)]
+    kernel.fftconvolve(data)
+    assert kernel._fft_plans[(3, 30, 40)] is plan
+
+    kernel.normalize()
+    kernel.fftconvolve(data)
+    assert kernel._fft_plans[(3, 30, 40)] is not plan
+
+    # 2D image is convolved with all kernel planes
+    result = kernel.fftconvolve(data[0])
+    assert result.shape == (3, 30, 40)
+    expected = scipy.signal.fftconvolve(data[0], kernel.data[2], mode="same")
+    assert_allclose(result[2], expected, rtol=1e-5, atol=1e-6)
+
+    # only the most recently used plans are kept
+    for npix in range(10, 20):
+        kernel.fftconvolve(data[:, :npix, :npix])
+
+    assert len(kernel._fft_plans) == kernel.fft_plans_max_size
+    assert (3, 19, 19) in kernel._fft_plans
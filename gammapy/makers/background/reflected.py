@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import collections
+import hashlib
 import logging
 import numpy as np
 from astropy import units as u
@@ -197,6 +199,7 @@ class ReflectedRegionsFinder:
         # find excluded PixCoords
         mask = self.reference_map.data == 0
         self.excluded_pixcoords = PixCoord(X[mask], Y[mask])
+        self._setup_excluded_angles()
 
         # Minimum angle a region has to be moved to not overlap with previous one
         min_ang = self._region_angular_size(ONpixels, self._pix_center)
@@ -207,6 +210,74 @@ class ReflectedRegionsFinder:
         # Maximum possible angle before regions is reached again
         self._max_angle = Angle("360deg") - self._min_ang - self.min_distance_input
 
+    def _setup_excluded_angles(self):
+        """Index the excluded pixels by polar angle around the center.
+
+        Only excluded pixels within the range of distances to the center
+        covered by the bounding box of the region are kept. Their polar
+        angles relative to the direction of the region are sorted, so the
+        pixels which can be contained in the region rotated by a given
+        angle are found by a binary search, see `_excluded_candidates`.
+        """
+        self._excluded_angles = None
+
+        excluded = self.excluded_pixcoords
+        center = self._pix_center
+
+        try:
+            bbox = self._pix_region.bounding_box
+        except (AttributeError, NotImplementedError):
+            return
+
+        # corners of the bounding box, with a margin of half a pixel
+        x = np.array([bbox.ixmin - 1, bbox.ixmax, bbox.ixmax, bbox.ixmin - 1])
+        y = np.array([bbox.iymin - 1, bbox.iymin - 1, bbox.iymax, bbox.iymax])
+
+        if (x[0] <= center.x <= x[1]) and (y[0] <= center.y <= y[2]):
+            return
+
+        dx, dy = x - center.x, y - center.y
+        angle_ref = np.arctan2(y.mean() - center.y, x.mean() - center.x)
+        angles = (np.arctan2(dy, dx) - angle_ref + np.pi) % (2 * np.pi) - np.pi
+
+        # the box is convex, so the distance range is given by the corners,
+        # unless the closest point lies on an edge
+        x_closest = np.clip(center.x, x[0], x[1])
+        y_closest = np.clip(center.y, y[0], y[2])
+        r_min = np.hypot(x_closest - center.x, y_closest - center.y)
+        r_max = np.max(np.hypot(dx, dy))
+
+        dx, dy = excluded.x - center.x, excluded.y - center.y
+        r = np.hypot(dx, dy)
+        idx = np.flatnonzero((r >= r_min) & (r <= r_max))
+
+        angles_excluded = (np.arctan2(dy[idx], dx[idx]) - angle_ref) % (2 * np.pi)
+        order = np.argsort(angles_excluded)
+
+        self._excluded_angles = angles_excluded[order]
+        self._excluded_idx = idx[order]
+        # small margin for rounding errors
+        self._angle_range = angles.min() - 1e-6, angles.max() + 1e-6
+
+    def _excluded_candidates(self, angle):
+        """Excluded pixels which can be contained in the region rotated by angle."""
+        if self._excluded_angles is None:
+            return self.excluded_pixcoords
+
+        angle_min, angle_max = (np.array(self._angle_range) + angle) % (2 * np.pi)
+
+        search = np.searchsorted(self._excluded_angles, [angle_min, angle_max])
+
+        if angle_min <= angle_max:
+            idx = self._excluded_idx[search[0] : search[1]]
+        else:
+            # the interval wraps around zero
+            idx = np.concatenate(
+                [self._excluded_idx[search[0] :], self._excluded_idx[: search[1]]]
+            )
+
+        return self.excluded_pixcoords[idx]
+
     def find_regions(self):
         """Find reflected regions."""
         curr_angle = self._min_ang + self.min_distance_input
@@ -214,7 +285,8 @@ class ReflectedRegionsFinder:
 
         while curr_angle < self._max_angle:
             test_reg = self._pix_region.rotate(self._pix_center, curr_angle)
-            if not np.any(test_reg.contains(self.excluded_pixcoords)):
+            excluded = self._excluded_candidates(curr_angle.rad)
+            if not np.any(test_reg.contains(excluded)):
                 region = test_reg.to_sky(self.reference_map.geom.wcs)
                 reflected_regions.append(region)
 
@@ -271,6 +343,9 @@ class ReflectedRegionsBackgroundMaker(Maker):
 
     tag = "ReflectedRegionsBackgroundMaker"
 
+    cache_size = 128
+    """Maximum number of cached reflected regions results."""
+
     def __init__(
         self,
         angle_increment="0.1 rad",
@@ -286,6 +361,7 @@ class ReflectedRegionsBackgroundMaker(Maker):
         self.min_distance = Angle(min_distance)
         self.min_distance_input = Angle(min_distance_input)
         self.max_region_number = max_region_number
+        self._regions_cache = collections.OrderedDict()
 
     def _get_finder(self, dataset, observation):
         return ReflectedRegionsFinder(
@@ -299,6 +375,56 @@ class ReflectedRegionsBackgroundMaker(Maker):
             angle_increment=self.angle_increment,
         )
 
+    def _find_reflected_regions(self, dataset, observation):
+        """Reflected regions and the WCS they are defined with.
+
+        The result is cached per pointing position, on region, exclusion
+        mask content and finder parameters, e.g. for repeated extractions of
+        the same observations. The least recently used results are dropped
+        beyond `cache_size` entries.
+        """
+        pointing = observation.pointing_radec.icrs
+        key = (
+            pointing.ra.deg,
+            pointing.dec.deg,
+            str(dataset.counts.geom.region),
+            self._exclusion_mask_hash(),
+            str(self.binsz),
+            self.angle_increment.rad,
+            self.min_distance.rad,
+            self.min_distance_input.rad,
+            self.max_region_number,
+        )
+
+        if key in self._regions_cache:
+            self._regions_cache.move_to_end(key)
+            return self._regions_cache[key]
+
+        finder = self._get_finder(dataset, observation)
+        finder.run()
+        result = (finder.reflected_regions, finder.reference_map.geom.wcs)
+
+        if self.cache_size > 0:
+            self._regions_cache[key] = result
+
+            while len(self._regions_cache) > self.cache_size:
+                self._regions_cache.popitem(last=False)
+
+        return result
+
+    def _exclusion_mask_hash(self):
+        # hash of the mask content, so that in place changes are detected
+        mask = self.exclusion_mask
+
+        if mask is None:
+            return None
+
+        data = np.ascontiguousarray(mask.data)
+        digest = hashlib.sha1(data.tobytes())
+        digest.update(str((data.dtype, data.shape)).encode())
+        digest.update(mask.geom.wcs.to_header_string().encode())
+        return digest.hexdigest()
+
     def make_counts_off(self, dataset, observation):
         """Make off counts.
 
@@ -315,18 +441,16 @@ class ReflectedRegionsBackgroundMaker(Maker):
         counts_off : `RegionNDMap`
             Off counts.
         """
-        finder = self._get_finder(dataset, observation)
-        finder.run()
+        regions, wcs = self._find_reflected_regions(dataset, observation)
 
         energy_axis = dataset.counts.geom.axes["energy"]
 
-        if len(finder.reflected_regions) > 0:
-            region_union = list_to_compound_region(finder.reflected_regions)
-            wcs = finder.reference_map.geom.wcs
+        if len(regions) > 0:
+            region_union = list_to_compound_region(regions)
             geom = RegionGeom.create(region=region_union, axes=[energy_axis], wcs=wcs)
             counts_off = RegionNDMap.from_geom(geom=geom)
             counts_off.fill_events(observation.events)
-            acceptance_off = len(finder.reflected_regions)
+            acceptance_off = len(regions)
         else:
             # if no OFF regions are found, off is set to None and acceptance_off to zero
             counts_off = None
@@ -143,6 +143,42 @@ def test_non_circular_regions(region, nreg):
     assert len(regions) == nreg
 
 
+@pytest.mark.parametrize(
+    "region", [region for region, nreg in other_region_finder_param if nreg > 0]
+)
+def test_reflected_regions_excluded_angles(region):
+    pointing = SkyCoord(0.0, 0.0, unit="deg")
+
+    # exclude a band crossing the field of view
+    geom = WcsGeom.create(skydir=pointing, binsz=0.02, width=6.0)
+    mask = geom.region_mask(
+        [RectangleSkyRegion(SkyCoord(-0.3, 0.5, unit="deg"), 3 * u.deg, 0.4 * u.deg)],
+        inside=False,
+    )
+    exclusion_mask = WcsNDMap(geom, data=mask)
+
+    finder = ReflectedRegionsFinder(
+        center=pointing,
+        region=region,
+        exclusion_mask=exclusion_mask,
+        min_distance_input="0 deg",
+        angle_increment="0.05 rad",
+    )
+    finder.run()
+    assert finder._excluded_angles is not None
+
+    centers = [_.center.icrs for _ in finder.reflected_regions]
+
+    # brute force test against all excluded pixels
+    finder._excluded_angles = None
+    finder.find_regions()
+    expected = [_.center.icrs for _ in finder.reflected_regions]
+
+    assert len(centers) == len(expected)
+    for actual, desired in zip(centers, expected):
+        assert actual.separation(desired) < 1e-8 * u.deg
+
+
 @requires_dependency("matplotlib")
 def test_bad_on_region(exclusion_mask, on_region):
     pointing = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
@@ -187,6 +223,29 @@ def test_reflected_bkg_maker(on_region, reflected_bkg_maker, observations):
     assert_allclose(len(regions_1), 11)
 
 
+@requires_data()
+def test_reflected_bkg_maker_cache(on_region, exclusion_mask, observations):
+    maker = ReflectedRegionsBackgroundMaker(exclusion_mask=exclusion_mask.copy())
+    maker.cache_size = 1
+
+    e_reco = MapAxis.from_edges(np.logspace(0, 2, 5) * u.TeV, name="energy")
+    geom = RegionGeom(region=on_region, axes=[e_reco])
+    dataset = SpectrumDataset.create(geom=geom)
+
+    regions, _ = maker._find_reflected_regions(dataset, observations[0])
+    regions_cached, _ = maker._find_reflected_regions(dataset, observations[0])
+    assert regions_cached is regions
+
+    # in place changes of the exclusion mask are not served from the cache
+    mask_hash = maker._exclusion_mask_hash()
+    maker.exclusion_mask.data[...] = True
+    assert maker._exclusion_mask_hash() != mask_hash
+
+    regions_all, _ = maker._find_reflected_regions(dataset, observations[0])
+    assert regions_all is not regions
+    assert len(maker._regions_cache) == 1
+
+
 @requires_data()
 def test_reflected_bkg_maker_no_off(reflected_bkg_maker, observations):
     pos = SkyCoord(83.6333313, 21.51444435, unit="deg", frame="icrs")
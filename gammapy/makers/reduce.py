@@ -0,0 +1,150 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import inspect
+import logging
+from functools import partial
+from astropy.coordinates import Angle
+from gammapy.datasets import Datasets
+from gammapy.utils.parallel import imap_ordered
+from .core import Maker
+
+__all__ = ["DatasetsMaker"]
+
+log = logging.getLogger(__name__)
+
+
+class DatasetsMaker(Maker):
+    """Run a chain of makers for a list of observations.
+
+    For every observation a copy of the reference dataset, or a cutout of it
+    around the pointing position, is passed through the chain of makers.
+
+    With ``n_jobs > 1`` the observations are reduced in a pool of processes.
+    The makers and the reference dataset are sent once to every worker and
+    for each task only the observation is sent. The reduced datasets are
+    streamed back in the order of the observations, with at most
+    ``2 * n_jobs`` of them in flight at any time. When stacking, the memory
+    usage therefore scales with the number of workers and not with the
+    number of observations.
+
+    Parameters
+    ----------
+    makers : list of `Maker`
+        Makers, applied in the given order. Makers that take an
+        ``observation`` argument get the current observation passed.
+    stack_datasets : bool
+        Whether to stack the reduced datasets into the reference dataset.
+    n_jobs : int
+        Number of processes. By default the observations are reduced in
+        the current process.
+    cutout_width : `~astropy.coordinates.Angle`
+        Width of the cutout around the pointing position. By default the
+        full reference dataset is used.
+    cutout_mode : {'trim', 'partial', 'strict'}
+        Cutout mode, see `~gammapy.datasets.MapDataset.cutout`.
+    """
+
+    tag = "DatasetsMaker"
+
+    def __init__(
+        self,
+        makers,
+        stack_datasets=True,
+        n_jobs=None,
+        cutout_width=None,
+        cutout_mode="trim",
+    ):
+        self.makers = list(makers)
+        self.stack_datasets = stack_datasets
+        self.n_jobs = n_jobs
+
+        if cutout_width is not None:
+            cutout_width = Angle(cutout_width)
+
+        self.cutout_width = cutout_width
+        self.cutout_mode = cutout_mode
+
+    def make_dataset(self, dataset, observation):
+        """Reduce a single observation.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.Dataset`
+            Reference dataset
+        observation : `~gammapy.data.Observation`
+            Observation
+
+        Returns
+        -------
+        dataset : `~gammapy.datasets.Dataset`
+            Reduced dataset
+        """
+        log.info(f"Processing observation {observation.obs_id}")
+
+        if self.cutout_width is not None:
+            dataset = dataset.cutout(
+                position=observation.pointing_radec,
+                width=self.cutout_width,
+                mode=self.cutout_mode,
+            )
+        else:
+            dataset = dataset.copy()
+
+        for maker in self.makers:
+            if "observation" in inspect.signature(maker.run).parameters:
+                dataset = maker.run(dataset, observation)
+            else:
+                dataset = maker.run(dataset)
+
+        log.debug(dataset)
+        return dataset
+
+    def iter_datasets(self, dataset, observations):
+        """Reduce observations and yield the datasets in order.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.Dataset`
+            Reference dataset
+        observations : `~gammapy.data.Observations`
+            Observations
+
+        Yields
+        ------
+        dataset : `~gammapy.datasets.Dataset`
+            Reduced dataset
+        """
+        if self.n_jobs and self.n_jobs > 1:
+            log.info(f"Reducing observations with {self.n_jobs} processes.")
+
+        yield from imap_ordered(
+            partial(self.make_dataset, dataset),
+            ((observation,) for observation in observations),
+            n_jobs=self.n_jobs,
+        )
+
+    def run(self, dataset, observations):
+        """Reduce observations.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.Dataset`
+            Reference dataset
+        observations : `~gammapy.data.Observations`
+            Observations
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            Reduced datasets, or a single stacked dataset.
+        """
+        datasets = self.iter_datasets(dataset, observations)
+
+        if self.stack_datasets:
+            stacked = dataset.copy(name=dataset.name)
+
+            for dataset_obs in datasets:
+                stacked.stack(dataset_obs)
+
+            return Datasets([stacked])
+
+        return Datasets(list(datasets))
@@ -0,0 +1,92 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from gammapy.data import GTI
+from gammapy.datasets import MapDataset
+from gammapy.makers import DatasetsMaker, Maker
+from gammapy.maps import MapAxis, WcsGeom
+
+
+class DummyObservation:
+    def __init__(self, obs_id, pointing_radec):
+        self.obs_id = obs_id
+        self.pointing_radec = pointing_radec
+
+
+class CountsMaker(Maker):
+    tag = "CountsMaker"
+
+    def run(self, dataset, observation):
+        dataset.counts.data += observation.obs_id
+        start = observation.obs_id * u.h
+        dataset.gti = GTI.create(start=start, stop=start + 30 * u.min)
+        return dataset
+
+
+class MaskMaker(Maker):
+    tag = "MaskMaker"
+
+    def run(self, dataset):
+        dataset.mask_safe.data[...] = True
+        return dataset
+
+
+@pytest.fixture(scope="session")
+def observations():
+    return [
+        DummyObservation(obs_id, SkyCoord(lon, 0, unit="deg", frame="galactic"))
+        for obs_id, lon in zip([1, 2, 3, 4, 5], [-1, -0.5, 0, 0.5, 1])
+    ]
+
+
+@pytest.fixture(scope="session")
+def reference():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = WcsGeom.create(
+        skydir=(0, 0), npix=(60, 20), binsz=0.1, frame="galactic", axes=[axis]
+    )
+    return MapDataset.create(geom, name="stacked")
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_datasets_maker(reference, observations, n_jobs):
+    maker = DatasetsMaker(
+        [CountsMaker(), MaskMaker()],
+        stack_datasets=False,
+        n_jobs=n_jobs,
+        cutout_width="1 deg",
+    )
+    datasets = maker.run(reference, observations)
+
+    assert len(datasets) == 5
+    assert datasets[0].counts.data.shape == (2, 10, 10)
+    assert_allclose([_.counts.data[0, 0, 0] for _ in datasets], [1, 2, 3, 4, 5])
+    assert np.all(datasets[4].mask_safe.data)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_datasets_maker_stack(reference, observations, n_jobs):
+    maker = DatasetsMaker(
+        [CountsMaker(), MaskMaker()], n_jobs=n_jobs, cutout_width="1 deg"
+    )
+    datasets = maker.run(reference, observations)
+
+    assert len(datasets) == 1
+    stacked = datasets[0]
+    assert stacked.name == "stacked"
+    assert_allclose(stacked.counts.data.sum(), 2 * 100 * 15)
+    assert_allclose(stacked.counts.data[0, 10, 30], 2 + 3)
+    assert_allclose(stacked.gti.time_sum.to_value("h"), 2.5)
+
+    # reference dataset is not modified
+    assert_allclose(reference.counts.data.sum(), 0)
+
+
+def test_datasets_maker_no_cutout(reference, observations):
+    maker = DatasetsMaker([CountsMaker()], stack_datasets=False)
+    datasets = maker.run(reference, observations[:2])
+    assert datasets[1].counts.data.shape == (2, 20, 60)
+    assert_allclose(reference.counts.data.sum(), 0)
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Sky maps."""
+from .chunked import *
 from .core import *
 from .geom import *
 from .hpx import *
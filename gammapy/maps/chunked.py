@@ -0,0 +1,609 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Chunked on-disk storage of maps."""
+import itertools
+import json
+import os
+import shutil
+import zlib
+import numpy as np
+from astropy import units as u
+from astropy.io import fits
+from astropy.utils import lazyproperty
+from gammapy.utils.scripts import make_path
+from .core import Map
+from .hpx import HpxGeom
+from .region import RegionGeom
+from .wcs import WcsGeom
+
+__all__ = ["ChunkedMapStore"]
+
+
+class ChunkedMapStore:
+    """Chunked and compressed directory store for map data.
+
+    The map data is split into a regular grid of chunks and each chunk is
+    stored zlib compressed in its own file. Reading part of a map, e.g. a
+    cutout or an energy slice, only reads the chunks overlapping with it.
+    Writers of disjoint parts of the map that are aligned with the chunk
+    grid can write concurrently, and the map can be extended along a
+    non-spatial axis with `ChunkedMapStore.append`.
+
+    The directory layout is::
+
+        store.json      map type, shape, chunks, dtype, unit and meta data
+        geom.fits       map geometry
+        chunks/         one file per chunk, named by the chunk index
+
+    Parameters
+    ----------
+    path : str or `~pathlib.Path`
+        Directory of the store.
+
+    Examples
+    --------
+    ::
+
+        from gammapy.maps import Map, ChunkedMapStore
+        m = Map.read("$GAMMAPY_DATA/fermi-3fhl-gc/fermi-3fhl-gc-counts-cube.fits.gz")
+        store = ChunkedMapStore.from_map(m, "counts-store", chunks=(1, 64, 64))
+        cutout = store.cutout(position=m.geom.center_skydir, width="1 deg")
+    """
+
+    def __init__(self, path):
+        self.path = make_path(path)
+
+        with (self.path / "store.json").open() as fh:
+            self._info = json.load(fh)
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__}\n\n"
+            f"\tpath     : {self.path}\n"
+            f"\tmap_type : {self.map_type}\n"
+            f"\tshape    : {self.shape}\n"
+            f"\tchunks   : {self.chunks}\n"
+            f"\tdtype    : {self.dtype}\n"
+            f"\tunit     : {self.unit}\n"
+        )
+
+    @property
+    def map_type(self):
+        """Map type (str)."""
+        return self._info["map_type"]
+
+    @property
+    def shape(self):
+        """Shape of the map data (tuple)."""
+        return tuple(self._info["shape"])
+
+    @property
+    def chunks(self):
+        """Shape of the chunks (tuple)."""
+        return tuple(self._info["chunks"])
+
+    @property
+    def dtype(self):
+        """Data type (`~numpy.dtype`)."""
+        return np.dtype(self._info["dtype"])
+
+    @property
+    def unit(self):
+        """Map unit (`~astropy.units.Unit`)."""
+        return u.Unit(self._info["unit"])
+
+    @property
+    def meta(self):
+        """Map meta data (dict)."""
+        return self._info["meta"]
+
+    @lazyproperty
+    def geom(self):
+        """Map geometry (`~gammapy.maps.Geom`)."""
+        with fits.open(str(self.path / "geom.fits"), memmap=False) as hdulist:
+            if self.map_type == "region":
+                return RegionGeom.from_hdulist(hdulist, format="ogip")
+
+            geom_cls = WcsGeom if self.map_type == "wcs" else HpxGeom
+            hdu_bands = "GEOM_BANDS" if "GEOM_BANDS" in hdulist else None
+            return geom_cls.from_hdulist(hdulist, hdu="GEOM", hdu_bands=hdu_bands)
+
+    @classmethod
+    def create(
+        cls,
+        path,
+        geom,
+        dtype="float32",
+        unit="",
+        meta=None,
+        chunks=None,
+        overwrite=False,
+    ):
+        """Create an empty store.
+
+        Chunks that have not been written read as zeros.
+
+        Parameters
+        ----------
+        path : str or `~pathlib.Path`
+            Directory of the store.
+        geom : `~gammapy.maps.Geom`
+            Map geometry.
+        dtype : str
+            Data type.
+        unit : str or `~astropy.units.Unit`
+            Map unit.
+        meta : dict
+            Map meta data, must be JSON serialisable.
+        chunks : tuple of int
+            Chunk shape, in the order of the map data array. By default
+            every image plane is split into chunks of 256 x 256 pixels
+            for WCS maps and 65536 pixels for HEALPix maps.
+        overwrite : bool
+            Overwrite an existing store.
+
+        Returns
+        -------
+        store : `ChunkedMapStore`
+            Chunked map store.
+        """
+        path = make_path(path)
+
+        if path.exists():
+            if not overwrite:
+                raise IOError(f"Store already exists: {path}")
+            shutil.rmtree(path)
+
+        (path / "chunks").mkdir(parents=True)
+
+        if isinstance(geom, WcsGeom):
+            map_type = "wcs"
+        elif isinstance(geom, HpxGeom):
+            map_type = "hpx"
+        elif isinstance(geom, RegionGeom):
+            map_type = "region"
+        else:
+            raise ValueError(f"Unsupported geometry: {type(geom)}")
+
+        shape = geom.data_shape
+
+        if chunks is None:
+            chunks = cls._get_default_chunks(geom)
+
+        if len(chunks) != len(shape):
+            raise ValueError(
+                f"Chunks {chunks} do not match the data dimension {len(shape)}"
+            )
+
+        info = {
+            "map_type": map_type,
+            "shape": [int(_) for _ in shape],
+            "chunks": [int(_) for _ in chunks],
+            "dtype": np.dtype(dtype).newbyteorder("=").str,
+            "unit": u.Unit(unit).to_string(),
+            "meta": {} if meta is None else meta,
+        }
+
+        _write_geom(path / "geom.fits", geom)
+        _write_json(path / "store.json", info)
+        return cls(path)
+
+    @classmethod
+    def from_map(cls, m, path, chunks=None, overwrite=False):
+        """Write a map into a new store.
+
+        Parameters
+        ----------
+        m : `~gammapy.maps.Map`
+            Map to store.
+        path : str or `~pathlib.Path`
+            Directory of the store.
+        chunks : tuple of int
+            Chunk shape, see `ChunkedMapStore.create`.
+        overwrite : bool
+            Overwrite an existing store.
+
+        Returns
+        -------
+        store : `ChunkedMapStore`
+            Chunked map store.
+        """
+        store = cls.create(
+            path,
+            geom=m.geom,
+            dtype=m.data.dtype,
+            unit=m.unit,
+            meta=m.meta,
+            chunks=chunks,
+            overwrite=overwrite,
+        )
+        store.write(m.data)
+        return store
+
+    @staticmethod
+    def _get_default_chunks(geom):
+        n_spatial = len(geom.data_shape) - len(geom.axes)
+        size = 256 if n_spatial == 2 else 65536
+        chunks = [1] * len(geom.axes)
+        chunks += [min(n, size) for n in geom.data_shape[-n_spatial:]]
+        return tuple(chunks)
+
+    def _chunk_path(self, idx):
+        return self.path / "chunks" / ".".join([str(_) for _ in idx])
+
+    def _read_chunk(self, idx):
+        path = self._chunk_path(idx)
+
+        if not path.exists():
+            return np.zeros(self.chunks, dtype=self.dtype)
+
+        data = zlib.decompress(path.read_bytes())
+        return np.frombuffer(data, dtype=self.dtype).reshape(self.chunks)
+
+    def _write_chunk(self, idx, data):
+        path = self._chunk_path(idx)
+        # write to a temporary file first, so readers never see partial chunks
+        path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path_tmp.write_bytes(zlib.compress(data.tobytes()))
+        os.replace(path_tmp, path)
+
+    def _get_bounds(self, slices):
+        """Start and stop index for every data dimension.
+
+        Integer indices are converted to slices of length one, their
+        dimensions are returned as well, so they can be dropped.
+        """
+        if slices is None:
+            slices = ()
+        elif not isinstance(slices, tuple):
+            slices = (slices,)
+
+        ndim = len(self.shape)
+
+        if any(_ is Ellipsis for _ in slices):
+            idx = [_ is Ellipsis for _ in slices].index(True)
+            fill = (slice(None),) * (ndim - len(slices) + 1)
+            slices = slices[:idx] + fill + slices[idx + 1 :]
+
+        slices = slices + (slice(None),) * (ndim - len(slices))
+
+        bounds, drop = [], []
+
+        for dim, (value, n) in enumerate(zip(slices, self.shape)):
+            if isinstance(value, slice):
+                start, stop, step = value.indices(n)
+                if step != 1:
+                    raise ValueError("Only contiguous slices are supported.")
+                stop = max(start, stop)
+            else:
+                start = int(value) + n if value < 0 else int(value)
+                if not 0 <= start < n:
+                    raise IndexError(f"Index {value} out of range for size {n}")
+                stop = start + 1
+                drop.append(dim)
+
+            bounds.append((start, stop))
+
+        return bounds, tuple(drop)
+
+    def _iter_chunks(self, bounds):
+        """Iterate over the chunks overlapping with the given bounds.
+
+        Yields the chunk index and the matching slices into the chunk and
+        into the array covering the bounds.
+        """
+        ranges = [
+            range(start // size, -(-stop // size))
+            for (start, stop), size in zip(bounds, self.chunks)
+        ]
+
+        for idx in itertools.product(*ranges):
+            slices_chunk, slices_data = [], []
+
+            for jdx, (start, stop), size in zip(idx, bounds, self.chunks):
+                offset = jdx * size
+                lo, hi = max(start, offset), min(stop, offset + size)
+                slices_chunk.append(slice(lo - offset, hi - offset))
+                slices_data.append(slice(lo - start, hi - start))
+
+            yield idx, tuple(slices_chunk), tuple(slices_data)
+
+    def read(self, slices=None):
+        """Read map data.
+
+        Only the chunks overlapping with the requested part are read.
+
+        Parameters
+        ----------
+        slices : tuple of slice or int
+            Index into the map data array. Only contiguous slices, integers
+            and ``Ellipsis`` are supported. By default all data is read.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Data array.
+        """
+        bounds, drop = self._get_bounds(slices)
+        data = np.empty([stop - start for start, stop in bounds], dtype=self.dtype)
+
+        for idx, slices_chunk, slices_data in self._iter_chunks(bounds):
+            data[slices_data] = self._read_chunk(idx)[slices_chunk]
+
+        return np.squeeze(data, axis=drop)
+
+    def write(self, data, slices=None):
+        """Write map data.
+
+        Only the chunks overlapping with the given part are written. Chunks
+        that are only partially covered are read and updated, therefore
+        concurrent writers must use parts aligned with the chunk grid.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data array.
+        slices : tuple of slice or int
+            Index into the map data array, see `ChunkedMapStore.read`.
+        """
+        bounds, _ = self._get_bounds(slices)
+        shape = [stop - start for start, stop in bounds]
+        data = np.asarray(data, dtype=self.dtype)
+
+        if data.size == np.prod(shape):
+            data = data.reshape(shape)
+        else:
+            data = np.broadcast_to(data, shape)
+
+        for idx, slices_chunk, slices_data in self._iter_chunks(bounds):
+            is_covered = all(
+                s.start == 0 and s.stop >= min(size, n - jdx * size)
+                for s, size, n, jdx in zip(slices_chunk, self.chunks, self.shape, idx)
+            )
+
+            if is_covered:
+                chunk = np.zeros(self.chunks, dtype=self.dtype)
+            else:
+                chunk = self._read_chunk(idx).copy()
+
+            chunk[slices_chunk] = data[slices_data]
+            self._write_chunk(idx, chunk)
+
+    def to_map(self):
+        """Read the full map.
+
+        Returns
+        -------
+        map : `~gammapy.maps.Map`
+            Map object.
+        """
+        return Map.from_geom(
+            self.geom, data=self.read(), unit=self.unit, meta=self.meta
+        )
+
+    def read_map(self, slices=None, cutout=None):
+        """Read the map or a part of it.
+
+        Only the chunks overlapping with the requested part are read.
+
+        Parameters
+        ----------
+        slices : dict
+            Dict of axes names and integers or `slice` object pairs, see
+            `~gammapy.maps.Map.slice_by_idx`. Axes not defined by the map
+            are ignored.
+        cutout : dict
+            Cutout parameters ``position``, ``width`` and optionally
+            ``mode``, see `~gammapy.maps.WcsNDMap.cutout`. Only supported
+            for WCS maps.
+
+        Returns
+        -------
+        map_out : `~gammapy.maps.Map`
+            Map object.
+        """
+        geom = self.geom
+        slices_spatial = (slice(None), slice(None))
+        slices_cutout = (Ellipsis,)
+
+        if cutout is not None:
+            if self.map_type != "wcs":
+                raise ValueError("Cutouts are only supported for WCS maps.")
+
+            geom = geom.cutout(**cutout)
+            slices_spatial = geom.cutout_info["parent-slices"]
+            slices_cutout = (Ellipsis,) + tuple(geom.cutout_info["cutout-slices"])
+
+        if slices is not None:
+            slices_axes = [slices.get(ax.name, slice(None)) for ax in geom.axes]
+            geom = geom.slice_by_idx(slices)
+        else:
+            slices_axes = [slice(None)] * len(geom.axes)
+
+        if self.map_type == "wcs":
+            slices_data = tuple(slices_axes[::-1]) + tuple(slices_spatial)
+        else:
+            slices_data = tuple(slices_axes[::-1]) + (Ellipsis,)
+
+        data = self.read(slices_data)
+
+        if cutout is not None:
+            data_cutout = np.zeros(shape=geom.data_shape, dtype=self.dtype)
+            data_cutout[slices_cutout] = data
+            data = data_cutout
+
+        return Map.from_geom(geom, data=data, unit=self.unit, meta=self.meta)
+
+    def slice_by_idx(self, slices):
+        """Read a sub map, see `~gammapy.maps.Map.slice_by_idx`.
+
+        Parameters
+        ----------
+        slices : dict
+            Dict of axes names and integers or `slice` object pairs.
+
+        Returns
+        -------
+        map_out : `~gammapy.maps.Map`
+            Sliced map object.
+        """
+        return self.read_map(slices=slices)
+
+    def cutout(self, position, width, mode="trim"):
+        """Read a cutout, see `~gammapy.maps.WcsNDMap.cutout`.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cutout region.
+        width : tuple of `~astropy.coordinates.Angle`
+            Angular sizes of the region in (lon, lat) in that specific order.
+            If only one value is passed, a square region is extracted.
+        mode : {'trim', 'partial', 'strict'}
+            Mode option for Cutout2D, for details see `~astropy.nddata.utils.Cutout2D`.
+
+        Returns
+        -------
+        cutout : `~gammapy.maps.WcsNDMap`
+            Cutout map
+        """
+        cutout = {"position": position, "width": width, "mode": mode}
+        return self.read_map(cutout=cutout)
+
+    def append(self, m, axis_name="energy"):
+        """Append a map along a non-spatial axis.
+
+        The new data is written before the geometry is updated, so readers
+        see either the old or the extended map.
+
+        Parameters
+        ----------
+        m : `~gammapy.maps.Map`
+            Map to append, with the same spatial geometry and other axes.
+        axis_name : str
+            Name of the axis to append along.
+        """
+        geom = self.geom
+
+        if not m.geom.to_image() == geom.to_image():
+            raise ValueError("Spatial geometries must agree.")
+
+        axis = geom.axes[axis_name].append(m.geom.axes[axis_name])
+        axes = [axis if ax.name == axis_name else ax for ax in geom.axes]
+        geom_new = geom.to_image().to_cube(axes)
+
+        dim = geom.axes.index_data(axis_name)
+        slices = [slice(None)] * len(self.shape)
+        slices[dim] = slice(self.shape[dim], None)
+
+        self._info["shape"] = [int(_) for _ in geom_new.data_shape]
+        self.write(m.quantity.to_value(self.unit), tuple(slices))
+
+        _write_geom(self.path / "geom.fits", geom_new)
+        _write_json(self.path / "store.json", self._info)
+        self.geom = geom_new
+
+
+def _write_json(path, data):
+    path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    path_tmp.write_text(json.dumps(data))
+    os.replace(path_tmp, path)
+
+
+def _write_geom(path, geom):
+    hdulist = [fits.PrimaryHDU()]
+
+    if isinstance(geom, RegionGeom):
+        if geom.region is not None:
+            hdulist.append(fits.BinTableHDU(geom._to_region_table(), name="REGION"))
+        hdu = geom.axes[0].to_table_hdu(format="ogip")
+        hdu.name = "EBOUNDS"
+        hdulist.append(hdu)
+    else:
+        hdulist.append(fits.ImageHDU(header=geom.to_header(), name="GEOM"))
+        if geom.axes:
+            hdulist.append(geom.to_bands_hdu(hdu_skymap="GEOM"))
+
+    path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fits.HDUList(hdulist).writeto(str(path_tmp))
+    os.replace(path_tmp, path)
+
+
+def write_hdulist_chunked(hdulist, path, chunks=None, overwrite=False):
+    """Write a HDU list to a directory of chunked map stores.
+
+    Every image HDU is converted to a map and stored in a
+    `ChunkedMapStore` named after the HDU. All other HDUs, except the
+    bands tables of the maps, are written to ``tables.fits``.
+
+    Parameters
+    ----------
+    hdulist : `~astropy.io.fits.HDUList`
+        HDU list.
+    path : str or `~pathlib.Path`
+        Output directory.
+    chunks : dict
+        Chunk shapes by HDU name, see `ChunkedMapStore.create`.
+    overwrite : bool
+        Overwrite an existing directory.
+    """
+    path = make_path(path)
+
+    if path.exists():
+        if not overwrite:
+            raise IOError(f"Directory already exists: {path}")
+        shutil.rmtree(path)
+
+    path.mkdir(parents=True)
+    chunks = {} if chunks is None else chunks
+
+    names_map = [hdu.name for hdu in hdulist if isinstance(hdu, fits.ImageHDU)]
+    names_bands = [hdulist[name].header.get("BANDSHDU") for name in names_map]
+
+    for name in names_map:
+        m = Map.from_hdulist(hdulist, hdu=name)
+        ChunkedMapStore.from_map(
+            m, path / name.lower(), chunks=chunks.get(name.lower())
+        )
+
+    tables = [fits.PrimaryHDU()]
+
+    for hdu in hdulist[1:]:
+        if hdu.name not in names_map + names_bands:
+            tables.append(hdu)
+
+    fits.HDUList(tables).writeto(str(path / "tables.fits"))
+
+
+def read_hdulist_chunked(path, slices=None, cutout=None):
+    """Read a HDU list from a directory of chunked map stores.
+
+    See `write_hdulist_chunked`.
+
+    Parameters
+    ----------
+    path : str or `~pathlib.Path`
+        Input directory.
+    slices : dict
+        Slices applied to all maps, see `ChunkedMapStore.read_map`.
+    cutout : dict
+        Cutout applied to all maps, see `ChunkedMapStore.read_map`.
+
+    Returns
+    -------
+    hdulist : `~astropy.io.fits.HDUList`
+        HDU list.
+    """
+    path = make_path(path)
+    hdulist = fits.HDUList([fits.PrimaryHDU()])
+
+    for path_store in sorted(path.iterdir()):
+        if (path_store / "store.json").exists():
+            store = ChunkedMapStore(path_store)
+            m = store.read_map(slices=slices, cutout=cutout)
+            hdulist += m.to_hdulist(hdu=path_store.name)[1:]
+
+    with fits.open(str(path / "tables.fits"), memmap=False) as tables:
+        for hdu in tables[1:]:
+            hdulist.append(hdu.copy())
+
+    return hdulist
@@ -162,7 +162,9 @@ class Map(abc.ABC):
             raise ValueError(f"Unrecognized map type: {map_type!r}")
 
     @staticmethod
-    def read(filename, hdu=None, hdu_bands=None, map_type="auto", format=None):
+    def read(
+        filename, hdu=None, hdu_bands=None, map_type="auto", format=None, memmap=False
+    ):
         """Read a map from a FITS file.
 
         Parameters
@@ -181,13 +183,36 @@ class Map(abc.ABC):
             with the format of the input file.  If map_type is 'auto'
             then an appropriate map type will be inferred from the
             input file.
+        memmap : bool
+            Whether to memory map the map data. The data array is then a
+            copy-on-write view of the file and only the pages that are
+            accessed, e.g. by slicing or a cutout, are read from disk. This
+            requires an uncompressed image HDU without data scaling.
 
         Returns
         -------
         map_out : `Map`
             Map object
+
+        Notes
+        -----
+        If ``filename`` is a directory, the map is read from a
+        `~gammapy.maps.ChunkedMapStore`. The store holds a single map, so
+        ``hdu`` and ``hdu_bands`` are not supported in this case.
         """
-        with fits.open(str(make_path(filename)), memmap=False) as hdulist:
+        path = make_path(filename)
+
+        if path.is_dir():
+            from .chunked import ChunkedMapStore
+
+            if hdu is not None or hdu_bands is not None:
+                raise ValueError(
+                    f"HDU selection is not supported for chunked map stores: {path}"
+                )
+
+            return ChunkedMapStore(path).to_map()
+
+        with fits.open(str(path), memmap=memmap) as hdulist:
             return Map.from_hdulist(hdulist, hdu, hdu_bands, map_type, format=format)
 
     @staticmethod
@@ -1113,12 +1138,19 @@ class Map(abc.ABC):
         map : `WcsNDMap`
             Map with energy dispersion applied.
         """
-        # TODO: either use sparse matrix mutiplication or something like edisp.is_diagonal
         if edisp is not None:
             loc = self.geom.axes.index("energy_true")
-            data = np.rollaxis(self.data, loc, len(self.data.shape))
-            data = np.dot(data, edisp.pdf_matrix)
-            data = np.rollaxis(data, -1, loc)
+            data_true = np.moveaxis(self.data, loc, 0)
+            bands = edisp.pdf_bands
+
+            dtype = np.result_type(self.data, edisp.pdf_matrix)
+            data = np.empty((len(bands),) + data_true.shape[1:], dtype=dtype)
+
+            # only the non-zero band of the matrix contributes to a reco bin
+            for idx, (band, values) in enumerate(bands):
+                data[idx] = np.tensordot(values, data_true[band], axes=1)
+
+            data = np.moveaxis(data, 0, loc)
             energy_axis = edisp.energy_axis.copy(name="energy")
         else:
             data = self.data
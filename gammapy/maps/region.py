@@ -7,6 +7,7 @@ from astropy.wcs import WCS
 from astropy.wcs.utils import proj_plane_pixel_area, wcs_to_celestial_frame
 from regions import FITSRegionParser, fits_region_objects_to_table
 from gammapy.utils.regions import (
+    RegionLabelImage,
     compound_region_to_list,
     list_to_compound_region,
     make_region,
@@ -121,7 +122,20 @@ class RegionGeom(Geom):
             raise ValueError("Region definition required.")
 
         coords = MapCoord.create(coords, frame=self.frame, axis_names=self.axes.names)
-        return self.region.contains(coords.skycoord, self.wcs)
+        return self._contains_skycoord(coords.skycoord)
+
+    def _contains_skycoord(self, skycoord):
+        # the union of several regions is evaluated in a single pass, instead
+        # of one containment test per region
+        try:
+            regions = compound_region_to_list(self.region)
+        except ValueError:
+            regions = [self.region]
+
+        if len(regions) > 1 and skycoord.ndim == 1:
+            return RegionLabelImage(regions, self.wcs).label(skycoord) >= 0
+
+        return self.region.contains(skycoord, self.wcs)
 
     def separation(self, position):
         return self.center_skydir.separation(position)
@@ -268,7 +282,7 @@ class RegionGeom(Geom):
         if self.region is None:
             pix = (0, 0)
         else:
-            in_region = self.region.contains(coords.skycoord, wcs=self.wcs)
+            in_region = self._contains_skycoord(coords.skycoord)
 
             x = np.zeros(coords.shape)
             x[~in_region] = np.nan
@@ -0,0 +1,113 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import astropy.units as u
+from gammapy.maps import ChunkedMapStore, Map, MapAxis, WcsGeom
+
+
+@pytest.fixture
+def wcs_map():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(npix=(10, 8), binsz=0.1, axes=[axis])
+    m = Map.from_geom(geom, unit="cm-2 s-1", meta={"spam": "ham"})
+    m.data = np.arange(m.data.size, dtype=float).reshape(m.data.shape)
+    return m
+
+
+def test_chunked_map_store_wcs(tmp_path, wcs_map):
+    store = ChunkedMapStore.from_map(wcs_map, tmp_path / "store", chunks=(1, 3, 4))
+
+    assert store.shape == (3, 8, 10)
+    assert store.chunks == (1, 3, 4)
+    assert len(list((tmp_path / "store" / "chunks").iterdir())) == 27
+
+    m = ChunkedMapStore(tmp_path / "store").to_map()
+    assert m.geom == wcs_map.geom
+    assert m.unit == "cm-2 s-1"
+    assert m.meta == {"spam": "ham"}
+    assert_allclose(m.data, wcs_map.data)
+
+    m = Map.read(tmp_path / "store")
+    assert_allclose(m.data, wcs_map.data)
+
+    with pytest.raises(ValueError):
+        Map.read(tmp_path / "store", hdu="COUNTS")
+
+    with pytest.raises(IOError):
+        ChunkedMapStore.from_map(wcs_map, tmp_path / "store")
+
+
+def test_chunked_map_store_read_write(tmp_path, wcs_map):
+    store = ChunkedMapStore.from_map(wcs_map, tmp_path / "store", chunks=(1, 3, 4))
+
+    assert_allclose(store.read((1, slice(2, 5))), wcs_map.data[1, 2:5])
+    assert_allclose(store.read((Ellipsis, -1)), wcs_map.data[..., -1])
+
+    store.write(-1, (slice(1, None), slice(2, 5), slice(3, 9)))
+    expected = wcs_map.data.copy()
+    expected[1:, 2:5, 3:9] = -1
+    assert_allclose(store.read(), expected)
+
+    with pytest.raises(ValueError):
+        store.read(slice(None, None, 2))
+
+    empty = ChunkedMapStore.create(tmp_path / "empty", geom=wcs_map.geom)
+    assert_allclose(empty.read(), 0)
+
+
+def test_chunked_map_store_slice_cutout(tmp_path, wcs_map):
+    store = ChunkedMapStore.from_map(wcs_map, tmp_path / "store", chunks=(1, 3, 4))
+
+    actual = store.slice_by_idx({"energy": slice(1, 3)})
+    expected = wcs_map.slice_by_idx({"energy": slice(1, 3)})
+    assert actual.geom == expected.geom
+    assert_allclose(actual.data, expected.data)
+
+    position = wcs_map.geom.center_skydir
+    actual = store.cutout(position=position, width=0.35 * u.deg, mode="partial")
+    expected = wcs_map.cutout(position=position, width=0.35 * u.deg, mode="partial")
+    assert actual.geom == expected.geom
+    assert_allclose(actual.data, expected.data)
+
+    actual = store.read_map(
+        slices={"energy": 1}, cutout={"position": position, "width": 0.35 * u.deg}
+    )
+    expected = wcs_map.cutout(position=position, width=0.35 * u.deg)
+    expected = expected.slice_by_idx({"energy": 1})
+    assert actual.geom == expected.geom
+    assert_allclose(actual.data, expected.data)
+
+
+def test_chunked_map_store_append(tmp_path, wcs_map):
+    first = wcs_map.slice_by_idx({"energy": slice(0, 2)})
+    second = wcs_map.slice_by_idx({"energy": slice(2, 3)})
+
+    store = ChunkedMapStore.from_map(first, tmp_path / "store", chunks=(3, 3, 4))
+    store.append(second, axis_name="energy")
+
+    assert store.shape == (3, 8, 10)
+
+    m = ChunkedMapStore(tmp_path / "store").to_map()
+    assert m.geom.axes["energy"] == wcs_map.geom.axes["energy"]
+    assert_allclose(m.data, wcs_map.data)
+
+
+def test_chunked_map_store_hpx_region(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+
+    m = Map.create(nside=4, map_type="hpx", axes=[axis])
+    m.data = np.arange(m.data.size, dtype=float).reshape(m.data.shape)
+    ChunkedMapStore.from_map(m, tmp_path / "hpx", chunks=(1, 50))
+    actual = Map.read(tmp_path / "hpx")
+    assert actual.geom == m.geom
+    assert_allclose(actual.data, m.data)
+
+    m = Map.create(
+        region="icrs;circle(83.63, 21.51, 1)", map_type="region", axes=[axis]
+    )
+    m.data = np.arange(m.data.size, dtype=float).reshape(m.data.shape)
+    ChunkedMapStore.from_map(m, tmp_path / "region")
+    actual = Map.read(tmp_path / "region")
+    assert actual.geom.axes[0] == m.geom.axes[0]
+    assert_allclose(actual.data, m.data)
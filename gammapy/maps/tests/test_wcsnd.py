@@ -9,7 +9,7 @@ from astropy.io import fits
 from astropy.table import Table
 from regions import CircleSkyRegion, PointSkyRegion, RectangleSkyRegion
 from gammapy.datasets.map import MapEvaluator
-from gammapy.irf import EnergyDependentMultiGaussPSF, PSFKernel
+from gammapy.irf import EDispKernel, EnergyDependentMultiGaussPSF, PSFKernel
 from gammapy.maps import Map, MapAxis, MapCoord, WcsGeom, WcsNDMap
 from gammapy.maps.utils import fill_poisson
 from gammapy.modeling.models import (
@@ -768,6 +768,29 @@ def test_reduce():
     assert_allclose(m3.data[0][0][0][0], 4.0)
 
 
+def test_apply_edisp():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=20, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.3 TeV", "30 TeV", nbin=8)
+    edisp = EDispKernel.from_gauss(
+        energy_true=energy_axis_true.edges,
+        energy=energy_axis.edges,
+        sigma=0.2,
+        bias=0.1,
+    )
+
+    geom = WcsGeom.create(npix=(4, 3), axes=[energy_axis_true])
+    m = Map.from_geom(geom, data=np.random.RandomState(0).rand(*geom.data_shape))
+
+    m_reco = m.apply_edisp(edisp)
+
+    assert m_reco.geom.axes[0].name == "energy"
+    assert m_reco.data.shape == (8, 3, 4)
+    expected = np.einsum("ijk,il->ljk", m.data, edisp.pdf_matrix)
+    assert_allclose(m_reco.data, expected, rtol=1e-12)
+
+
 def test_to_cube():
     ax1 = MapAxis.from_nodes([1, 2, 3, 4], name="ax1")
     ax2 = MapAxis.from_edges([5, 6], name="ax2")
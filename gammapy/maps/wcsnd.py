@@ -622,8 +622,10 @@ class WcsNDMap(WcsMap):
                 )
 
         geom = self.geom.copy()
+        psf_kernel = None
 
         if isinstance(kernel, PSFKernel):
+            psf_kernel = kernel
             kmap = kernel.psf_kernel_map
             if not np.allclose(
                 self.geom.pixel_scales.deg, kmap.geom.pixel_scales.deg, rtol=1e-5
@@ -633,8 +635,6 @@ class WcsNDMap(WcsMap):
             if self.geom.is_image:
                 geom = geom.to_cube([kmap.geom.axes[0]])
 
-        convolved_data = np.empty(geom.data_shape, dtype=np.float32)
-
         shape_axes_kernel = kernel.shape[slice(0, -2)]
 
         if len(shape_axes_kernel) > 0:
@@ -643,6 +643,13 @@ class WcsNDMap(WcsMap):
                     f"Incompatible shape between data {geom.shape_axes} and kernel {shape_axes_kernel}"
                 )
 
+        if psf_kernel is not None and use_fft and kwargs == {"mode": "same"}:
+            # transform all planes at once, re-using the cached kernel FFTs
+            convolved_data = psf_kernel.fftconvolve(self.data)
+            return self._init_copy(data=convolved_data, geom=geom)
+
+        convolved_data = np.empty(geom.data_shape, dtype=np.float32)
+
         if self.geom.is_image and kernel.ndim == 3:
             for idx in range(kernel.shape[0]):
                 convolved_data[idx] = conv_function(
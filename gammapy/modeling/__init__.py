@@ -4,3 +4,4 @@ from .covariance import *
 from .fit import *
 from .parameter import *
 from .sampling import *
+from .toys import *
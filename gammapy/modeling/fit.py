@@ -68,23 +68,38 @@ class Fit:
     Parameters
     ----------
     datasets : `Datasets`
-        Datasets
+        Datasets. The likelihood is evaluated with the `Datasets.stat_backend`,
+        e.g. in parallel over a pool of processes.
+    store_trace : bool
+        Whether to store the trace of the optimization.
+    use_gradient : bool
+        Whether to pass the gradient of the likelihood (`Datasets.stat_sum_gradient`)
+        to the "minuit" and "scipy" optimizers, instead of letting them estimate
+        derivatives by finite differences of the likelihood.
     """
 
-    def __init__(self, datasets, store_trace=False):
+    def __init__(self, datasets, store_trace=False, use_gradient=False):
         from gammapy.datasets import Datasets
 
         self.store_trace = store_trace
+        self.use_gradient = use_gradient
         self.datasets = Datasets(datasets)
 
     @lazyproperty
     def _parameters(self):
-        return self.datasets.parameters
+        parameters = self.datasets.parameters
+        parameters.pack()
+        return parameters
 
     @lazyproperty
     def _models(self):
         return self.datasets.models
 
+    @property
+    def _stat_session(self):
+        """Session of the likelihood evaluation backend of the datasets"""
+        return self.datasets.stat_backend.session(self.datasets)
+
     def run(self, backend="minuit", optimize_opts=None, covariance_opts=None):
         """
         Run all fitting steps.
@@ -165,12 +180,16 @@ class Fit:
         # TODO: change this calling interface!
         # probably should pass a fit statistic, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
-        factors, info, optimizer = compute(
-            parameters=parameters,
-            function=self.datasets.stat_sum,
-            store_trace=self.store_trace,
-            **kwargs,
-        )
+        gradient = self.datasets.stat_sum_gradient if self.use_gradient else None
+
+        with self._stat_session:
+            factors, info, optimizer = compute(
+                parameters=parameters,
+                function=self.datasets.stat_sum,
+                gradient=gradient,
+                store_trace=self.store_trace,
+                **kwargs,
+            )
 
         # TODO: Change to a stateless interface for minuit also, or if we must support
         # stateful backends, put a proper, backend-agnostic solution for this.
@@ -190,9 +209,13 @@ class Fit:
         # Copy final results into the parameters object
         parameters.set_parameter_factors(factors)
         parameters.check_limits()
+
+        with self._stat_session:
+            total_stat = self.datasets.stat_sum()
+
         return OptimizeResult(
             parameters=parameters,
-            total_stat=self.datasets.stat_sum(),
+            total_stat=total_stat,
             backend=backend,
             method=kwargs.get("method", backend),
             trace=trace,
@@ -218,7 +241,7 @@ class Fit:
         parameters = self._parameters
 
         # TODO: wrap MINUIT in a stateless backend
-        with parameters.restore_values:
+        with parameters.restore_values, self._stat_session:
             if backend == "minuit":
                 method = "hesse"
                 if hasattr(self, "minuit"):
@@ -280,7 +303,7 @@ class Fit:
         parameter = parameters[parameter]
 
         # TODO: wrap MINUIT in a stateless backend
-        with parameters.restore_values:
+        with parameters.restore_values, self._stat_session:
             if backend == "minuit":
                 if hasattr(self, "minuit"):
                     # This is ugly. We will access parameters and make a copy
@@ -362,7 +385,7 @@ class Fit:
 
         stats = []
         fit_results = []
-        with parameters.restore_values:
+        with parameters.restore_values, self._stat_session:
             for value in values:
                 parameter.value = value
                 if reoptimize:
@@ -413,7 +436,7 @@ class Fit:
 
         stats = []
         fit_results = []
-        with parameters.restore_values:
+        with parameters.restore_values, self._stat_session:
             for x_value, y_value in itertools.product(x_values, y_values):
                 # TODO: Remove log.info() and provide a nice progress bar
                 log.info(f"Processing: x={x_value}, y={y_value}")
@@ -22,8 +22,11 @@ class MinuitLikelihood(Likelihood):
 
         return total_stat
 
+    def grad(self, *factors):
+        return self.fcn_gradient(factors)
 
-def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
+
+def optimize_iminuit(parameters, function, store_trace=False, gradient=None, **kwargs):
     """iminuit optimization
 
     Parameters
@@ -32,6 +35,9 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
         Parameters with starting values
     function : callable
         Likelihood function
+    gradient : callable, optional
+        Gradient of the likelihood function. If given, it is passed
+        to `iminuit.Minuit` instead of using numerical derivatives.
     **kwargs : dict
         Options passed to `iminuit.Minuit` constructor. If there is an entry 'migrad_opts', those options
         will be passed to `iminuit.Minuit.migrad()`.
@@ -49,7 +55,12 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
     kwargs.setdefault("print_level", 0)
     kwargs.update(make_minuit_par_kwargs(parameters))
 
-    minuit_func = MinuitLikelihood(function, parameters, store_trace=store_trace)
+    minuit_func = MinuitLikelihood(
+        function, parameters, store_trace=store_trace, gradient=gradient
+    )
+
+    if gradient is not None:
+        kwargs["grad"] = minuit_func.grad
 
     kwargs = kwargs.copy()
     migrad_opts = kwargs.pop("migrad_opts", {})
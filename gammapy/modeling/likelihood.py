@@ -1,5 +1,4 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-
 __all__ = ["Likelihood"]
 
 
@@ -21,10 +20,14 @@ class Likelihood:
         Parameters with starting values
     function : callable
         Likelihood function
+    gradient : callable, optional
+        Gradient of the likelihood function with respect to
+        the values of the free parameters.
     """
 
-    def __init__(self, function, parameters, store_trace):
+    def __init__(self, function, parameters, store_trace, gradient=None):
         self.function = function
+        self.gradient = gradient
         self.parameters = parameters
         self.trace = []
         self.store_trace = store_trace
@@ -45,3 +48,7 @@ class Likelihood:
             self.store_trace_iteration(total_stat)
 
         return total_stat
+
+    def fcn_gradient(self, factors):
+        self.parameters.set_parameter_factors(factors)
+        return self.gradient() * self.parameters.free_parameters.scales
@@ -105,6 +105,40 @@ class Model:
         """A deep copy."""
         return copy.deepcopy(self)
 
+    @staticmethod
+    def _derivative(function, parameter, epsilon=1e-4):
+        """Derivative of ``function()`` with respect to the parameter value.
+
+        Computed with central finite differences, using a step size
+        of ``epsilon`` relative to the parameter value.
+
+        Parameters
+        ----------
+        function : callable
+            Function without arguments, returning a `~astropy.units.Quantity`.
+        parameter : `~gammapy.modeling.Parameter`
+            Parameter
+        epsilon : float
+            Relative step size.
+
+        Returns
+        -------
+        derivative : `~astropy.units.Quantity`
+            Derivative, in units of the function value per parameter unit.
+        """
+        value = parameter.value
+        step = epsilon * np.abs(value) if value != 0 else epsilon
+
+        try:
+            parameter.value = value + step
+            upper = function()
+            parameter.value = value - step
+            lower = function()
+        finally:
+            parameter.value = value
+
+        return (upper - lower) / (2 * step * parameter.unit)
+
     def to_dict(self, full_output=False):
         """Create dict for YAML serialisation"""
         tag = self.tag[0] if isinstance(self.tag, list) else self.tag
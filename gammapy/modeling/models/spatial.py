@@ -159,6 +159,68 @@ class SpatialModel(Model):
             data = values * geom.solid_angle()
         return Map.from_geom(geom=geom, data=data.value, unit=data.unit)
 
+    def integrate_geom_gradient(self, geom, parameters=None):
+        """Derivatives of the integrated model with respect to the parameter values.
+
+        If the model defines the derivatives ``evaluate_gradient``, those are
+        integrated the same way as the model in `SpatialModel.integrate_geom`.
+        For all other parameters, e.g. of models without analytical derivatives,
+        the derivatives are computed with central finite differences of
+        `SpatialModel.integrate_geom`.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            Geometry
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for. By default the free
+            parameters of the model.
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives of the integral value in each spatial bin, one per parameter.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        analytical = {}
+
+        if hasattr(self, "evaluate_gradient"):
+            if isinstance(geom, RegionGeom):
+                wcs_geom = geom.to_wcs_geom().to_image()
+                mask = geom.contains(wcs_geom.get_coord())
+            else:
+                wcs_geom, mask = geom, None
+
+            coords = wcs_geom.to_image().get_coord(frame=self.frame)
+            kwargs = {par.name: par.quantity for par in self.parameters}
+            derivatives = self.evaluate_gradient(coords.lon, coords.lat, **kwargs)
+            solid_angle = wcs_geom.solid_angle()
+
+            for name, value in derivatives.items():
+                value = value * solid_angle
+
+                if mask is not None:
+                    value = value[mask].sum()
+
+                value = Map.from_geom(geom=geom, data=value.value, unit=value.unit)
+                analytical[name] = value.quantity
+
+        def integral():
+            return self.integrate_geom(geom).quantity
+
+        gradient = []
+
+        for par in parameters:
+            if par.name in analytical:
+                derivative = analytical[par.name]
+            else:
+                derivative = self._derivative(integral, par)
+            gradient.append(derivative)
+
+        return gradient
+
     def to_dict(self, full_output=False):
         """Create dict for YAML serilisation"""
         data = super().to_dict(full_output)
@@ -345,6 +407,53 @@ class PointSpatialModel(SpatialModel):
         data = self._grid_weights(x, y, x0, y0)
         return Map.from_geom(geom=geom_image, data=data, unit="")
 
+    def integrate_geom_gradient(self, geom, parameters=None):
+        """Derivatives of the integrated model with respect to the parameter values.
+
+        The derivatives of the pixel weights with respect to the pixel position
+        of the source are computed analytically. They are multiplied with the
+        derivatives of the pixel position with respect to ``lon_0`` and ``lat_0``,
+        which are computed with central differences of the WCS projection.
+
+        Parameters
+        ----------
+        geom : `Geom`
+            Map geometry
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for. By default the free
+            parameters of the model.
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives of the integral value in each pixel, one per parameter.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        geom_image = geom.to_image()
+        x, y = geom_image.get_pix()
+        x0, y0 = self.position.to_pixel(geom.wcs)
+
+        dx, dy = x - x0, y - y0
+        weights_x = np.where(np.abs(dx) < 1, 1 - np.abs(dx), 0)
+        weights_y = np.where(np.abs(dy) < 1, 1 - np.abs(dy), 0)
+
+        # derivatives of the weights with respect to x0 and y0
+        d_x0 = np.where(np.abs(dx) < 1, np.sign(dx), 0) * weights_y
+        d_y0 = np.where(np.abs(dy) < 1, np.sign(dy), 0) * weights_x
+
+        def pixel():
+            return u.Quantity(self.position.to_pixel(geom.wcs))
+
+        gradient = []
+
+        for par in parameters:
+            jacobian = self._derivative(pixel, par, epsilon=1e-6)
+            gradient.append(d_x0 * jacobian[0] + d_y0 * jacobian[1])
+
+        return gradient
+
     def to_region(self, **kwargs):
         """Model outline (`~regions.PointSkyRegion`)."""
         return PointSkyRegion(center=self.position, **kwargs)
@@ -404,6 +513,49 @@ class GaussianSpatialModel(SpatialModel):
         exponent = -0.5 * ((1 - np.cos(sep)) / a)
         return u.Quantity(norm * np.exp(exponent).value, "sr-1", copy=False)
 
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, sigma, e, phi):
+        """Derivatives of the model w.r.t. the parameters.
+
+        Only the derivatives w.r.t. ``lon_0``, ``lat_0`` and ``sigma`` of the
+        symmetric model (``e = 0``) are computed analytically.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives by parameter name.
+        """
+        if e != 0:
+            return {}
+
+        value = GaussianSpatialModel.evaluate(lon, lat, lon_0, lat_0, sigma, e, phi)
+        value = value.to_value("sr-1")
+
+        lon = u.Quantity(lon, "deg").to_value("rad")
+        lat = u.Quantity(lat, "deg").to_value("rad")
+        lon_0, lat_0 = lon_0.to_value("rad"), lat_0.to_value("rad")
+        sigma = sigma.to_value("rad")
+
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        a = 1.0 - np.cos(sigma)
+        tail = np.exp(-1.0 / a) / (1.0 - np.exp(-1.0 / a))
+        d_exponent = value / (2 * a)
+
+        d_lon_0 = d_exponent * np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0)
+        d_lat_0 = d_exponent * (
+            np.sin(lat) * np.cos(lat_0)
+            - np.cos(lat) * np.sin(lat_0) * np.cos(lon - lon_0)
+        )
+        d_a = -1 / a + tail / a ** 2 + (1 - np.cos(sep)) / (2 * a ** 2)
+        d_sigma = value * np.sin(sigma) * d_a
+
+        unit = u.Unit("sr-1 rad-1")
+        return {
+            "lon_0": u.Quantity(d_lon_0, unit),
+            "lat_0": u.Quantity(d_lat_0, unit),
+            "sigma": u.Quantity(d_sigma, unit),
+        }
+
     def to_region(self, **kwargs):
         """Model outline (`~regions.EllipseSkyRegion`)."""
         minor_axis = Angle(self.sigma.quantity * np.sqrt(1 - self.e.quantity ** 2))
@@ -560,6 +712,59 @@ class DiskSpatialModel(SpatialModel):
         in_ellipse = DiskSpatialModel._evaluate_smooth_edge(sep - sigma_eff, edge)
         return u.Quantity(norm * in_ellipse, "sr-1", copy=False)
 
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, r_0, e, phi, edge):
+        """Derivatives of the model w.r.t. the parameters.
+
+        Only the derivatives of the symmetric model (``e = 0``) with a smooth
+        edge (``edge > 0``) w.r.t. ``lon_0``, ``lat_0``, ``r_0`` and ``edge``
+        are computed analytically.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives by parameter name.
+        """
+        if e != 0 or edge == 0:
+            return {}
+
+        lon = u.Quantity(lon, "deg").to_value("rad")
+        lat = u.Quantity(lat, "deg").to_value("rad")
+        lon_0, lat_0 = lon_0.to_value("rad"), lat_0.to_value("rad")
+        r_0, edge = r_0.to_value("rad"), edge.to_value("rad")
+
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        norm = 1 / (2 * np.pi * (1 - np.cos(r_0)))
+
+        edge_width_95 = 2.326174307353347
+        x = (sep - r_0) / edge
+        in_disk = 0.5 * (1 - scipy.special.erf(x * edge_width_95))
+        d_in_disk = -edge_width_95 / np.sqrt(np.pi) * np.exp(-(x * edge_width_95) ** 2)
+        d_sep = norm * d_in_disk / edge
+
+        sin_sep = np.sin(sep)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            d_lon_0 = -np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0) / sin_sep
+            d_lat_0 = -(
+                np.sin(lat) * np.cos(lat_0)
+                - np.cos(lat) * np.sin(lat_0) * np.cos(lon - lon_0)
+            ) / sin_sep
+
+        d_lon_0 = np.where(sin_sep > 0, d_sep * d_lon_0, 0)
+        d_lat_0 = np.where(sin_sep > 0, d_sep * d_lat_0, 0)
+        d_norm = -norm * np.sin(r_0) / (1 - np.cos(r_0))
+        d_r_0 = d_norm * in_disk - d_sep
+        d_edge = -x * d_sep
+
+        unit = u.Unit("sr-1 rad-1")
+        return {
+            "lon_0": u.Quantity(d_lon_0, unit),
+            "lat_0": u.Quantity(d_lat_0, unit),
+            "r_0": u.Quantity(d_r_0, unit),
+            "edge": u.Quantity(d_edge, unit),
+        }
+
     def to_region(self, **kwargs):
         """Model outline (`~regions.EllipseSkyRegion`)."""
         minor_axis = Angle(self.r_0.quantity * np.sqrt(1 - self.e.quantity ** 2))
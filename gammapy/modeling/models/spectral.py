@@ -10,7 +10,7 @@ from astropy.table import Table
 from gammapy.maps import MapAxis
 from gammapy.maps.utils import edges_from_lo_hi
 from gammapy.modeling import Parameter, Parameters
-from gammapy.utils.integrate import trapz_loglog
+from gammapy.utils.integrate import integrate_gauss_legendre, trapz_loglog
 from gammapy.utils.interpolation import (
     ScaledRegularGridInterpolator,
     interpolation_scale,
@@ -19,6 +19,29 @@ from gammapy.utils.scripts import make_path
 from .core import Model
 
 
+def _power_law_integral_derivative_index(energy_min, energy_max, index, reference):
+    """Derivative of the integral of ``(E / E_0) ^ -index`` with respect to the index"""
+    val = -1 * index + 1
+    x_min, x_max = (energy_min / reference).to(""), (energy_max / reference).to("")
+
+    upper = np.power(x_max, val)
+    lower = np.power(x_min, val)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        derivative = reference * (
+            (upper * np.log(x_max) - lower * np.log(x_min)) / val
+            - (upper - lower) / val ** 2
+        )
+
+    mask = np.isclose(val, 0)
+
+    if mask.any():
+        log_max, log_min = np.log(x_max), np.log(x_min)
+        derivative[mask] = (reference * (log_max ** 2 - log_min ** 2) / 2)[mask]
+
+    return -derivative
+
+
 def integrate_spectrum(func, energy_min, energy_max, ndecade=100):
     """Integrate 1d function using the log-log trapezoidal rule.
 
@@ -42,6 +65,156 @@ def integrate_spectrum(func, energy_min, energy_max, ndecade=100):
     return integral.sum(axis=0)
 
 
+def _upper_incomplete_gamma(s, x):
+    r"""Upper incomplete gamma function :math:`\Gamma(s, x)` for any real ``s``.
+
+    For ``s <= 0`` the recurrence relation
+    :math:`\Gamma(s, x) = (\Gamma(s + 1, x) - x^s e^{-x}) / s` is used,
+    starting from :math:`\Gamma(0, x) = E_1(x)` for integer ``s``.
+    """
+    s = float(s)
+    n_steps = max(int(np.floor(-s)) + 1, 0)
+
+    s_start = s + n_steps
+    value = scipy.special.gamma(s_start) * scipy.special.gammaincc(s_start, x)
+
+    for k in range(n_steps - 1, -1, -1):
+        s_k = s + k
+        if np.abs(s_k) < 1e-8:
+            value = scipy.special.exp1(x)
+        else:
+            value = (value - np.power(x, s_k) * np.exp(-x)) / s_k
+
+    return value
+
+
+def _exp_cutoff_power_law_integral(
+    energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+):
+    r"""Integrate exponential cutoff power law analytically.
+
+    For a negative ``lambda_`` the integral is computed numerically. With
+    :math:`s = (1 - \Gamma) / \alpha` the integral is given by
+
+    .. math::
+        F(E_{min}, E_{max}) = \frac{\phi_0 E_0}{\alpha} (\lambda E_0)^{\Gamma - 1}
+        \left[ \Gamma(s, (\lambda E_{min})^{\alpha})
+        - \Gamma(s, (\lambda E_{max})^{\alpha}) \right]
+    """
+    index = u.Quantity(index).to_value("")
+    alpha = u.Quantity(alpha).to_value("")
+    cutoff = (lambda_ * reference).to_value("")
+
+    if cutoff == 0:
+        return PowerLawSpectralModel.evaluate_integral(
+            energy_min, energy_max, index, amplitude, reference
+        )
+
+    if cutoff < 0:
+        # the closed form is only defined for a positive cutoff
+        def f(energy):
+            pwl = amplitude * (energy / reference) ** (-index)
+            return pwl * np.exp(-np.power((energy * lambda_).to_value(""), alpha))
+
+        return integrate_gauss_legendre(f, energy_min, energy_max)
+
+    s = (1 - index) / alpha
+    x_min = np.power((lambda_ * energy_min).to_value(""), alpha)
+    x_max = np.power((lambda_ * energy_max).to_value(""), alpha)
+
+    value = _upper_incomplete_gamma(s, x_min) - _upper_incomplete_gamma(s, x_max)
+    return amplitude * reference * np.power(cutoff, index - 1) / alpha * value
+
+
+def _log_parabola_integral(energy_min, energy_max, amplitude, reference, alpha, beta):
+    r"""Integrate log parabola analytically.
+
+    With :math:`x = \ln(E / E_0)` the integrand is a Gaussian in :math:`x`
+
+    .. math::
+        F(E_{min}, E_{max}) = \phi_0 E_0 \int_{x_{min}}^{x_{max}}
+        \exp((1 - \alpha) x - \beta x^2) dx
+
+    which is computed with the scaled complementary error function for
+    :math:`\beta > 0`, to avoid cancellation in the tails, and the Dawson
+    function for :math:`\beta < 0`.
+    """
+    alpha = u.Quantity(alpha).to_value("")
+    beta = u.Quantity(beta).to_value("")
+
+    if beta == 0:
+        return PowerLawSpectralModel.evaluate_integral(
+            energy_min, energy_max, alpha, amplitude, reference
+        )
+
+    x_min = np.log((energy_min / reference).to_value(""))
+    x_max = np.log((energy_max / reference).to_value(""))
+
+    exp_min = np.exp((1 - alpha) * x_min - beta * x_min ** 2)
+    exp_max = np.exp((1 - alpha) * x_max - beta * x_max ** 2)
+
+    sqrt_beta = np.sqrt(np.abs(beta))
+    x_peak = (1 - alpha) / (2 * beta)
+    t_min, t_max = sqrt_beta * (x_min - x_peak), sqrt_beta * (x_max - x_peak)
+
+    if beta < 0:
+        dawsn = scipy.special.dawsn
+        value = (exp_max * dawsn(t_max) - exp_min * dawsn(t_min)) / sqrt_beta
+    else:
+        erfcx = scipy.special.erfcx
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            above = exp_min * erfcx(t_min) - exp_max * erfcx(t_max)
+            below = exp_max * erfcx(-t_max) - exp_min * erfcx(-t_min)
+            erf = scipy.special.erf(t_max) - scipy.special.erf(t_min)
+            around = np.exp(beta * x_peak ** 2) * erf
+
+        value = np.where(t_min >= 0, above, np.where(t_max <= 0, below, around))
+        value = np.sqrt(np.pi) / (2 * sqrt_beta) * value
+
+    return amplitude * reference * value
+
+
+def _exp_cutoff_power_law_gradient(energy, index, norm, reference, lambda_, alpha):
+    """Derivatives of ``norm * (E / E_0) ^ -index * exp(-(lambda E) ^ alpha)``
+
+    The derivative with respect to the normalisation is returned as "norm".
+    """
+    x = (energy / reference).to_value("")
+    cutoff = (energy * lambda_).to_value("")
+    cutoff_alpha = np.power(cutoff, alpha)
+    shape = np.power(x, -index) * np.exp(-cutoff_alpha)
+    value = norm * shape
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_cutoff = np.where(cutoff > 0, np.log(cutoff), 0)
+
+    return {
+        "norm": shape,
+        "index": -np.log(x) * value,
+        "reference": index / reference * value,
+        "lambda_": -alpha * energy * np.power(cutoff, alpha - 1) * value,
+        "alpha": -cutoff_alpha * log_cutoff * value,
+    }
+
+
+def _log_parabola_gradient(energy, norm, reference, alpha, beta):
+    """Derivatives of ``norm * (E / E_0) ^ (-alpha - beta * ln(E / E_0))``
+
+    The derivative with respect to the normalisation is returned as "norm".
+    """
+    log_x = np.log((energy / reference).to_value(""))
+    shape = np.exp(-alpha * log_x - beta * log_x ** 2)
+    value = norm * shape
+
+    return {
+        "norm": shape,
+        "reference": (alpha + 2 * beta * log_x) / reference * value,
+        "alpha": -log_x * value,
+        "beta": -log_x ** 2 * value,
+    }
+
+
 class SpectralModel(Model):
     """Spectral model base class."""
 
@@ -137,6 +310,15 @@ class SpectralModel(Model):
         q = self(energy)
         return u.Quantity([q.value, f_err], unit=q.unit)
 
+    @property
+    def has_fast_integral(self):
+        """Whether the integral is computed without `integrate_spectrum` (bool).
+
+        This is the case for models defining ``evaluate_integral``, i.e. a
+        closed form or vectorised integral, or overriding `integral`.
+        """
+        return hasattr(self, "evaluate_integral")
+
     def integral(self, energy_min, energy_max, **kwargs):
         r"""Integrate spectral model numerically if no analytical solution defined.
 
@@ -158,6 +340,69 @@ class SpectralModel(Model):
         else:
             return integrate_spectrum(self, energy_min, energy_max, **kwargs)
 
+    def integral_gradient(self, energy_min, energy_max, parameters=None, **kwargs):
+        """Derivatives of the integral flux with respect to the parameter values.
+
+        If the model defines ``evaluate_integral_gradient``, the closed form
+        derivatives of the integral are used. Otherwise, if the model defines
+        the derivatives of the differential flux ``evaluate_gradient``, those
+        are integrated with `~gammapy.utils.integrate.integrate_gauss_legendre`.
+        For all other parameters, e.g. of models without analytical derivatives,
+        the derivatives are computed with central finite differences of
+        `SpectralModel.integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for. By default the free
+            parameters of the model.
+        **kwargs : dict
+            Keyword arguments passed to `SpectralModel.integral`
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives of the integral flux, one per parameter.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        analytical = {}
+        values = {par.name: par.quantity for par in self.parameters}
+        values = self._convert_evaluate_unit(values, energy_min)
+
+        if hasattr(self, "evaluate_integral_gradient"):
+            analytical = self.evaluate_integral_gradient(
+                energy_min, energy_max, **values
+            )
+        elif hasattr(self, "evaluate_gradient"):
+            for par in parameters:
+                if par is not getattr(self, par.name, None):
+                    continue
+
+                def derivative(energy, name=par.name):
+                    return self.evaluate_gradient(energy, **values)[name]
+
+                analytical[par.name] = integrate_gauss_legendre(
+                    derivative, energy_min, energy_max
+                )
+
+        def integral():
+            return self.integral(energy_min, energy_max, **kwargs)
+
+        gradient = []
+
+        for par in parameters:
+            if par.name in analytical and par is getattr(self, par.name, None):
+                derivative = analytical[par.name]
+            else:
+                derivative = self._derivative(integral, par)
+            gradient.append(derivative)
+
+        return gradient
+
     def integral_error(self, energy_min, energy_max):
         """Evaluate the error of the integral flux of a given spectrum in
         a given energy range.
@@ -493,6 +738,16 @@ class ConstantSpectralModel(SpectralModel):
         """Evaluate the model (static function)."""
         return np.ones(np.atleast_1d(energy).shape) * const
 
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, const):
+        """Integrate constant model analytically (static function)."""
+        return const * (energy_max - energy_min)
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, const):
+        """Compute energy flux in given energy range analytically (static function)."""
+        return const * (energy_max ** 2 - energy_min ** 2) / 2
+
 
 class CompoundSpectralModel(SpectralModel):
     """Arithmetic combination of two spectral models.
@@ -525,6 +780,59 @@ class CompoundSpectralModel(SpectralModel):
         val2 = self.model2(energy)
         return self.operator(val1, val2)
 
+    @property
+    def _is_linear(self):
+        return self.operator in [operator.add, operator.sub]
+
+    @property
+    def has_fast_integral(self):
+        """Whether the integral is computed without `integrate_spectrum` (bool)."""
+        return (
+            self._is_linear
+            and self.model1.has_fast_integral
+            and self.model2.has_fast_integral
+        )
+
+    def integral(self, energy_min, energy_max, **kwargs):
+        """Integrate compound model.
+
+        Sums and differences are integrated component wise, other
+        combinations numerically.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        **kwargs : dict
+            Keyword arguments passed to :func:`~gammapy.utils.integrate.integrate_spectrum`
+        """
+        if self._is_linear:
+            val1 = self.model1.integral(energy_min, energy_max, **kwargs)
+            val2 = self.model2.integral(energy_min, energy_max, **kwargs)
+            return self.operator(val1, val2)
+
+        return super().integral(energy_min, energy_max, **kwargs)
+
+    def energy_flux(self, energy_min, energy_max, **kwargs):
+        """Compute energy flux of compound model.
+
+        Sums and differences are integrated component wise, other
+        combinations numerically.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        **kwargs : dict
+            Keyword arguments passed to :func:`~gammapy.utils.integrate.integrate_spectrum`
+        """
+        if self._is_linear:
+            val1 = self.model1.energy_flux(energy_min, energy_max, **kwargs)
+            val2 = self.model2.energy_flux(energy_min, energy_max, **kwargs)
+            return self.operator(val1, val2)
+
+        return super().energy_flux(energy_min, energy_max, **kwargs)
+
     def to_dict(self, full_output=False):
         return {
             "type": self.tag[0],
@@ -604,6 +912,28 @@ class PowerLawSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, index, amplitude, reference):
+        """Derivatives of the power law integral w.r.t. amplitude and index (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives by parameter name.
+        """
+        d_amplitude = PowerLawSpectralModel.evaluate_integral(
+            energy_min, energy_max, index, 1, reference
+        )
+        d_index = _power_law_integral_derivative_index(
+            energy_min, energy_max, index, reference
+        )
+        return {"amplitude": d_amplitude, "index": amplitude * d_index}
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference):
         r"""Compute energy flux in given energy range analytically (static function).
@@ -708,6 +1038,17 @@ class PowerLawNormSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, tilt, norm, reference):
+        """Derivatives of the pwl integral w.r.t. norm and tilt (static function)."""
+        d_norm = PowerLawNormSpectralModel.evaluate_integral(
+            energy_min, energy_max, tilt, 1, reference
+        )
+        d_tilt = _power_law_integral_derivative_index(
+            energy_min, energy_max, tilt, reference
+        )
+        return {"norm": d_norm, "tilt": norm * d_tilt}
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, tilt, norm, reference):
         """Evaluate the energy flux (static function)"""
@@ -874,6 +1215,60 @@ class BrokenPowerLawSpectralModel(SpectralModel):
         bpwl[~cond] *= (energy[~cond] / ebreak) ** (-index2)
         return bpwl
 
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, index1, index2, amplitude, ebreak):
+        """Integrate broken power law analytically (static function).
+
+        The integration range is split at the break energy and both parts
+        are integrated as power laws, see
+        `PowerLawSpectralModel.evaluate_integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        below = PowerLawSpectralModel.evaluate_integral(
+            np.minimum(energy_min, ebreak),
+            np.minimum(energy_max, ebreak),
+            index1,
+            amplitude,
+            ebreak,
+        )
+        above = PowerLawSpectralModel.evaluate_integral(
+            np.maximum(energy_min, ebreak),
+            np.maximum(energy_max, ebreak),
+            index2,
+            amplitude,
+            ebreak,
+        )
+        return below + above
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, index1, index2, amplitude, ebreak):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        below = PowerLawSpectralModel.evaluate_energy_flux(
+            np.minimum(energy_min, ebreak),
+            np.minimum(energy_max, ebreak),
+            index1,
+            amplitude,
+            ebreak,
+        )
+        above = PowerLawSpectralModel.evaluate_energy_flux(
+            np.maximum(energy_min, ebreak),
+            np.maximum(energy_max, ebreak),
+            index2,
+            amplitude,
+            ebreak,
+        )
+        return below + above
+
 
 class SmoothBrokenPowerLawSpectralModel(SpectralModel):
     r"""Spectral smooth broken power-law model.
@@ -916,6 +1311,50 @@ class SmoothBrokenPowerLawSpectralModel(SpectralModel):
         brk = (1 + (energy / ebreak) ** ((index2 - index1) / beta)) ** (-beta)
         return pwl * brk
 
+    @staticmethod
+    def evaluate_integral(
+        energy_min, energy_max, index1, index2, amplitude, ebreak, reference, beta
+    ):
+        """Integrate smooth broken power law (static function).
+
+        The integral is a hypergeometric function, which has poles for
+        common parameter values, e.g. integer indices with ``beta = 1``.
+        Instead it is computed with Gauss-Legendre quadrature in log energy,
+        evaluating the model once for all integration ranges, see
+        `~gammapy.utils.integrate.integrate_gauss_legendre`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+
+        def f(energy):
+            return SmoothBrokenPowerLawSpectralModel.evaluate(
+                energy, index1, index2, amplitude, ebreak, reference, beta
+            )
+
+        return integrate_gauss_legendre(f, energy_min, energy_max)
+
+    @staticmethod
+    def evaluate_energy_flux(
+        energy_min, energy_max, index1, index2, amplitude, ebreak, reference, beta
+    ):
+        """Compute energy flux in given energy range (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+
+        def f(energy):
+            return energy * SmoothBrokenPowerLawSpectralModel.evaluate(
+                energy, index1, index2, amplitude, ebreak, reference, beta
+            )
+
+        return integrate_gauss_legendre(f, energy_min, energy_max)
+
 
 class PiecewiseNormSpectralModel(SpectralModel):
     """ Piecewise spectral correction
@@ -1038,6 +1477,64 @@ class ExpCutoffPowerLawSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference, lambda_, alpha):
+        """Derivatives of the model w.r.t. the parameters (static function).
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives by parameter name.
+        """
+        gradient = _exp_cutoff_power_law_gradient(
+            energy, index, amplitude, reference, lambda_, alpha
+        )
+        gradient["amplitude"] = gradient.pop("norm")
+        return gradient
+
+    @staticmethod
+    def evaluate_integral(
+        energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+    ):
+        r"""Integrate exponential cutoff power law analytically (static function).
+
+        With :math:`s = (1 - \Gamma) / \alpha` and the upper incomplete gamma
+        function :math:`\Gamma(s, x)`:
+
+        .. math::
+            F(E_{min}, E_{max}) = \frac{\phi_0 E_0}{\alpha} (\lambda E_0)^{\Gamma - 1}
+            \left[ \Gamma(s, (\lambda E)^{\alpha}) \right]_{E_{max}}^{E_{min}}
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        return _exp_cutoff_power_law_integral(
+            energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(
+        energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+    ):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return _exp_cutoff_power_law_integral(
+            energy_min,
+            energy_max,
+            index - 1,
+            amplitude * reference,
+            reference,
+            lambda_,
+            alpha,
+        )
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1094,6 +1591,43 @@ class ExpCutoffPowerLawNormSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, norm, reference, lambda_, alpha):
+        """Derivatives of the model w.r.t. the parameters (static function)."""
+        return _exp_cutoff_power_law_gradient(
+            energy, index, norm, reference, lambda_, alpha
+        )
+
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, index, norm, reference, lambda_, alpha):
+        """Integrate exponential cutoff power law analytically (static function).
+
+        See `ExpCutoffPowerLawSpectralModel.evaluate_integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        return _exp_cutoff_power_law_integral(
+            energy_min, energy_max, index, norm, reference, lambda_, alpha
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(
+        energy_min, energy_max, index, norm, reference, lambda_, alpha
+    ):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return _exp_cutoff_power_law_integral(
+            energy_min, energy_max, index - 1, norm * reference, reference, lambda_, alpha
+        )
+
 
 class ExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
     r"""Spectral exponential cutoff power-law model used for 3FGL.
@@ -1125,6 +1659,50 @@ class ExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
         cutoff = np.exp((reference - energy) / ecut)
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference, ecut):
+        """Derivatives of the model w.r.t. the parameters (static function)."""
+        x = (energy / reference).to_value("")
+        cutoff = np.exp(((reference - energy) / ecut).to_value(""))
+        shape = np.power(x, -index) * cutoff
+        value = amplitude * shape
+        return {
+            "index": -np.log(x) * value,
+            "amplitude": shape,
+            "reference": (index / reference + 1 / ecut) * value,
+            "ecut": (energy - reference) / ecut ** 2 * value,
+        }
+
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, index, amplitude, reference, ecut):
+        """Integrate exponential cutoff power law analytically (static function).
+
+        See `ExpCutoffPowerLawSpectralModel.evaluate_integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        amplitude = amplitude * np.exp((reference / ecut).to_value(""))
+        return _exp_cutoff_power_law_integral(
+            energy_min, energy_max, index, amplitude, reference, 1 / ecut, 1
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference, ecut):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        amplitude = amplitude * reference * np.exp((reference / ecut).to_value(""))
+        return _exp_cutoff_power_law_integral(
+            energy_min, energy_max, index - 1, amplitude, reference, 1 / ecut, 1
+        )
+
 
 class SuperExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
     r"""Spectral super exponential cutoff power-law model used for 3FGL.
@@ -1245,6 +1823,54 @@ class LogParabolaSpectralModel(SpectralModel):
         exponent = -alpha - beta * np.log(xx)
         return amplitude * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, amplitude, reference, alpha, beta):
+        """Derivatives of the model w.r.t. the parameters (static function).
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives by parameter name.
+        """
+        gradient = _log_parabola_gradient(energy, amplitude, reference, alpha, beta)
+        gradient["amplitude"] = gradient.pop("norm")
+        return gradient
+
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, amplitude, reference, alpha, beta):
+        r"""Integrate log parabola analytically (static function).
+
+        With :math:`x = \ln(E / E_0)` the model is a Gaussian in :math:`x`,
+        which is integrated using error functions:
+
+        .. math::
+            F(E_{min}, E_{max}) = \phi_0 E_0 \sqrt{\frac{\pi}{4 \beta}}
+            \exp\left(\frac{(1 - \alpha)^2}{4 \beta}\right)
+            \left[ erf\left(\sqrt{\beta} \left(x - \frac{1 - \alpha}{2 \beta}\right)\right)
+            \right]_{x_{min}}^{x_{max}}
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        return _log_parabola_integral(
+            energy_min, energy_max, amplitude, reference, alpha, beta
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, amplitude, reference, alpha, beta):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return _log_parabola_integral(
+            energy_min, energy_max, amplitude * reference, reference, alpha - 1, beta
+        )
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1297,6 +1923,39 @@ class LogParabolaNormSpectralModel(SpectralModel):
         exponent = -alpha - beta * np.log(xx)
         return norm * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, norm, reference, alpha, beta):
+        """Derivatives of the model w.r.t. the parameters (static function)."""
+        return _log_parabola_gradient(energy, norm, reference, alpha, beta)
+
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, norm, reference, alpha, beta):
+        """Integrate log parabola analytically (static function).
+
+        See `LogParabolaSpectralModel.evaluate_integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range
+        """
+        return _log_parabola_integral(
+            energy_min, energy_max, norm, reference, alpha, beta
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, norm, reference, alpha, beta):
+        """Compute energy flux in given energy range analytically (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return _log_parabola_integral(
+            energy_min, energy_max, norm * reference, reference, alpha - 1, beta
+        )
+
 
 class TemplateSpectralModel(SpectralModel):
     """A model generated from a table of energy and value arrays.
@@ -1433,6 +2092,11 @@ class ScaleSpectralModel(SpectralModel):
     def evaluate(self, energy, norm):
         return norm * self.model(energy)
 
+    @property
+    def has_fast_integral(self):
+        """Whether the integral is computed without `integrate_spectrum` (bool)."""
+        return self.model.has_fast_integral
+
     def integral(self, energy_min, energy_max, **kwargs):
         return self.norm.value * self.model.integral(energy_min, energy_max, **kwargs)
 
@@ -1796,6 +2460,11 @@ class GaussianSpectralModel(SpectralModel):
             * np.exp(-((energy - mean) ** 2) / (2 * sigma ** 2))
         )
 
+    @property
+    def has_fast_integral(self):
+        """Whether the integral is computed without `integrate_spectrum` (bool)."""
+        return True
+
     def integral(self, energy_min, energy_max, **kwargs):
         r"""Integrate Gaussian analytically.
 
@@ -15,6 +15,7 @@ from gammapy.modeling.models import (
     CompoundSpectralModel,
     ConstantSpectralModel,
     ConstantTemporalModel,
+    DiskSpatialModel,
     GaussianSpatialModel,
     Models,
     PointSpatialModel,
@@ -550,6 +551,96 @@ def test_sky_point_source():
     assert_allclose(flux.sum(), 1)
 
 
+def test_evaluator_cache_components(sky_model, exposure, psf, edisp, gti):
+    model = sky_model.copy(name="cache")
+    evaluator = MapEvaluator(model, exposure, psf=psf, edisp=edisp, gti=gti)
+    evaluator.compute_npred()
+
+    model.spectral_model.index.value = 2.2
+    npred = evaluator.compute_npred()
+
+    # spatial flux is re-used for a spectral-only change
+    assert evaluator._compute_flux_spatial.cache_info().hits == 1
+    assert evaluator._compute_flux_spectral.cache_info().misses == 1
+    assert evaluator._compute_temporal_norm.cache_info().hits == 1
+
+    evaluator_ref = MapEvaluator(
+        model, exposure, psf=psf, edisp=edisp, gti=gti, use_cache=False
+    )
+    assert_allclose(npred.data, evaluator_ref.compute_npred().data)
+
+    model.spatial_model.sigma.value = 2
+    evaluator.compute_npred()
+    assert evaluator._compute_flux_spatial.cache_info().misses == 1
+    assert evaluator._compute_flux_spectral.cache_info().hits == 1
+
+
+def test_evaluator_cache_rtol(sky_model, exposure, psf, edisp, gti):
+    model = sky_model.copy(name="cache-rtol")
+    evaluator = MapEvaluator(
+        model, exposure, psf=psf, edisp=edisp, gti=gti, cache_rtol=1e-6
+    )
+    npred = evaluator.compute_npred()
+
+    model.spectral_model.index.value *= 1 + 1e-8
+    npred_jitter = evaluator.compute_npred()
+    assert evaluator._compute_npred.cache_info().hits == 1
+    assert_allclose(npred_jitter.data, npred.data)
+
+    model.spectral_model.index.value *= 1.1
+    npred_changed = evaluator.compute_npred()
+    assert evaluator._compute_npred.cache_info().misses == 1
+    assert not np.allclose(npred_changed.data, npred.data)
+
+
+def test_evaluator_spatial_support():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2, name="energy_true")
+    geom = WcsGeom.create(
+        skydir=(0, 0), npix=(80, 60), binsz=0.02, frame="galactic", axes=[axis]
+    )
+    exposure = Map.from_geom(geom, unit="m2 s")
+    exposure.data += 1e6
+    psf = PSFKernel.from_gauss(geom, 0.05 * u.deg)
+
+    spatial_model = DiskSpatialModel(
+        lon_0="0.1 deg", lat_0="0 deg", r_0="0.2 deg", e=0.8, frame="galactic"
+    )
+    model = SkyModel(
+        spatial_model=spatial_model,
+        spectral_model=PowerLawSpectralModel(),
+        name="disk",
+    )
+
+    evaluator = MapEvaluator(model, exposure, psf=psf)
+    evaluator_ref = MapEvaluator(model, exposure, psf=psf, support_rtol=None)
+
+    def assert_npred_equal():
+        npred = evaluator.compute_npred().data
+        npred_ref = evaluator_ref.compute_npred().data
+        assert_allclose(npred, npred_ref, rtol=1e-5, atol=1e-6 * npred_ref.max())
+
+    assert_npred_equal()
+    support = evaluator._support
+    assert support["idx"][0].size < 0.2 * geom.data_shape[1] * geom.data_shape[2]
+
+    # small shifts re-use the support
+    model.spatial_model.lon_0.value += 0.01
+    assert_npred_equal()
+    assert evaluator._support is support
+
+    # the rotated disk reaches the border of the support
+    model.spatial_model.phi.value = 90
+    assert_npred_equal()
+    assert evaluator._support is not support
+    support = evaluator._support
+
+    model.spatial_model.lon_0.value -= 0.2
+    assert_npred_equal()
+    assert evaluator._support is not support
+    separation = evaluator._support["position"].separation(model.position)
+    assert_allclose(separation.deg, 0, atol=1e-10)
+
+
 @requires_data()
 def test_fermi_isotropic():
     filename = "$GAMMAPY_DATA/fermi_3fhl/iso_P8R2_SOURCE_V6_v06.txt"
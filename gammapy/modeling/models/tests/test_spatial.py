@@ -384,3 +384,45 @@ def test_integrate_geom_energy_axis():
 
 
 
+
+
+def assert_integrate_geom_gradient(model, geom):
+    parameters = model.parameters
+    gradient = model.integrate_geom_gradient(geom, parameters)
+
+    def integral():
+        return model.integrate_geom(geom).quantity
+
+    for par, derivative in zip(parameters, gradient):
+        expected = model._derivative(integral, par, epsilon=1e-5)
+        atol = 1e-6 * np.abs(expected.value).max()
+        assert_allclose(
+            derivative.to_value(expected.unit), expected.value, rtol=1e-4, atol=atol
+        )
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        PointSpatialModel(lon_0="0.23 deg", lat_0="0.11 deg", frame="galactic"),
+        GaussianSpatialModel(
+            lon_0="0.2 deg", lat_0="0.1 deg", sigma="0.3 deg", frame="galactic"
+        ),
+        DiskSpatialModel(
+            lon_0="0.2 deg", lat_0="0.1 deg", r_0="0.4 deg", edge="0.1 deg", frame="galactic"
+        ),
+    ],
+)
+def test_integrate_geom_gradient(model):
+    geom = WcsGeom.create(skydir=(0, 0), npix=40, binsz=0.05, frame="galactic")
+    assert_integrate_geom_gradient(model, geom)
+
+
+def test_integrate_geom_gradient_region():
+    center = SkyCoord("0.1 deg", "0.1 deg", frame="galactic")
+    geom = RegionGeom(region=CircleSkyRegion(center, 0.3 * u.deg))
+
+    model = GaussianSpatialModel(
+        lon_0="0.2 deg", lat_0="0.15 deg", sigma="0.2 deg", frame="galactic"
+    )
+    assert_integrate_geom_gradient(model, geom)
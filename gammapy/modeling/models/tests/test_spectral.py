@@ -22,10 +22,12 @@ from gammapy.modeling.models import (
     PowerLaw2SpectralModel,
     PowerLawNormSpectralModel,
     PowerLawSpectralModel,
+    ScaleSpectralModel,
     SmoothBrokenPowerLawSpectralModel,
     SuperExpCutoffPowerLaw4FGLSpectralModel,
     TemplateSpectralModel,
 )
+from gammapy.modeling.models.spectral import integrate_spectrum
 from gammapy.utils.testing import (
     assert_quantity_allclose,
     mpl_plot_check,
@@ -98,8 +100,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(1.080321705479446, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(3.765838739678921, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(9.901735870666526, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(3.7658833775247835, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(9.901910949450345, "TeV cm-2 s-1"),
         e_peak=4 * u.TeV,
     ),
     dict(
@@ -111,8 +113,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(1.080321705479446, ""),
-        integral_1_10TeV=u.Quantity(3.765838739678921, "TeV"),
-        eflux_1_10TeV=u.Quantity(9.901735870666526, "TeV2"),
+        integral_1_10TeV=u.Quantity(3.7658833775247835, "TeV"),
+        eflux_1_10TeV=u.Quantity(9.901910949450345, "TeV2"),
     ),
     dict(
         name="ecpl_3fgl",
@@ -123,8 +125,8 @@ TEST_MODELS = [
             ecut=10 * u.TeV,
         ),
         val_at_2TeV=u.Quantity(0.7349563611124971, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.6034046173089, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(5.340285560055799, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.603428691884947, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(5.3403569133262, "TeV cm-2 s-1"),
     ),
     dict(
         name="plsec_4fgl",
@@ -148,8 +150,8 @@ TEST_MODELS = [
             beta=0.5 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.255791433530135, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(3.9588300406806014, "TeV cm-2 s-1"),
         e_peak=0.74082 * u.TeV,
     ),
     dict(
@@ -161,8 +163,8 @@ TEST_MODELS = [
             beta=0.5 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, ""),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "TeV"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV2"),
+        integral_1_10TeV=u.Quantity(2.255791433530135, "TeV"),
+        eflux_1_10TeV=u.Quantity(3.9588300406806014, "TeV2"),
     ),
     dict(
         name="logpar10",
@@ -173,8 +175,8 @@ TEST_MODELS = [
             beta=1.151292546497023 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.255791433530135, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(3.9588300406806014, "TeV cm-2 s-1"),
         e_peak=0.74082 * u.TeV,
     ),
     dict(
@@ -204,8 +206,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(0.81873075, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.83075297, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(6.41406327, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.830781886065703, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(6.414160096095526, "TeV cm-2 s-1"),
         e_peak=np.nan * u.TeV,
     ),
     dict(
@@ -229,8 +231,8 @@ TEST_MODELS = [
             alpha=0.8,
         ),
         val_at_2TeV=u.Quantity(0.871694294554192, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(3.026342, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(7.38652453, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(3.02636948090197, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(7.386616813638299, "TeV cm-2 s-1"),
         e_peak=1.7677669529663684 * u.TeV,
     ),
     dict(
@@ -256,8 +258,8 @@ TEST_MODELS = [
             beta=1,
         ),
         val_at_2TeV=u.Quantity(0.28284271247461906, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(0.9956923907948155, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(2.2372256145972207, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(0.9956997104619224, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(2.2372390807016784, "TeV cm-2 s-1"),
     ),
     dict(
         name="sbpl-hard",
@@ -270,8 +272,8 @@ TEST_MODELS = [
             beta=1,
         ),
         val_at_2TeV=u.Quantity(3.5355339059327378, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(13.522782989735022, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(40.06681812966845, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(13.522695006126161, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(40.066620434559944, "TeV cm-2 s-1"),
     ),
     dict(
         name="pbpl",
@@ -493,7 +495,52 @@ def test_ecpl_integrate():
     ecpl = ExpCutoffPowerLawSpectralModel()
     value = ecpl.integral(1 * u.TeV, 1.1 * u.TeV)
     assert value.isscalar
-    assert_quantity_allclose(value, 8.380714e-14 * u.Unit("s-1 cm-2"))
+    assert_quantity_allclose(value, 8.380788e-14 * u.Unit("s-1 cm-2"))
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ExpCutoffPowerLawSpectralModel(index=2.3, lambda_="0.5 TeV-1", alpha=0.7),
+        ExpCutoffPowerLawSpectralModel(index=0.5, lambda_="0.1 TeV-1", alpha=1.5),
+        ExpCutoffPowerLawSpectralModel(index=2.3, lambda_="-0.02 TeV-1"),
+        ExpCutoffPowerLawNormSpectralModel(index=0.3, lambda_="-0.02 TeV-1"),
+        ExpCutoffPowerLaw3FGLSpectralModel(index=2.0, ecut="3 TeV"),
+        ExpCutoffPowerLaw3FGLSpectralModel(index=2.5, ecut="-50 TeV"),
+        LogParabolaSpectralModel(alpha=2.3, beta=0.3, reference="1 TeV"),
+        LogParabolaSpectralModel(alpha=2.3, beta=-0.2, reference="1 TeV"),
+        LogParabolaNormSpectralModel(alpha=1.5, beta=0.05, reference="1 TeV"),
+        BrokenPowerLawSpectralModel(index1=1.5, index2=3, ebreak="2 TeV"),
+        SmoothBrokenPowerLawSpectralModel(index1=1.5, index2=3, ebreak="2 TeV"),
+        PowerLawSpectralModel() + ExpCutoffPowerLawSpectralModel(),
+    ],
+)
+def test_fast_integral(model):
+    energy = MapAxis.from_energy_bounds("0.01 TeV", "100 TeV", nbin=12).edges
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    assert model.has_fast_integral
+
+    value = model.integral(energy_min, energy_max)
+    expected = integrate_spectrum(model, energy_min, energy_max, ndecade=1e4)
+    assert_quantity_allclose(value, expected, rtol=1e-6)
+
+    value = model.energy_flux(energy_min, energy_max)
+    expected = integrate_spectrum(
+        lambda x: x * model(x), energy_min, energy_max, ndecade=1e4
+    )
+    assert_quantity_allclose(value, expected, rtol=1e-6)
+
+
+def test_fast_integral_compound():
+    pwl = PowerLawSpectralModel()
+    assert not (pwl * PowerLawNormSpectralModel()).has_fast_integral
+    assert not (pwl + table_model()).has_fast_integral
+    assert ScaleSpectralModel(pwl + pwl).has_fast_integral
+
+    compound = pwl - 0.5 * pwl.amplitude.quantity
+    value = compound.integral(1 * u.TeV, 2 * u.TeV)
+    assert_quantity_allclose(value, 0 * value.unit, atol=1e-25 * value.unit)
 
 
 def test_pwl_pivot_energy():
@@ -852,3 +899,56 @@ def test_energy_flux_error_exp_cutoff_power_law():
 
     assert_allclose(enrg_flux.value / 1e-12, 2.788, rtol=0.001)
     assert_allclose(enrg_flux_error.value / 1e-12, 1.419, rtol=0.001)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        PowerLawSpectralModel(index=2.3),
+        PowerLawNormSpectralModel(tilt=0.5),
+        ExpCutoffPowerLawSpectralModel(),
+        ExpCutoffPowerLawNormSpectralModel(lambda_="0.3 TeV-1"),
+        ExpCutoffPowerLaw3FGLSpectralModel(),
+        LogParabolaSpectralModel(reference="1 TeV"),
+        LogParabolaNormSpectralModel(beta=0.3),
+    ],
+)
+def test_integral_gradient(model):
+    energy = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=5).edges
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    parameters = model.parameters.free_parameters
+    gradient = model.integral_gradient(energy_min, energy_max, parameters)
+
+    def integral():
+        return model.integral(energy_min, energy_max)
+
+    for par, derivative in zip(parameters, gradient):
+        expected = model._derivative(integral, par, epsilon=1e-6)
+        assert_quantity_allclose(derivative, expected, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ExpCutoffPowerLawSpectralModel(alpha=1.5),
+        ExpCutoffPowerLawNormSpectralModel(),
+        ExpCutoffPowerLaw3FGLSpectralModel(),
+        LogParabolaSpectralModel(),
+        LogParabolaNormSpectralModel(reference="1 TeV"),
+    ],
+)
+def test_evaluate_gradient(model):
+    energy = [0.1, 1, 3, 30] * u.TeV
+
+    values = {par.name: par.quantity for par in model.parameters}
+    gradient = model.evaluate_gradient(energy, **values)
+
+    assert set(gradient) == set(model.parameters.names)
+
+    def evaluate():
+        return model(energy)
+
+    for par in model.parameters:
+        expected = model._derivative(evaluate, par, epsilon=1e-6)
+        assert_quantity_allclose(gradient[par.name], expected, rtol=1e-5)
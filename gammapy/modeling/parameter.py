@@ -8,7 +8,7 @@ import numpy as np
 from astropy import units as u
 from gammapy.utils.table import table_from_row_data
 
-__all__ = ["Parameter", "Parameters"]
+__all__ = ["Parameter", "ParameterArrays", "Parameters"]
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +32,33 @@ def _get_parameters_str(parameters):
     return str_.expandtabs(tabsize=2)
 
 
+class ParameterArrays:
+    """Contiguous arrays holding the data of a group of parameters.
+
+    Every `Parameter` stores its factor, scale, limits and frozen state
+    in one slot of a `ParameterArrays` object. By default a parameter owns
+    a single slot, `Parameters.pack` moves a group of parameters into
+    shared arrays, which are then read and written as whole vectors.
+
+    Parameters
+    ----------
+    size : int
+        Number of parameters
+    """
+
+    def __init__(self, size):
+        self.factor = np.zeros(size)
+        self.scale = np.ones(size)
+        self.min = np.full(size, np.nan)
+        self.max = np.full(size, np.nan)
+        self.frozen = np.zeros(size, dtype=bool)
+        # set as soon as one of the parameters is moved to other arrays
+        self.fragmented = False
+
+    def __len__(self):
+        return len(self.factor)
+
+
 class Parameter:
     """A model parameter.
 
@@ -65,6 +92,11 @@ class Parameter:
         Maximum (sometimes used in fitting)
     frozen : bool, optional
         Frozen? (used in fitting)
+
+    Notes
+    -----
+    The factor, scale, limits and frozen state are stored in a slot of
+    `ParameterArrays`, see `Parameters.pack`.
     """
 
     def __init__(
@@ -78,6 +110,8 @@ class Parameter:
         frozen=False,
         error=0,
     ):
+        self._arrays = ParameterArrays(1)
+        self._index = 0
         self.name = name
         self._link_label_io = None
         self.scale = scale
@@ -137,20 +171,20 @@ class Parameter:
     @property
     def factor(self):
         """Factor (float)."""
-        return self._factor
+        return float(self._arrays.factor[self._index])
 
     @factor.setter
     def factor(self, val):
-        self._factor = float(val)
+        self._arrays.factor[self._index] = float(val)
 
     @property
     def scale(self):
         """Scale (float)."""
-        return self._scale
+        return float(self._arrays.scale[self._index])
 
     @scale.setter
     def scale(self, val):
-        self._scale = float(val)
+        self._arrays.scale[self._index] = float(val)
 
     @property
     def unit(self):
@@ -164,11 +198,12 @@ class Parameter:
     @property
     def min(self):
         """Minimum (float)."""
-        return self._min
+        value = self._arrays.min[self._index]
+        return np.nan if np.isnan(value) else float(value)
 
     @min.setter
     def min(self, val):
-        self._min = float(val)
+        self._arrays.min[self._index] = float(val)
 
     @property
     def factor_min(self):
@@ -181,11 +216,12 @@ class Parameter:
     @property
     def max(self):
         """Maximum (float)."""
-        return self._max
+        value = self._arrays.max[self._index]
+        return np.nan if np.isnan(value) else float(value)
 
     @max.setter
     def max(self, val):
-        self._max = float(val)
+        self._arrays.max[self._index] = float(val)
 
     @property
     def factor_max(self):
@@ -198,22 +234,23 @@ class Parameter:
     @property
     def frozen(self):
         """Frozen? (used in fitting) (bool)."""
-        return self._frozen
+        return bool(self._arrays.frozen[self._index])
 
     @frozen.setter
     def frozen(self, val):
         if not isinstance(val, bool):
             raise TypeError(f"Invalid type: {val}, {type(val)}")
-        self._frozen = val
+        self._arrays.frozen[self._index] = val
 
     @property
     def value(self):
         """Value = factor x scale (float)."""
-        return self._factor * self._scale
+        arrays, idx = self._arrays, self._index
+        return float(arrays.factor[idx] * arrays.scale[idx])
 
     @value.setter
     def value(self, val):
-        self.factor = float(val) / self._scale
+        self._arrays.factor[self._index] = float(val) / self.scale
 
     @property
     def quantity(self):
@@ -321,6 +358,54 @@ class Parameters(collections.abc.Sequence):
             parameters = list(parameters)
 
         self._parameters = parameters
+        self._arrays_index = None
+
+    def _get_arrays_index(self):
+        """Shared `ParameterArrays` of all parameters and their slot indices.
+
+        Returns ``None`` if the parameters are not stored in the same arrays.
+        """
+        cached = self._arrays_index
+
+        if cached is not None and not cached[0].fragmented:
+            return cached
+
+        if not self._parameters:
+            return None
+
+        arrays = self._parameters[0]._arrays
+
+        for par in self._parameters:
+            if par._arrays is not arrays:
+                return None
+
+        index = np.array([par._index for par in self._parameters], dtype=int)
+        self._arrays_index = arrays, index
+        return self._arrays_index
+
+    def pack(self):
+        """Move the data of the parameters into contiguous arrays.
+
+        The parameter objects stay the same, only their factor, scale,
+        limits and frozen state are moved into shared `ParameterArrays`.
+        Afterwards vector access of all containers of these parameters,
+        e.g. `Parameters.values` or `Parameters.set_parameter_factors`,
+        reads and writes the arrays directly instead of looping over
+        the parameters.
+        """
+        parameters = list(dict.fromkeys(self._parameters))
+        arrays = ParameterArrays(len(parameters))
+
+        for idx, par in enumerate(parameters):
+            old, jdx = par._arrays, par._index
+
+            for name in ["factor", "scale", "min", "max", "frozen"]:
+                getattr(arrays, name)[idx] = getattr(old, name)[jdx]
+
+            old.fragmented = True
+            par._arrays, par._index = arrays, idx
+
+        self._arrays_index = None
 
     def check_limits(self):
         """Check parameter limits and emit a warning"""
@@ -335,6 +420,12 @@ class Parameters(collections.abc.Sequence):
     @property
     def values(self):
         """Parameter values (`numpy.ndarray`)."""
+        arrays_index = self._get_arrays_index()
+
+        if arrays_index is not None:
+            arrays, index = arrays_index
+            return arrays.factor[index] * arrays.scale[index]
+
         return np.array([_.value for _ in self._parameters], dtype=np.float64)
 
     @values.setter
@@ -343,9 +434,38 @@ class Parameters(collections.abc.Sequence):
         if not len(self) == len(values):
             raise ValueError("Values must have same length as parameter list")
 
+        arrays_index = self._get_arrays_index()
+
+        if arrays_index is not None:
+            arrays, index = arrays_index
+            arrays.factor[index] = np.asarray(values, dtype=float) / arrays.scale[index]
+            return
+
         for value, par in zip(values, self):
             par.value = value
 
+    @property
+    def factors(self):
+        """Parameter factors (`numpy.ndarray`)."""
+        arrays_index = self._get_arrays_index()
+
+        if arrays_index is not None:
+            arrays, index = arrays_index
+            return arrays.factor[index]
+
+        return np.array([_.factor for _ in self._parameters], dtype=np.float64)
+
+    @property
+    def scales(self):
+        """Parameter scales (`numpy.ndarray`)."""
+        arrays_index = self._get_arrays_index()
+
+        if arrays_index is not None:
+            arrays, index = arrays_index
+            return arrays.scale[index]
+
+        return np.array([_.scale for _ in self._parameters], dtype=np.float64)
+
     @classmethod
     def from_stack(cls, parameters_list):
         """Create `Parameters` by stacking a list of other `Parameters` objects.
@@ -447,6 +567,13 @@ class Parameters(collections.abc.Sequence):
 
         Used in the optimizer interface.
         """
+        arrays_index = self._get_arrays_index()
+
+        if arrays_index is not None:
+            arrays, index = arrays_index
+            arrays.factor[index[~arrays.frozen[index]]] = factors
+            return
+
         idx = 0
         for parameter in self._parameters:
             if not parameter.frozen:
@@ -12,9 +12,9 @@ __all__ = [
 ]
 
 
-def optimize_scipy(parameters, function, store_trace=False, **kwargs):
+def optimize_scipy(parameters, function, store_trace=False, gradient=None, **kwargs):
     method = kwargs.pop("method", "Nelder-Mead")
-    pars = [par.factor for par in parameters.free_parameters]
+    pars = parameters.free_parameters.factors
 
     bounds = []
     for par in parameters.free_parameters:
@@ -22,7 +22,11 @@ def optimize_scipy(parameters, function, store_trace=False, **kwargs):
         parmax = par.factor_max if not np.isnan(par.factor_max) else None
         bounds.append((parmin, parmax))
 
-    likelihood = Likelihood(function, parameters, store_trace)
+    likelihood = Likelihood(function, parameters, store_trace, gradient=gradient)
+
+    if gradient is not None:
+        kwargs["jac"] = likelihood.fcn_gradient
+
     result = scipy.optimize.minimize(
         likelihood.fcn, pars, bounds=bounds, method=method, **kwargs
     )
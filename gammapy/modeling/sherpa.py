@@ -29,7 +29,7 @@ class SherpaLikelihood(Likelihood):
         return total_stat, 0
 
 
-def optimize_sherpa(parameters, function, store_trace=False, **kwargs):
+def optimize_sherpa(parameters, function, store_trace=False, gradient=None, **kwargs):
     """Sherpa optimization wrapper method.
 
     Parameters
@@ -38,6 +38,8 @@ def optimize_sherpa(parameters, function, store_trace=False, **kwargs):
         Parameter list with starting values.
     function : callable
         Likelihood function
+    gradient : callable, optional
+        Gradient of the likelihood function. Not used by the Sherpa optimizers.
     **kwargs : dict
         Options passed to the optimizer instance.
 
@@ -1,9 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Unit tests for the Fit class"""
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from astropy.table import Table
-from gammapy.datasets import Dataset
+from gammapy.datasets import Dataset, Datasets
 from gammapy.modeling import Fit, Parameter
 from gammapy.modeling.models import Model, Models
 from gammapy.utils.testing import requires_dependency
@@ -231,3 +232,22 @@ def test_minos_contour():
 
     # Check that original value state wasn't changed
     assert_allclose(dataset.models.parameters["y"].value, 300)
+
+
+@pytest.mark.parametrize("stat_backend", ["threads", "processes"])
+def test_run_stat_backend(stat_backend):
+    dataset_1, dataset_2 = MyDataset(name="test-1"), MyDataset(name="test-2")
+    dataset_2._models = dataset_1.models
+    datasets = Datasets([dataset_1, dataset_2], stat_backend=stat_backend)
+    fit = Fit(datasets)
+    result = fit.run()
+    pars = result.parameters
+
+    assert result.success is True
+    assert_allclose(result.total_stat, 0, atol=1e-5)
+    assert_allclose(pars["y"].value, 3e2, rtol=1e-3)
+    assert_allclose(pars["y"].error, 1 / np.sqrt(2), rtol=1e-6)
+
+    profile = fit.stat_profile("x", values=[1, 2, 3])
+    assert_allclose(profile["stat_scan"], [2, 0, 2], atol=1e-5)
+    assert not datasets.stat_backend.is_open
@@ -163,6 +163,38 @@ def test_parameters_set_parameter_factors(pars):
     assert_allclose(pars["ham"].scale, 1)
 
 
+def test_parameters_pack():
+    par_1 = Parameter("spam", 2, scale=10, min=0)
+    par_2 = Parameter("ham", 3, frozen=True)
+    par_3 = Parameter("egg", 4)
+    pars = Parameters([par_1, par_2, par_3, par_1])
+    pars.pack()
+
+    assert par_1._arrays is par_3._arrays
+    assert_allclose(pars.values, [20, 3, 4, 20])
+    assert_allclose(pars.factors, [2, 3, 4, 2])
+    assert_allclose(pars.scales, [10, 1, 1, 10])
+    assert par_1.min == 0
+    assert par_2.frozen is True
+
+    pars.set_parameter_factors([5, 6, 5])
+    assert_allclose(pars.values, [50, 3, 6, 50])
+
+    # other containers of the same parameters use the arrays as well
+    pars_sub = Parameters([par_3, par_1])
+    pars_sub.values = [7, 8]
+    assert pars_sub._get_arrays_index() is not None
+    assert_allclose(par_1.factor, 0.8)
+    assert_allclose(pars.values, [8, 3, 7, 8])
+
+    # moving a parameter to other arrays falls back to the parameter objects
+    Parameters([par_3]).pack()
+    assert pars._get_arrays_index() is None
+    pars.values = [1, 2, 3, 1]
+    assert_allclose(pars.values, [1, 2, 3, 1])
+    assert_allclose(par_3.value, 3)
+
+
 def test_parameters_autoscale():
     pars = Parameters([Parameter("", 20)])
     pars.autoscale()
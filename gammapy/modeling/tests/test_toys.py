@@ -0,0 +1,62 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import astropy.units as u
+from gammapy.datasets import SpectrumDataset
+from gammapy.irf import EffectiveAreaTable
+from gammapy.maps import MapAxis, RegionGeom, RegionNDMap
+from gammapy.modeling import ToyStudy
+from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
+from gammapy.utils.testing import requires_dependency
+
+
+@pytest.fixture()
+def dataset():
+    energy = np.logspace(-1, 1, 11) * u.TeV
+    axis = MapAxis.from_edges(energy, name="energy", interp="log")
+    geom = RegionGeom(region=None, axes=[axis])
+
+    aeff = EffectiveAreaTable.from_constant(energy, "1 cm2").to_region_map(
+        region=None
+    )
+    model = SkyModel(
+        spectral_model=PowerLawSpectralModel(
+            index=2, amplitude=1e3 * u.Unit("cm-2 s-1 TeV-1"), reference=1 * u.TeV
+        ),
+        name="source",
+    )
+    mask_safe = RegionNDMap.from_geom(geom, dtype=bool)
+    mask_safe.data |= True
+
+    return SpectrumDataset(
+        models=model, exposure=aeff * (1 * u.s), mask_safe=mask_safe, name="test"
+    )
+
+
+@requires_dependency("iminuit")
+def test_toy_study(dataset):
+    study = ToyStudy([dataset], random_state=0)
+    table = study.run(n_toys=5)
+
+    assert_allclose(study.asimov_result.parameters["index"].value, 2, rtol=1e-3)
+    assert_allclose(study._true_values, dataset.models.parameters.values)
+    assert dataset.counts is None
+
+    assert len(table) == 5
+    assert table.colnames == [
+        "toy",
+        "success",
+        "nfev",
+        "stat",
+        "stat_true",
+        "source.spectral.index",
+        "source.spectral.amplitude",
+    ]
+    assert np.all(table["success"])
+    assert np.all(table["stat"] <= table["stat_true"] + 1e-6)
+    assert_allclose(np.mean(table["source.spectral.index"]), 2, rtol=0.05)
+
+    study = ToyStudy([dataset], random_state=0, n_jobs=2)
+    table_parallel = study.run(n_toys=5)
+    assert_allclose(table["stat"], table_parallel["stat"])
@@ -0,0 +1,208 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Monte-Carlo toy studies of fits."""
+import logging
+import numpy as np
+from gammapy.maps import Map
+from gammapy.utils.parallel import imap_ordered
+from gammapy.utils.table import table_from_row_data
+from .fit import Fit
+
+__all__ = ["ToyStudy"]
+
+log = logging.getLogger(__name__)
+
+
+class ToyStudy:
+    """Monte-Carlo toy study of a fit.
+
+    The predicted counts of the datasets for the current model parameters
+    (the Asimov datasets) are computed once and fitted, to obtain the
+    reference best-fit parameters. For every toy only the counts are
+    resampled from the Asimov prediction, while the exposure, PSF, energy
+    dispersion and the model evaluators are reused, and the fit is started
+    from the Asimov best fit. The statistic ``stat_true`` is evaluated at the
+    true parameter values, i.e. the model parameters before the Asimov fit.
+
+    For `~gammapy.datasets.MapDatasetOnOff` the counts and off counts are
+    resampled, using the current ``background`` as the true background.
+
+    Every toy gets its own random state, spawned from a
+    `~numpy.random.SeedSequence` with the root ``random_state`` by toy
+    index, so the results are identical for any number of processes.
+
+    Parameters
+    ----------
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets, with the models to simulate. The datasets are copied.
+    backend : str
+        Backend used for fitting, default : minuit
+    optimize_opts : dict
+        Options passed to `Fit.optimize`.
+    random_state : int
+        Root seed of the random states. By default a random root seed is
+        used, which is available as ``seed_sequence.entropy``.
+    n_jobs : int
+        Number of processes. By default the toys are fitted in the current
+        process.
+    """
+
+    def __init__(
+        self,
+        datasets,
+        backend="minuit",
+        optimize_opts=None,
+        random_state=None,
+        n_jobs=None,
+    ):
+        from gammapy.datasets import Datasets
+
+        self.datasets = Datasets(datasets).copy()
+        self.backend = backend
+        self.optimize_opts = optimize_opts or {}
+        self.seed_sequence = np.random.SeedSequence(random_state)
+        self.n_jobs = n_jobs
+
+        self._fit = None
+        self._npred = None
+        self._true_values = None
+        self._asimov_values = None
+        self.asimov_result = None
+
+    def __getstate__(self):
+        # the fit may hold a reference to the optimizer, it is
+        # re-created in every process
+        state = self.__dict__.copy()
+        state["_fit"] = None
+        return state
+
+    @property
+    def fit(self):
+        """Fit of the study datasets (`~gammapy.modeling.Fit`)"""
+        if self._fit is None:
+            self._fit = Fit(self.datasets)
+        return self._fit
+
+    @staticmethod
+    def _asimov_data(dataset):
+        if getattr(dataset, "counts_off", None) is not None:
+            npred_background = dataset.background.data
+            with np.errstate(invalid="ignore", divide="ignore"):
+                npred_off = np.nan_to_num(npred_background / dataset.alpha.data)
+
+            return {
+                "counts": dataset.npred_signal().data + npred_background,
+                "counts_off": npred_off,
+            }
+
+        return {"counts": dataset.npred().data}
+
+    def _set_data(self, data):
+        for dataset, values in zip(self.datasets, data):
+            for name, value in values.items():
+                m = getattr(dataset, name)
+
+                if m is None:
+                    setattr(dataset, name, Map.from_geom(dataset._geom, data=value))
+                else:
+                    m.data = value
+
+    def fit_asimov(self):
+        """Compute and fit the Asimov datasets.
+
+        Returns
+        -------
+        result : `~gammapy.modeling.fit.OptimizeResult`
+            Fit result of the Asimov datasets.
+        """
+        self._true_values = self.datasets.parameters.values.copy()
+        self._npred = [self._asimov_data(dataset) for dataset in self.datasets]
+        self._set_data(self._npred)
+
+        self.asimov_result = self.fit.optimize(
+            backend=self.backend, **self.optimize_opts
+        )
+        self._asimov_values = self.datasets.parameters.values.copy()
+        return self.asimov_result
+
+    @property
+    def _free_parameters(self):
+        models = self.datasets.models
+        names = models.parameters_unique_names
+        idx = [
+            idx for idx, par in enumerate(models.parameters) if not par.frozen
+        ]
+        return idx, [names[_] for _ in idx]
+
+    def run_toy(self, idx, seed_sequence):
+        """Simulate and fit a single toy.
+
+        Parameters
+        ----------
+        idx : int
+            Toy index.
+        seed_sequence : `~numpy.random.SeedSequence`
+            Seed sequence of the toy.
+
+        Returns
+        -------
+        row : dict
+            Toy index, fit statistic and best-fit parameter values.
+        """
+        random_state = np.random.RandomState(np.random.MT19937(seed_sequence))
+
+        data = [
+            {name: random_state.poisson(npred) for name, npred in values.items()}
+            for values in self._npred
+        ]
+        self._set_data(data)
+
+        parameters = self.datasets.parameters
+        parameters.values = self._true_values
+        stat_true = self.datasets.stat_sum()
+
+        # start the fit from the Asimov best fit
+        parameters.values = self._asimov_values
+        result = self.fit.optimize(backend=self.backend, **self.optimize_opts)
+
+        row = {
+            "toy": idx,
+            "success": result.success,
+            "nfev": result.nfev,
+            "stat": result.total_stat,
+            "stat_true": stat_true,
+        }
+
+        values = self.datasets.models.parameters.values
+        par_idx, names = self._free_parameters
+
+        for name, value in zip(names, values[par_idx]):
+            row[name] = value
+
+        return row
+
+    def run(self, n_toys):
+        """Run the toy study.
+
+        Parameters
+        ----------
+        n_toys : int
+            Number of toys.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            One row per toy, with the fit statistic at the best fit
+            (``stat``) and at the true parameter values (``stat_true``),
+            the fit status and the best-fit values of the free parameters.
+        """
+        if self.asimov_result is None:
+            self.fit_asimov()
+
+        seed_sequences = self.seed_sequence.spawn(n_toys)
+        args = zip(range(n_toys), seed_sequences)
+
+        if self.n_jobs and self.n_jobs > 1:
+            log.info(f"Fitting toys with {self.n_jobs} processes.")
+
+        rows = list(imap_ordered(self.run_toy, args, n_jobs=self.n_jobs))
+        return table_from_row_data(rows)
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Statistics."""
+from .asimov import *
 from .counts_statistic import *
 from .fit_statistics import *
 from .fit_statistics_cython import *
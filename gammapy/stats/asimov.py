@@ -0,0 +1,188 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+from .fit_statistics import cash, wstat
+
+__all__ = ["AsimovCountsStatistic"]
+
+
+def _bisect_log(fcn, target, shape, norm_min=1e-10, norm_max=1e10, n_iter=64):
+    """Find the roots of ``fcn(norm) = target`` by bisection in log space.
+
+    The function has to be increasing in ``norm`` and is evaluated for all
+    elements of ``shape`` at once. Where the target is not bracketed by
+    ``norm_min`` and ``norm_max`` NaN is returned.
+    """
+    lo = np.full(shape, np.log(norm_min))
+    hi = np.full(shape, np.log(norm_max))
+
+    bracketed = (fcn(np.exp(lo)) <= target) & (fcn(np.exp(hi)) >= target)
+
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        above = fcn(np.exp(mid)) > target
+        hi = np.where(above, mid, hi)
+        lo = np.where(above, lo, mid)
+
+    return np.where(bracketed, np.exp(0.5 * (lo + hi)), np.nan)
+
+
+class AsimovCountsStatistic:
+    """Expected statistics of Asimov datasets, i.e. with counts equal to the predicted counts.
+
+    The signal is given for a reference normalisation ``norm = 1`` and is
+    scaled linearly. The last axis of the inputs are the bins, which are
+    summed over, the leading axes define independent configurations, e.g.
+    source positions and spectral indices, which are all computed at once.
+
+    Parameters
+    ----------
+    mu_sig : `~numpy.ndarray`
+        Predicted signal counts for ``norm = 1``.
+    mu_bkg : `~numpy.ndarray`
+        Predicted background counts.
+    alpha : `~numpy.ndarray`
+        Exposure ratio between on and off region. If given the background is
+        measured with ``n_off = mu_bkg / alpha`` and the WStat statistic is
+        used, otherwise the background is known and Cash is used.
+    """
+
+    def __init__(self, mu_sig, mu_bkg, alpha=None):
+        self.mu_sig = np.asanyarray(mu_sig, dtype=float)
+        self.mu_bkg = np.asanyarray(mu_bkg, dtype=float)
+
+        if alpha is not None:
+            alpha = np.asanyarray(alpha, dtype=float)
+
+        self.alpha = alpha
+
+    @classmethod
+    def from_dataset(cls, dataset, models):
+        """Create from a dataset and a list of source models.
+
+        The background is computed once for the current models of the
+        dataset, see also `~gammapy.datasets.MapDataset.to_asimov`. The
+        signal is computed for every model, with the reference normalisation
+        given by the model parameters. Only bins within the dataset mask,
+        and with off measurement for on-off datasets, are used.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Dataset
+        models : list of `~gammapy.modeling.models.SkyModel`
+            Source models, one per configuration.
+
+        Returns
+        -------
+        stat : `AsimovCountsStatistic`
+            Asimov statistic, with one configuration per model.
+        """
+        if dataset.mask is not None:
+            mask = dataset.mask.data
+        else:
+            mask = np.ones(dataset._geom.data_shape, dtype=bool)
+
+        is_on_off = getattr(dataset, "counts_off", None) is not None
+
+        if is_on_off:
+            # bins without off measurement do not constrain the signal
+            mask = mask & (dataset.alpha.data > 0)
+            alpha = dataset.alpha.data[mask]
+            mu_bkg = dataset.background.data[mask]
+        else:
+            alpha = None
+            mu_bkg = dataset.npred_background().data[mask]
+
+        models_dataset = dataset.models
+
+        try:
+            mu_sig = []
+            for model in models:
+                dataset.models = [model]
+                mu_sig.append(dataset.npred_signal().data[mask])
+        finally:
+            dataset.models = models_dataset
+
+        return cls(mu_sig=np.array(mu_sig), mu_bkg=mu_bkg, alpha=alpha)
+
+    @property
+    def _shape(self):
+        return np.broadcast(self.mu_sig, self.mu_bkg).shape[:-1]
+
+    @property
+    def _shape_bins(self):
+        return np.broadcast(self.mu_sig, self.mu_bkg).shape
+
+    def _stat_sum(self, n_on, norm):
+        mu_sig = np.asanyarray(norm)[..., np.newaxis] * self.mu_sig
+
+        if self.alpha is None:
+            stat = cash(n_on, mu_sig + self.mu_bkg)
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                n_off = np.nan_to_num(self.mu_bkg / self.alpha)
+
+            stat = wstat(n_on, n_off, self.alpha, mu_sig, extra_terms=False)
+
+        return np.sum(stat, axis=-1)
+
+    def ts(self, norm=1):
+        """Expected TS of the signal with the given normalisation.
+
+        Parameters
+        ----------
+        norm : float or `~numpy.ndarray`
+            Signal normalisation.
+
+        Returns
+        -------
+        ts : `~numpy.ndarray`
+            Expected TS.
+        """
+        norm = np.broadcast_to(norm, self._shape)
+        n_on = norm[..., np.newaxis] * self.mu_sig + self.mu_bkg
+        ts = self._stat_sum(n_on, np.zeros(self._shape)) - self._stat_sum(n_on, norm)
+        return np.clip(ts, 0, None)
+
+    def norm_matching_significance(self, significance=5):
+        """Signal normalisation for which the expected significance is reached.
+
+        Multiplied with the reference flux of the signal this is the
+        discovery flux.
+
+        Parameters
+        ----------
+        significance : float
+            Significance, default is 5.
+
+        Returns
+        -------
+        norm : `~numpy.ndarray`
+            Signal normalisation.
+        """
+        return _bisect_log(self.ts, significance ** 2, self._shape)
+
+    def norm_upper_limit(self, n_sigma=2):
+        """Median expected upper limit on the signal normalisation.
+
+        Computed for the background only Asimov dataset, as the normalisation
+        for which the fit statistic increases by ``n_sigma ** 2``.
+
+        Parameters
+        ----------
+        n_sigma : float
+            Confidence level of the upper limit expressed in number of sigma.
+            Default is 2.
+
+        Returns
+        -------
+        norm : `~numpy.ndarray`
+            Upper limit on the signal normalisation.
+        """
+        n_on = np.broadcast_to(self.mu_bkg, self._shape_bins)
+        stat_null = self._stat_sum(n_on, np.zeros(self._shape))
+
+        def delta_stat(norm):
+            return self._stat_sum(n_on, norm) - stat_null
+
+        return _bisect_log(delta_stat, n_sigma ** 2, self._shape)
@@ -1,14 +1,124 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import abc
 import numpy as np
-from scipy.optimize import brentq, newton
 from scipy.stats import chi2
 from .fit_statistics import cash, get_wstat_mu_bkg, wstat
 
 __all__ = ["WStatCountsStatistic", "CashCountsStatistic"]
 
 
+def _root_illinois(
+    fcn, lower, upper, xtol=2e-12, rtol=4 * np.finfo(float).eps, max_iter=100
+):
+    """Find the roots of ``fcn`` for many brackets at once.
+
+    Uses the Illinois variant of the regula falsi method. Every element keeps
+    its own bracket and is removed from the iteration once converged, so
+    ``fcn(x, index)`` is only evaluated for the elements ``index`` of the
+    flat input arrays which are still active.
+
+    Parameters
+    ----------
+    fcn : callable
+        Function ``fcn(x, index)``, with ``index`` an integer index array.
+    lower, upper : `~numpy.ndarray`
+        Lower and upper bounds of the brackets, 1D arrays.
+    xtol, rtol : float
+        Absolute and relative tolerance on the bracket width.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    root : `~numpy.ndarray`
+        Roots, NaN where the bracket does not contain a sign change.
+    """
+    lower = np.array(lower, dtype=float)
+    upper = np.array(upper, dtype=float)
+
+    index = np.arange(lower.size)
+    f_lower, f_upper = fcn(lower, index), fcn(upper, index)
+
+    with np.errstate(invalid="ignore"):
+        bracketed = np.sign(f_lower) * np.sign(f_upper) <= 0
+
+    root = np.where(f_lower == 0, lower, upper)
+    active = index[bracketed & (f_lower != 0) & (f_upper != 0)]
+
+    # side of the bracket updated in the last iteration
+    side = np.zeros(lower.size, dtype=int)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+
+        a, b = lower[active], upper[active]
+        fa, fb = f_lower[active], f_upper[active]
+
+        x = (a * fb - b * fa) / (fb - fa)
+        x = np.where(np.isfinite(x), x, 0.5 * (a + b))
+        fx = fcn(x, active)
+
+        is_upper = np.sign(fx) == np.sign(fb)
+        # Illinois step: halve the function value of the end which is kept twice
+        fa = np.where(is_upper & (side[active] == 1), 0.5 * fa, fa)
+        fb = np.where(~is_upper & (side[active] == -1), 0.5 * fb, fb)
+
+        lower[active] = np.where(is_upper, a, x)
+        upper[active] = np.where(is_upper, x, b)
+        f_lower[active] = np.where(is_upper, fa, fx)
+        f_upper[active] = np.where(is_upper, fx, fb)
+        side[active] = np.where(is_upper, 1, -1)
+
+        width = np.abs(upper[active] - lower[active])
+        converged = (fx == 0) | (width <= xtol + rtol * np.abs(x)) | (x == root[active])
+        root[active] = x
+        active = active[~converged]
+
+    return np.where(bracketed, root, np.nan)
+
+
 class CountsStatistic(abc.ABC):
+    """Base class for counts statistics.
+
+    The uncertainties, upper limits and excess matching a significance are
+    computed for all elements at once, in chunks of at most ``chunk_size``
+    elements to limit the memory usage.
+    """
+
+    chunk_size = 1000000
+
+    @property
+    @abc.abstractmethod
+    def _arrays(self):
+        """Arrays to initialise the statistic with (dict)"""
+        pass
+
+    @property
+    def _shape(self):
+        return np.broadcast(*self._arrays.values()).shape
+
+    def _apply_chunked(self, fcn, *args):
+        """Apply ``fcn(stat, *args)`` to flat chunks of the statistic.
+
+        Returns an array with the broadcast shape of the inputs.
+        """
+        shape = self._shape
+        arrays = {
+            name: np.broadcast_to(value, shape).ravel()
+            for name, value in self._arrays.items()
+        }
+
+        size = int(np.prod(shape))
+        result = np.empty(size)
+
+        for start in range(0, size, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            stat = self.__class__(**{name: _[chunk] for name, _ in arrays.items()})
+            result[chunk] = fcn(stat, *args)
+
+        return result.reshape(shape)
+
     @property
     def ts(self):
         """Return stat difference (TS) of measured excess versus no excess."""
@@ -36,24 +146,18 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errn = np.zeros_like(self.n_on, dtype="float")
-        min_range = self.n_sig - 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errn, flags=["multi_index"])
-        while not it.finished:
-            try:
-                res = brentq(
-                    self._stat_fcn,
-                    min_range[it.multi_index],
-                    self.n_sig[it.multi_index],
-                    args=(self.stat_max[it.multi_index] + n_sigma ** 2, it.multi_index),
-                )
-                errn[it.multi_index] = res - self.n_sig[it.multi_index]
-            except ValueError:
-                errn[it.multi_index] = -self.n_on[it.multi_index]
-            it.iternext()
-
-        return errn
+        return self._apply_chunked(CountsStatistic._compute_errn, n_sigma)
+
+    def _compute_errn(self, n_sigma):
+        n_sig = self.n_sig
+        min_range = n_sig - 2 * n_sigma * (self.error + 1)
+        stat_ref = self.stat_max + n_sigma ** 2
+
+        def fcn(mu, index):
+            return self._stat_fcn(mu, stat_ref[index], index)
+
+        res = _root_illinois(fcn, min_range, n_sig)
+        return np.where(np.isnan(res), -self.n_on, res - n_sig)
 
     def compute_errp(self, n_sigma=1):
         """Compute upward excess uncertainties.
@@ -65,20 +169,17 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errp = np.zeros_like(self.n_on, dtype="float")
-        max_range = self.n_sig + 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errp, flags=["multi_index"])
-        while not it.finished:
-            errp[it.multi_index] = brentq(
-                self._stat_fcn,
-                self.n_sig[it.multi_index],
-                max_range[it.multi_index],
-                args=(self.stat_max[it.multi_index] + n_sigma ** 2, it.multi_index),
-            )
-            it.iternext()
+        return self._apply_chunked(CountsStatistic._compute_errp, n_sigma)
 
-        return errp - self.n_sig
+    def _compute_errp(self, n_sigma):
+        n_sig = self.n_sig
+        max_range = n_sig + 2 * n_sigma * (self.error + 1)
+        stat_ref = self.stat_max + n_sigma ** 2
+
+        def fcn(mu, index):
+            return self._stat_fcn(mu, stat_ref[index], index)
+
+        return _root_illinois(fcn, n_sig, max_range) - n_sig
 
     def compute_upper_limit(self, n_sigma=3):
         """Compute upper limit on the signal.
@@ -91,24 +192,17 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the upper limit expressed in number of sigma. Default is 3.
         """
-        ul = np.zeros_like(self.n_on, dtype="float")
+        return self._apply_chunked(CountsStatistic._compute_upper_limit, n_sigma)
 
+    def _compute_upper_limit(self, n_sigma):
         min_range = np.maximum(0, self.n_sig)
         max_range = min_range + 2 * n_sigma * (self.error + 1)
-        it = np.nditer(ul, flags=["multi_index"])
+        stat_ref = self._stat_fcn(min_range, 0.0, Ellipsis) + n_sigma ** 2
 
-        while not it.finished:
-            TS_ref = self._stat_fcn(min_range[it.multi_index], 0.0, it.multi_index)
+        def fcn(mu, index):
+            return self._stat_fcn(mu, stat_ref[index], index)
 
-            ul[it.multi_index] = brentq(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                max_range[it.multi_index],
-                args=(TS_ref + n_sigma ** 2, it.multi_index),
-            )
-            it.iternext()
-
-        return ul
+        return _root_illinois(fcn, min_range, max_range)
 
     def n_sig_matching_significance(self, significance):
         """Compute excess matching a given significance.
@@ -125,21 +219,33 @@ class CountsStatistic(abc.ABC):
         n_sig : `numpy.ndarray`
             Excess
         """
-        n_sig = np.zeros_like(self.n_bkg, dtype="float")
-        it = np.nditer(n_sig, flags=["multi_index"])
+        return self._apply_chunked(
+            CountsStatistic._n_sig_matching_significance, significance
+        )
+
+    def _n_sig_matching_significance(self, significance, max_iter=100):
+        n_bkg = np.broadcast_to(self.n_bkg, self.n_on.shape).astype(float)
+        index = np.arange(n_bkg.size)
+
+        def fcn(n_sig, index):
+            return self._n_sig_matching_significance_fcn(n_sig, significance, index)
+
+        if significance < 0:
+            # the excess can not be smaller than minus the background
+            return _root_illinois(fcn, -n_bkg, np.zeros_like(n_bkg))
+
+        upper = 2 * np.sqrt(n_bkg) * significance + significance ** 2
 
-        while not it.finished:
-            try:
-                n_sig[it.multi_index] = newton(
-                    self._n_sig_matching_significance_fcn,
-                    np.sqrt(self.n_bkg[it.multi_index]) * significance,
-                    args=(significance, it.multi_index),
-                )
-            except:
-                n_sig[it.multi_index] = np.nan
+        # widen the brackets until they contain the root
+        for _ in range(max_iter):
+            index = index[fcn(upper[index], index) < 0]
 
-            it.iternext()
-        return n_sig
+            if index.size == 0:
+                break
+
+            upper[index] *= 2
+
+        return _root_illinois(fcn, np.zeros_like(n_bkg), upper)
 
 
 class CashCountsStatistic(CountsStatistic):
@@ -158,6 +264,10 @@ class CashCountsStatistic(CountsStatistic):
         self.n_on = np.asanyarray(n_on)
         self.mu_bkg = np.asanyarray(mu_bkg)
 
+    @property
+    def _arrays(self):
+        return {"n_on": self.n_on, "mu_bkg": self.mu_bkg}
+
     @property
     def n_bkg(self):
         """Expected background counts"""
@@ -217,6 +327,15 @@ class WStatCountsStatistic(CountsStatistic):
         else:
             self.mu_sig = np.asanyarray(mu_sig)
 
+    @property
+    def _arrays(self):
+        return {
+            "n_on": self.n_on,
+            "n_off": self.n_off,
+            "alpha": self.alpha,
+            "mu_sig": self.mu_sig,
+        }
+
     @property
     def n_bkg(self):
         """Known background computed alpha * n_off"""
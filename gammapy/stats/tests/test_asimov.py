@@ -0,0 +1,38 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+from numpy.testing import assert_allclose
+from gammapy.stats import AsimovCountsStatistic, CashCountsStatistic, WStatCountsStatistic
+
+
+def test_asimov_cash():
+    mu_sig = np.array([[10.0], [20.0]])
+    mu_bkg = np.array([5.0])
+    stat = AsimovCountsStatistic(mu_sig=mu_sig, mu_bkg=mu_bkg)
+
+    ts = stat.ts(norm=0.5)
+    expected = CashCountsStatistic(n_on=[10, 15], mu_bkg=5).ts
+    assert_allclose(ts, expected)
+
+    norm = stat.norm_matching_significance(5)
+    assert_allclose(stat.ts(norm), 25, rtol=1e-6)
+    assert_allclose(norm[0] / norm[1], 2, rtol=1e-6)
+
+    norm_ul = stat.norm_upper_limit(n_sigma=2)
+    assert_allclose(norm_ul * mu_sig[:, 0], [5.893762, 5.893762], rtol=1e-6)
+
+
+def test_asimov_wstat():
+    mu_sig = np.array([[10.0, 0.0], [5.0, 5.0]])
+    mu_bkg = np.array([5.0, 5.0])
+    alpha = np.array([0.2, 0.2])
+    stat = AsimovCountsStatistic(mu_sig=mu_sig, mu_bkg=mu_bkg, alpha=alpha)
+
+    ts = stat.ts(norm=1)
+    wstat = WStatCountsStatistic(n_on=[15, 5], n_off=[25, 25], alpha=0.2)
+    assert_allclose(ts[0], wstat.ts[0], rtol=1e-6)
+    assert ts[0] > ts[1]
+
+    norm = stat.norm_matching_significance(3)
+    assert_allclose(stat.ts(norm), 9, rtol=1e-6)
+
+    assert np.all(stat.norm_upper_limit() > 0)
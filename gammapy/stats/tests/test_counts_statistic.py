@@ -188,3 +188,31 @@ def test_wstat_excess_matching_significance(n_off, alpha, significance, result):
     excess = stat.n_sig_matching_significance(significance)
 
     assert_allclose(excess, result, rtol=1e-2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000000])
+def test_counts_statistic_chunked(chunk_size):
+    n_on = np.array([[1, 5, 10], [100, 1, 5]])
+    n_off = np.array([2, 1, 5])
+    alpha = 0.3
+
+    stat = WStatCountsStatistic(n_on, n_off, alpha)
+    stat.chunk_size = chunk_size
+
+    assert stat.compute_errn().shape == (2, 3)
+
+    for idx in np.ndindex(n_on.shape):
+        ref = WStatCountsStatistic(n_on[idx], n_off[idx[1]], alpha)
+        assert_allclose(stat.compute_errn()[idx], ref.compute_errn(), rtol=1e-8)
+        assert_allclose(stat.compute_errp()[idx], ref.compute_errp(), rtol=1e-8)
+        assert_allclose(
+            stat.compute_upper_limit()[idx], ref.compute_upper_limit(), rtol=1e-8
+        )
+
+    stat = CashCountsStatistic(0, [[1, 2], [100, 0.1]])
+    stat.chunk_size = chunk_size
+    excess = stat.n_sig_matching_significance(5)
+    assert_allclose(excess[0], [8.327276, 10.550546], atol=1e-3)
+    assert_allclose(excess[1, 0], 54.012755, atol=1e-3)
+
+    assert_allclose(stat.n_sig_matching_significance(0), 0)
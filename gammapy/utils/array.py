@@ -1,10 +1,16 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utility functions to deal with arrays and quantities."""
 import numpy as np
+import scipy.fftpack
 import scipy.ndimage
-import scipy.signal
 from astropy.convolution import Gaussian2DKernel
 
+try:
+    import scipy.fft as fft
+except ImportError:
+    # scipy < 1.4
+    import numpy.fft as fft
+
 __all__ = [
     "array_stats_str",
     "shape_2N",
@@ -113,17 +119,109 @@ def symmetric_crop_pad_width(shape, new_shape):
     return ywidth, xwidth
 
 
-def _fftconvolve_wrap(kernel, data):
-    # wrap gaussian filter as a special case, because the gain in
-    # performance is factor ~100
-    if isinstance(kernel, Gaussian2DKernel):
-        width = kernel.model.x_stddev.value
-        norm = kernel.array.sum()
-        return norm * scipy.ndimage.gaussian_filter(data, width)
-    else:
-        return scipy.signal.fftconvolve(
-            data.astype(np.float32), kernel.array, mode="same"
+def _kernel_runs(kernel):
+    """Runs of constant non-zero values along the rows of a kernel array.
+
+    Returns a list of ``(row, start, stop, value)``.
+    """
+    runs = []
+
+    for row, values in enumerate(kernel):
+        edges = np.flatnonzero(np.diff(values)) + 1
+        starts = np.append(0, edges)
+        stops = np.append(edges, len(values))
+
+        for start, stop in zip(starts, stops):
+            if values[start] != 0:
+                runs.append((row, start, stop, values[start]))
+
+    return runs
+
+
+def _row_summed_area_table(data, pad):
+    """Cumulative sum along the rows of the zero padded data.
+
+    The sum of ``data[i, j0:j1]`` is ``table[i + pad[0], j1 + pad[1]] -
+    table[i + pad[0], j0 + pad[1]]``.
+    """
+    padded = np.pad(data, [(pad[0], pad[0]), (pad[1], pad[1])])
+    table = np.zeros((padded.shape[0], padded.shape[1] + 1))
+    np.cumsum(padded, axis=1, out=table[:, 1:])
+    return table
+
+
+def _convolve_runs(table, pad, shape, shape_kernel, runs):
+    """Convolve with a kernel given by its runs, using a row summed area table.
+
+    Every run of the kernel contributes the difference of two shifted views
+    of the table, so the cost is proportional to the number of runs.
+    """
+    ny, nx = shape
+    cy, cx = [(n - 1) // 2 for n in shape_kernel]
+
+    result = np.zeros(shape)
+
+    for row, start, stop, value in runs:
+        y0 = pad[0] + cy - row
+        lo = pad[1] + cx - stop + 1
+        hi = pad[1] + cx - start + 1
+        result += value * (
+            table[y0 : y0 + ny, hi : hi + nx] - table[y0 : y0 + ny, lo : lo + nx]
+        )
+
+    return result
+
+
+def _fftconvolve_shared(data, kernels):
+    """Convolve with several kernels, transforming the data only once."""
+    shape_kernel = np.max([kernel.shape for kernel in kernels], axis=0)
+    shape_fft = [
+        scipy.fftpack.next_fast_len(int(n + m - 1))
+        for n, m in zip(data.shape, shape_kernel)
+    ]
+
+    data_fft = fft.rfftn(data, s=shape_fft)
+
+    results = []
+
+    for kernel in kernels:
+        kernel_fft = fft.rfftn(kernel, s=shape_fft)
+        convolved = fft.irfftn(data_fft * kernel_fft, s=shape_fft)
+        # cut-out corresponding to the "same" mode of `scipy.signal.fftconvolve`
+        slices = tuple(
+            slice((m - 1) // 2, (m - 1) // 2 + n)
+            for n, m in zip(data.shape, kernel.shape)
         )
+        results.append(convolved[slices])
+
+    return results
+
+
+def _gaussian_filter_cascade(data, widths, min_width=2):
+    """Gaussian filtered data for increasing widths.
+
+    A width is reached by filtering the result of the previous width with
+    the difference in quadrature of both widths, if the previous width and
+    the difference are at least ``min_width`` pixels. Otherwise the data is
+    filtered directly, because cascades of narrow, poorly sampled Gaussians
+    deviate from a single Gaussian filter by up to several percent of the
+    peak value.
+    """
+    results, width_previous = [], 0
+    filtered = data
+
+    for width in widths:
+        delta = np.sqrt(width ** 2 - width_previous ** 2)
+
+        if delta >= min_width and width_previous >= min_width:
+            filtered = scipy.ndimage.gaussian_filter(filtered, delta)
+        elif delta > 0:
+            filtered = scipy.ndimage.gaussian_filter(data, width)
+
+        results.append(filtered)
+        width_previous = width
+
+    return results
 
 
 def scale_cube(data, kernels):
@@ -133,6 +231,18 @@ def scale_cube(data, kernels):
     Compute scale space cube by convolving the data with a set of kernels and
     stack the resulting images along the third axis.
 
+    The convolutions are computed as follows:
+
+    * Kernels made of few runs of constant values along the rows, such as
+      tophat and ring kernels, are evaluated with a summed area table of the
+      rows of the data, which is computed once for all kernels.
+    * `~astropy.convolution.Gaussian2DKernel` are applied as a cascade of
+      Gaussian filters, from the smallest to the largest width, where the
+      width steps are at least 2 pixels. The cascade deviates from direct
+      filtering by less than ~1e-3 of the peak value.
+    * The remaining kernels are applied with FFTs, re-using the transform
+      of the data.
+
     Parameters
     ----------
     data : `~numpy.ndarray`
@@ -143,6 +253,48 @@ def scale_cube(data, kernels):
     Returns
     -------
     cube : `~numpy.ndarray`
-        Array of the shape (len(kernels), data.shape)
+        Array of the shape (data.shape, len(kernels))
     """
-    return np.dstack(list([_fftconvolve_wrap(kernel, data) for kernel in kernels]))
+    data = np.asarray(data, dtype=float)
+    cube = np.empty(data.shape + (len(kernels),))
+
+    # a FFT convolution costs about as much as this number of runs
+    max_runs = 2 * np.log2(data.size)
+
+    gaussians, runs, ffts = {}, {}, {}
+
+    for idx, kernel in enumerate(kernels):
+        if isinstance(kernel, Gaussian2DKernel):
+            gaussians[idx] = kernel.model.x_stddev.value
+            continue
+
+        kernel_runs = _kernel_runs(kernel.array)
+
+        if len(kernel_runs) <= max_runs:
+            runs[idx] = kernel_runs
+        else:
+            ffts[idx] = kernel.array
+
+    if gaussians:
+        idxs = sorted(gaussians, key=gaussians.get)
+        filtered = _gaussian_filter_cascade(data, [gaussians[_] for _ in idxs])
+
+        for idx, image in zip(idxs, filtered):
+            cube[..., idx] = kernels[idx].array.sum() * image
+
+    if runs:
+        pad = np.max([kernels[idx].shape for idx in runs], axis=0) // 2
+        table = _row_summed_area_table(data, pad)
+
+        for idx, kernel_runs in runs.items():
+            cube[..., idx] = _convolve_runs(
+                table, pad, data.shape, kernels[idx].shape, kernel_runs
+            )
+
+    if ffts:
+        convolved = _fftconvolve_shared(data, list(ffts.values()))
+
+        for idx, image in zip(ffts, convolved):
+            cube[..., idx] = image
+
+    return cube
@@ -1,14 +1,232 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import collections
+import contextlib
 import logging
+import os
 import sys
+import threading
 from astropy.coordinates import Angle, EarthLocation
 from astropy.io import fits
+from astropy.table import Table
 from astropy.units import Quantity
 from .scripts import make_path
 
 log = logging.getLogger(__name__)
 
-__all__ = ["earth_location_from_dict", "LazyFitsData", "HDULocation"]
+__all__ = [
+    "earth_location_from_dict",
+    "FitsFilePool",
+    "HDUCache",
+    "HDULocation",
+    "LazyFitsData",
+    "FITS_FILE_POOL",
+    "IRF_CACHE",
+]
+
+
+def _file_key(filename):
+    """Key identifying a file and its version on disk."""
+    filename = os.path.abspath(str(filename))
+    return filename, os.stat(filename).st_mtime_ns
+
+
+class _PoolEntry:
+    """Open FITS file in a `FitsFilePool`."""
+
+    def __init__(self, filename):
+        self.hdulist = fits.open(filename, memmap=False)
+        self.lock = threading.RLock()
+        self.users = 0
+        self.evicted = False
+
+
+class FitsFilePool:
+    """Least recently used pool of open FITS files.
+
+    The files are opened with ``memmap=False`` and kept open, so that
+    repeated access to HDUs of the same file, e.g. events and IRFs of one
+    run, only opens the file once. Files are identified by path and
+    modification time, so rewritten files are opened again. The pool is
+    cleared in child processes, because file handles cannot be shared
+    safely after a fork.
+
+    The pool is thread-safe: every file has its own lock, which is held for
+    the whole ``with`` block of `FitsFilePool.open`, so threads reading
+    from the same file wait for each other, while different files are read
+    concurrently. Files evicted from the pool while in use are closed by
+    the last user.
+
+    A process-wide instance is available as ``FITS_FILE_POOL``.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of open files. If zero, files are closed after use.
+    """
+
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+        self._files = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._files)
+
+    @contextlib.contextmanager
+    def open(self, filename):
+        """Open FITS file from the pool.
+
+        To be used as a context manager like `astropy.io.fits.open`. The
+        file is locked for the calling thread until the ``with`` block is
+        left. On exit the file is kept open, but the data read from its
+        HDUs is released, so the pool only holds headers and file handles,
+        and objects created from the data are never shared between users.
+
+        Parameters
+        ----------
+        filename : str or `~pathlib.Path`
+            Filename.
+
+        Returns
+        -------
+        hdulist : `~astropy.io.fits.HDUList`
+            HDU list.
+        """
+        if self.max_size <= 0:
+            with fits.open(str(filename), memmap=False) as hdulist:
+                yield hdulist
+            return
+
+        entry = self._checkout(filename)
+
+        try:
+            with entry.lock:
+                try:
+                    yield entry.hdulist
+                finally:
+                    for hdu in entry.hdulist:
+                        hdu.__dict__.pop("data", None)
+        finally:
+            self._checkin(entry)
+
+    def _checkout(self, filename):
+        key = _file_key(filename)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._files.clear()
+                self._pid = os.getpid()
+
+            if key in self._files:
+                self._files.move_to_end(key)
+                entry = self._files[key]
+            else:
+                entry = _PoolEntry(key[0])
+                self._files[key] = entry
+
+            entry.users += 1
+
+            while len(self._files) > self.max_size:
+                _, entry_old = self._files.popitem(last=False)
+                self._evict(entry_old)
+
+        return entry
+
+    def _checkin(self, entry):
+        with self._lock:
+            entry.users -= 1
+
+            if entry.evicted and entry.users == 0:
+                entry.hdulist.close()
+
+    @staticmethod
+    def _evict(entry):
+        # files still in use are closed by `_checkin`
+        entry.evicted = True
+
+        if entry.users == 0:
+            entry.hdulist.close()
+
+    def clear(self):
+        """Close all files in the pool."""
+        with self._lock:
+            while self._files:
+                _, entry = self._files.popitem()
+                self._evict(entry)
+
+
+class HDUCache:
+    """Least recently used cache of objects decoded from FITS HDUs.
+
+    Objects are identified by file, file modification time and HDU, so
+    IRFs shared by many observations, e.g. from CALDB, are decoded once.
+    The cached objects are shared between all users, so they should not be
+    modified in place.
+
+    A process-wide instance for IRFs is available as ``IRF_CACHE``. It is
+    disabled by default, set ``IRF_CACHE.max_size`` to enable it.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of cached objects. If zero, nothing is cached.
+    """
+
+    def __init__(self, max_size=0):
+        self.max_size = max_size
+        self._objects = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, filename, hdu, loader):
+        """Get cached object or decode and cache it.
+
+        Parameters
+        ----------
+        filename : str or `~pathlib.Path`
+            Filename.
+        hdu : str
+            HDU name.
+        loader : callable
+            Function called without arguments to decode the object.
+
+        Returns
+        -------
+        obj : object
+            Decoded object.
+        """
+        if self.max_size <= 0:
+            return loader()
+
+        key = _file_key(filename) + (hdu,)
+
+        with self._lock:
+            if key in self._objects:
+                self._objects.move_to_end(key)
+                return self._objects[key]
+
+        obj = loader()
+
+        with self._lock:
+            self._objects[key] = obj
+
+            while len(self._objects) > self.max_size:
+                self._objects.popitem(last=False)
+
+        return obj
+
+    def clear(self):
+        """Remove all cached objects."""
+        with self._lock:
+            self._objects.clear()
+
+
+FITS_FILE_POOL = FitsFilePool()
+
+IRF_CACHE = HDUCache()
 
 
 class HDULocation:
@@ -30,6 +248,7 @@ class HDULocation:
         file_name=None,
         hdu_name=None,
         cache=True,
+        memmap=False,
     ):
         self.hdu_class = hdu_class
         self.base_dir = base_dir
@@ -37,6 +256,7 @@ class HDULocation:
         self.file_name = file_name
         self.hdu_name = hdu_name
         self.cache = cache
+        self.memmap = memmap
 
     def info(self, file=None):
         """Print some summary info to stdout."""
@@ -79,22 +299,29 @@ class HDULocation:
         filename = self.path()
         hdu = self.hdu_name
 
+        if hdu_class == "map":
+            from gammapy.maps import Map
+
+            return Map.read(filename, hdu=hdu, memmap=self.memmap)
+
         if hdu_class == "events":
             from gammapy.data import EventList
 
-            return EventList.read(filename, hdu=hdu)
+            with FITS_FILE_POOL.open(filename) as hdulist:
+                return EventList(Table.read(hdulist[hdu]))
         elif hdu_class == "gti":
             from gammapy.data import GTI
 
-            return GTI.read(filename, hdu=hdu)
-        elif hdu_class == "map":
-            from gammapy.maps import Map
-
-            return Map.read(filename, hdu=hdu)
+            with FITS_FILE_POOL.open(filename) as hdulist:
+                return GTI(Table.read(hdulist[hdu]))
         else:
             cls = IRF_REGISTRY.get_cls(hdu_class)
 
-            return cls.read(filename, hdu=hdu)
+            def loader():
+                with FITS_FILE_POOL.open(filename) as hdulist:
+                    return cls.from_hdulist(hdulist, hdu=hdu)
+
+            return IRF_CACHE.get(filename, hdu=hdu, loader=loader)
 
 
 class LazyFitsData(object):
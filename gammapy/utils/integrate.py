@@ -1,8 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+import astropy.units as u
 from .interpolation import LogScale
 
-__all__ = ["trapz_loglog"]
+__all__ = ["trapz_loglog", "integrate_gauss_legendre", "IntegrationPlan"]
 
 
 def trapz_loglog(y, x, axis=-1):
@@ -44,3 +45,109 @@ def trapz_loglog(y, x, axis=-1):
         reference=energy_min,
         amplitude=vals_energy_min,
     )
+
+
+def _gauss_legendre_log_nodes(energy_min, energy_max, order, ndecade):
+    """Gauss-Legendre nodes and weights in log space, along a new last axis."""
+    log_min = np.log(energy_min.value)
+    log_width = np.log(energy_max.to_value(energy_min.unit)) - log_min
+    n_sub = max(int(np.ceil(ndecade * np.max(log_width) / np.log(10))), 1)
+
+    # sub-interval boundaries, shape (..., n_sub + 1)
+    bounds = log_min[..., np.newaxis] + log_width[..., np.newaxis] * np.linspace(
+        0, 1, n_sub + 1
+    )
+    center = 0.5 * (bounds[..., 1:] + bounds[..., :-1])
+    half_width = 0.5 * (bounds[..., 1:] - bounds[..., :-1])
+
+    x, w = np.polynomial.legendre.leggauss(order)
+    nodes = center[..., np.newaxis] + half_width[..., np.newaxis] * x
+    nodes = np.exp(nodes).reshape(log_width.shape + (-1,))
+    weights = (half_width[..., np.newaxis] * w).reshape(nodes.shape)
+
+    nodes = u.Quantity(nodes, energy_min.unit, copy=False)
+    weights = u.Quantity(weights * nodes.value, energy_min.unit, copy=False)
+    return nodes, weights
+
+
+def integrate_gauss_legendre(func, energy_min, energy_max, order=5, ndecade=10):
+    """Integrate a function with Gauss-Legendre quadrature in log space.
+
+    The function is evaluated once, on the nodes of all integration ranges,
+    see `IntegrationPlan` for details.
+
+    Parameters
+    ----------
+    func : callable
+        Function to integrate.
+    energy_min, energy_max : `~astropy.units.Quantity`
+        Lower and upper bound of the integration ranges.
+    order : int
+        Number of Gauss-Legendre nodes per sub-interval.
+    ndecade : int
+        Minimum number of sub-intervals per decade.
+
+    Returns
+    -------
+    integral : `~astropy.units.Quantity`
+        Integral, with the shape of the integration ranges.
+    """
+    energy_min, energy_max = np.broadcast_arrays(energy_min, energy_max, subok=True)
+    nodes, weights = _gauss_legendre_log_nodes(
+        energy_min, energy_max, order=order, ndecade=ndecade
+    )
+    return np.sum(func(nodes) * weights, axis=-1)
+
+
+class IntegrationPlan:
+    r"""Gauss-Legendre integration in log space over the bins of an axis.
+
+    The nodes and weights are computed once for the given bin edges, so
+    that integrating a function over all bins only requires evaluating it
+    on the nodes. With :math:`x = \log E` the integral is computed as
+
+    .. math::
+        \int_{E_{min}}^{E_{max}} f(E) dE = \int_{\log E_{min}}^{\log E_{max}} f(e^x) e^x dx
+
+    where every bin is split into sub-intervals with a width of at most
+    ``1 / ndecade`` decades, each integrated with ``order`` nodes.
+
+    Parameters
+    ----------
+    edges : `~astropy.units.Quantity`
+        Bin edges
+    order : int
+        Number of Gauss-Legendre nodes per sub-interval. Higher values
+        increase the accuracy.
+    ndecade : int
+        Minimum number of sub-intervals per decade.
+    """
+
+    def __init__(self, edges, order=5, ndecade=10):
+        self.edges = edges
+        self.order = order
+        self.ndecade = ndecade
+
+        self.nodes, self.weights = _gauss_legendre_log_nodes(
+            edges[:-1], edges[1:], order=order, ndecade=ndecade
+        )
+
+    def integrate(self, func):
+        """Integrate a function over all bins.
+
+        Parameters
+        ----------
+        func : callable
+            Function to integrate, evaluated on an array of nodes with shape
+            ``(n_bins, n_nodes)``.
+
+        Returns
+        -------
+        integral : `~astropy.units.Quantity`
+            Integral per bin.
+        """
+        return np.sum(func(self.nodes) * self.weights, axis=-1)
+
+    def matches(self, edges):
+        """Whether the plan was computed for the given bin edges."""
+        return self.edges.shape == edges.shape and np.all(self.edges == edges)
@@ -0,0 +1,67 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Utilities to run tasks in a pool of processes."""
+import collections
+import multiprocessing
+
+__all__ = ["imap_ordered"]
+
+# state of the worker processes, set once per worker by `_init_worker`
+_WORKER = {}
+
+
+def _init_worker(func):
+    _WORKER["func"] = func
+
+
+def _run_worker(args):
+    return _WORKER["func"](*args)
+
+
+def imap_ordered(func, args, n_jobs=None):
+    """Call a function for a sequence of arguments and yield the results in order.
+
+    With ``n_jobs > 1`` the calls are distributed to a pool of processes. The
+    function, e.g. a bound method or a `functools.partial` holding large
+    objects, is sent once to every worker and for each call only the
+    arguments are sent. The results are yielded in the order of the
+    arguments, with at most ``2 * n_jobs`` of them in flight at any time, so
+    the memory usage scales with the number of workers and not with the
+    number of calls.
+
+    Parameters
+    ----------
+    func : callable
+        Function, must be picklable for ``n_jobs > 1``.
+    args : iterable of tuple
+        Positional arguments of every call.
+    n_jobs : int
+        Number of processes. By default the function is called in the
+        current process.
+
+    Yields
+    ------
+    result : object
+        Return value of every call.
+    """
+    if not n_jobs or n_jobs == 1:
+        for arg in args:
+            yield func(*arg)
+        return
+
+    pool = multiprocessing.Pool(
+        processes=n_jobs, initializer=_init_worker, initargs=(func,)
+    )
+    pending = collections.deque()
+
+    try:
+        for arg in args:
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().get()
+
+            pending.append(pool.apply_async(_run_worker, (arg,)))
+
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -47,18 +47,25 @@ class InverseCDFSampler:
             Coordinates of the drawn sample.
         """
         choices = self.random_state.uniform(high=1, size=len(self.cdf))
-        shape_cdf = self.cdf.shape
+        n_bins = self.cdf.shape[1]
 
         cdf_all = np.insert(self.cdf, 0, 0, axis=1)
-        edges = np.arange(shape_cdf[1] + 1) - 0.5
 
-        pix_coords = []
+        # linear interpolation of the inverse cdf for all rows at once,
+        # the upper index is the first cdf value larger or equal the choice
+        idx = np.sum(cdf_all < choices[:, np.newaxis], axis=1)
+        idx = np.clip(idx, 1, n_bins)
 
-        for cdf, choice in zip(cdf_all, choices):
-            pix = np.interp(choice, cdf, edges)
-            pix_coords.append(pix)
+        rows = np.arange(len(cdf_all))
+        cdf_lo, cdf_hi = cdf_all[rows, idx - 1], cdf_all[rows, idx]
 
-        return np.array(pix_coords)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.where(
+                cdf_hi > cdf_lo, (choices - cdf_lo) / (cdf_hi - cdf_lo), 0
+            )
+
+        # pixel edges are at -0.5, 0.5, ..., n_bins - 0.5
+        return idx - 1.5 + frac
 
     def sample(self, size):
         """Draw sample from the given PDF.
@@ -62,3 +62,18 @@ def test_axis_sampling():
     x_sampled = np.interp(idx, np.arange(n_sampled), x)
 
     assert_allclose(x_sampled, [0.012266, 0.43081], rtol=1e-4)
+
+
+def test_axis_sampling_interp():
+    pdf = np.random.RandomState(1).uniform(size=(100, 20))
+    pdf[:, :5] = 0
+    pdf[:, 12:14] = 0
+
+    sampler = InverseCDFSampler(pdf, random_state=0, axis=1)
+    idx = sampler.sample_axis()
+
+    choices = np.random.RandomState(0).uniform(high=1, size=100)
+    cdf = np.insert(sampler.cdf, 0, 0, axis=1)
+    edges = np.arange(21) - 0.5
+    expected = [np.interp(c, row, edges) for c, row in zip(choices, cdf)]
+    assert_allclose(idx, expected)
@@ -38,6 +38,7 @@ __all__ = [
     "make_concentric_annulus_sky_regions",
     "compound_region_to_list",
     "list_to_compound_region",
+    "RegionLabelImage",
 ]
 
 
@@ -173,6 +174,115 @@ def list_to_compound_region(regions):
     return region_union
 
 
+class RegionLabelImage:
+    """Label sky positions with the index of the region containing them.
+
+    The regions are rasterised once on the pixel grid of the WCS, using the
+    exact overlap of the pixels with the regions. Positions in pixels which
+    are fully inside or outside of the regions are labelled by a lookup in
+    the label image, the containment is only tested exactly for positions in
+    pixels crossed by a region boundary. Regions which do not support exact
+    masks, e.g. compound regions, are tested exactly in their whole bounding
+    box.
+
+    The result is identical to ``region.contains(skycoord, wcs)`` for every
+    region, but all regions are handled in a single pass over the positions.
+    Where regions overlap the lowest index is used.
+
+    Parameters
+    ----------
+    regions : list of `~regions.SkyRegion`
+        Sky regions.
+    wcs : `~astropy.wcs.WCS`
+        World coordinate system transformation used for the containment.
+    """
+
+    def __init__(self, regions, wcs):
+        self.regions = list(regions)
+        self.wcs = wcs
+
+        masks = [self._rasterize(region.to_pixel(wcs)) for region in self.regions]
+        bboxes = [bbox for _, _, bbox in masks]
+
+        self._ixmin = min(_.ixmin for _ in bboxes)
+        self._iymin = min(_.iymin for _ in bboxes)
+        shape = (
+            max(_.iymax for _ in bboxes) - self._iymin,
+            max(_.ixmax for _ in bboxes) - self._ixmin,
+        )
+
+        self.labels = np.full(shape, -1, dtype=int)
+        self.boundary = np.zeros(shape, dtype=bool)
+
+        for idx, (inside, boundary, bbox) in enumerate(masks):
+            slices = (
+                slice(bbox.iymin - self._iymin, bbox.iymax - self._iymin),
+                slice(bbox.ixmin - self._ixmin, bbox.ixmax - self._ixmin),
+            )
+            labels = self.labels[slices]
+            labels[inside & (labels == -1)] = idx
+            self.boundary[slices] |= boundary
+
+    @staticmethod
+    def _rasterize(region):
+        """Pixels inside and crossed by the boundary of a pixel region."""
+        try:
+            mask = region.to_mask(mode="exact")
+        except (NotImplementedError, ValueError, TypeError):
+            mask = None
+
+        if mask is None or mask.data.dtype.kind != "f":
+            bbox = region.bounding_box
+            shape = (bbox.iymax - bbox.iymin, bbox.ixmax - bbox.ixmin)
+            return np.zeros(shape, dtype=bool), np.ones(shape, dtype=bool), bbox
+
+        inside = mask.data == 1
+        boundary = (mask.data > 0) & ~inside
+        return inside, boundary, mask.bbox
+
+    def label(self, skycoord):
+        """Index of the region containing the positions.
+
+        Parameters
+        ----------
+        skycoord : `~astropy.coordinates.SkyCoord`
+            Sky positions, 1D.
+
+        Returns
+        -------
+        labels : `~numpy.ndarray`
+            Region index, -1 outside of all regions.
+        """
+        x, y = skycoord.to_pixel(self.wcs)
+        x, y = np.atleast_1d(x), np.atleast_1d(y)
+
+        ny, nx = self.labels.shape
+
+        with np.errstate(invalid="ignore"):
+            ix = np.floor(x + 0.5) - self._ixmin
+            iy = np.floor(y + 0.5) - self._iymin
+            valid = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+
+        ix, iy = ix[valid].astype(int), iy[valid].astype(int)
+
+        labels = np.full(x.shape, -1, dtype=int)
+        labels[valid] = self.labels[iy, ix]
+
+        idx = np.flatnonzero(valid)[self.boundary[iy, ix]]
+
+        if idx.size > 0:
+            coords = skycoord[idx]
+            labels_exact = np.full(idx.size, -1, dtype=int)
+
+            # reversed, such that the lowest index is kept for overlaps
+            for label, region in reversed(list(enumerate(self.regions))):
+                labels_exact[region.contains(coords, self.wcs)] = label
+
+            labels[idx] = labels_exact
+
+        return labels
+
+
 class SphericalCircleSkyRegion(CircleSkyRegion):
     """Spherical circle sky region.
 
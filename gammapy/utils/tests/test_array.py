@@ -1,6 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from gammapy.utils.array import array_stats_str, shape_2N
+from numpy.testing import assert_allclose
+import scipy.ndimage
+import scipy.signal
+from astropy.convolution import Gaussian2DKernel, Ring2DKernel, Tophat2DKernel
+from gammapy.utils.array import array_stats_str, scale_cube, shape_2N
 
 
 def test_array_stats_str():
@@ -15,3 +19,42 @@ def test_shape_2N():
     shape = (34, 89, 120, 444)
     expected_shape = (40, 96, 128, 448)
     assert expected_shape == shape_2N(shape=shape, N=3)
+
+
+def test_scale_cube():
+    random_state = np.random.RandomState(0)
+    data = random_state.poisson(3, (40, 51)).astype(float)
+
+    kernels = [
+        Ring2DKernel(3, 2),
+        Tophat2DKernel(2),
+        Tophat2DKernel(2.5, mode="oversample"),
+        Ring2DKernel(4.2, 1.3, x_size=19, y_size=17),
+        Tophat2DKernel(12),
+    ]
+
+    cube = scale_cube(data, kernels)
+    assert cube.shape == (40, 51, 5)
+
+    for idx, kernel in enumerate(kernels):
+        expected = scipy.signal.fftconvolve(data, kernel.array, mode="same")
+        assert_allclose(cube[..., idx], expected, atol=1e-10)
+
+
+def test_scale_cube_gaussian():
+    data = np.zeros((81, 81))
+    data[40, 40] = 1
+
+    widths = [2, 1, np.sqrt(2), 0.5, 4, np.sqrt(8), 6]
+    kernels = [Gaussian2DKernel(_) for _ in widths]
+    cube = scale_cube(data, kernels)
+
+    for idx, (kernel, width) in enumerate(zip(kernels, widths)):
+        expected = kernel.array.sum() * scipy.ndimage.gaussian_filter(data, width)
+
+        # widths up to 2 pixels are filtered directly, larger ones are
+        # reached by a cascade of steps of at least 2 pixels
+        if width <= 2:
+            assert_allclose(cube[..., idx], expected, rtol=1e-12, atol=0)
+        else:
+            assert_allclose(cube[..., idx], expected, atol=1e-3 * expected.max())
@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from astropy.io import fits
 from astropy.table import Column, Table
+from gammapy.utils.fits import FitsFilePool, HDUCache
 
 
 # Need to move to conftest or can import?
@@ -42,3 +43,69 @@ def test_table_fits_io_astropy(table):
     assert table2["b"].unit == "m"
     # Note: description doesn't come back in older versions of Astropy
     # that we still support, so we're not asserting on that here for now.
+
+
+def test_fits_file_pool(tmp_path, table):
+    filename = tmp_path / "table.fits"
+    fits.HDUList([fits.PrimaryHDU(), fits.BinTableHDU(table, name="T")]).writeto(
+        filename
+    )
+
+    pool = FitsFilePool(max_size=1)
+
+    with pool.open(filename) as hdulist:
+        table2 = Table.read(hdulist["T"])
+        hdulist_first = hdulist
+
+    assert len(pool) == 1
+    assert "data" not in hdulist_first["T"].__dict__
+
+    # data is re-read, in place changes are not shared
+    table2["a"][0] = 42
+    with pool.open(filename) as hdulist:
+        assert hdulist is hdulist_first
+        assert Table.read(hdulist["T"])["a"][0] == 1
+
+    filename_other = tmp_path / "other.fits"
+    fits.HDUList([fits.PrimaryHDU()]).writeto(filename_other)
+
+    with pool.open(filename_other):
+        pass
+
+    assert len(pool) == 1
+
+    # files evicted while in use are closed by the last user
+    with pool.open(filename) as hdulist:
+        with pool.open(filename_other):
+            assert len(pool) == 1
+
+        assert Table.read(hdulist["T"])["a"][0] == 1
+
+    assert hdulist._file.closed
+
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_hdu_cache(tmp_path):
+    filename = tmp_path / "test.fits"
+    fits.HDUList([fits.PrimaryHDU()]).writeto(filename)
+
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    cache = HDUCache()
+    assert cache.get(filename, "PRIMARY", loader) is not cache.get(
+        filename, "PRIMARY", loader
+    )
+
+    cache.max_size = 1
+    obj = cache.get(filename, "PRIMARY", loader)
+    assert cache.get(filename, "PRIMARY", loader) is obj
+    assert len(calls) == 3
+
+    cache.get(filename, "OTHER", loader)
+    assert len(cache) == 1
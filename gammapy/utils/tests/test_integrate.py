@@ -1,7 +1,16 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
 from astropy.units import Quantity
-from gammapy.modeling.models import PowerLawSpectralModel
-from gammapy.utils.integrate import trapz_loglog
+from gammapy.modeling.models import (
+    ExpCutoffPowerLawSpectralModel,
+    LogParabolaSpectralModel,
+    PowerLawSpectralModel,
+)
+from gammapy.utils.integrate import (
+    IntegrationPlan,
+    integrate_gauss_legendre,
+    trapz_loglog,
+)
 from gammapy.utils.testing import assert_quantity_allclose
 
 
@@ -13,3 +22,38 @@ def test_trapz_loglog():
 
     val = trapz_loglog(pwl(energy), energy)
     assert_quantity_allclose(val, ref)
+
+
+def test_integration_plan():
+    energy = Quantity(np.geomspace(0.1, 100, 7), "TeV")
+    plan = IntegrationPlan(energy, order=5)
+
+    assert plan.nodes.shape == (6, 25)
+    assert plan.matches(energy)
+    assert not plan.matches(energy[1:])
+
+    pwl = PowerLawSpectralModel(index=2.3)
+    ref = pwl.integral(energy[:-1], energy[1:])
+    assert_quantity_allclose(plan.integrate(pwl), ref, rtol=1e-10)
+
+    ecpl = ExpCutoffPowerLawSpectralModel(lambda_="0.1 TeV-1")
+    log_parabola = LogParabolaSpectralModel(beta=0.5)
+
+    for model in [ecpl, log_parabola]:
+        ref = model.integral(energy[:-1], energy[1:], ndecade=1e4)
+        assert_quantity_allclose(plan.integrate(model), ref, rtol=1e-6)
+
+
+def test_integrate_gauss_legendre():
+    energy_min = Quantity([[0.1], [1]], "TeV")
+    energy_max = Quantity([1, 20, 1e3], "TeV")
+
+    pwl = PowerLawSpectralModel(index=2.3)
+    val = integrate_gauss_legendre(pwl, energy_min, energy_max)
+
+    assert val.shape == (2, 3)
+    assert_quantity_allclose(val, pwl.integral(energy_min, energy_max), rtol=1e-10)
+
+    val = integrate_gauss_legendre(pwl, Quantity("1 TeV"), Quantity("1e4 GeV"))
+    assert val.isscalar
+    assert_quantity_allclose(val, pwl.integral(Quantity("1 TeV"), Quantity("10 TeV")))
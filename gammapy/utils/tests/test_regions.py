@@ -8,12 +8,14 @@ That package is still work in progress and not fully developed and
 stable, so need to establish a bit what works and what doesn't.
 """
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 import regions
 from astropy.coordinates import SkyCoord
 from gammapy.maps import WcsGeom
 from gammapy.utils.regions import (
+    RegionLabelImage,
     SphericalCircleSkyRegion,
     make_pixel_region,
     make_region,
@@ -72,3 +74,36 @@ class TestSphericalCircleSkyRegion:
         coord = SkyCoord([20.1, 22] * u.deg, 20 * u.deg)
         mask = self.region.contains(coord)
         assert_equal(mask, [True, False])
+
+
+def test_region_label_image():
+    geom = WcsGeom.create(skydir=(83.63, 22.01), binsz=0.01, width=3)
+    center = SkyCoord(83.63, 22.01, unit="deg")
+
+    on_regions = [
+        regions.CircleSkyRegion(center, 0.2 * u.deg),
+        regions.EllipseSkyRegion(
+            SkyCoord(84.4, 22.01, unit="deg"), 0.3 * u.deg, 0.1 * u.deg, 30 * u.deg
+        ),
+        regions.RectangleSkyRegion(
+            SkyCoord(83.2, 21.5, unit="deg"), 0.4 * u.deg, 0.2 * u.deg, 45 * u.deg
+        ),
+        regions.CircleAnnulusSkyRegion(center, 0.3 * u.deg, 0.5 * u.deg),
+        # overlaps with the first region
+        regions.CircleSkyRegion(SkyCoord(83.8, 22.01, unit="deg"), 0.1 * u.deg),
+    ]
+
+    random_state = np.random.RandomState(0)
+    lon = 83.63 + random_state.uniform(-1.2, 1.2, 20000)
+    lat = 22.01 + random_state.uniform(-1.2, 1.2, 20000)
+    skycoord = SkyCoord(lon, lat, unit="deg")
+
+    labeler = RegionLabelImage(on_regions, geom.wcs)
+    labels = labeler.label(skycoord)
+
+    expected = np.full(skycoord.shape, -1)
+    for idx, region in reversed(list(enumerate(on_regions))):
+        expected[region.contains(skycoord, geom.wcs)] = idx
+
+    assert_equal(labels, expected)
+    assert np.all(np.isin(np.arange(5), labels))